@@ -0,0 +1,271 @@
+"""Thread-safe and asyncio-native bounded containers.
+
+Python has no usable compare-and-swap, so the thread-safe variants are not
+lock-free: every operation takes one lock for a few list assignments, and
+the batched variants move many items per lock acquisition to amortize it.
+"""
+import asyncio
+import threading
+import time
+from collections import deque
+
+from algorithms.exceptions import Empty, Full
+from algorithms.stack import ArrayStack
+
+
+class _BoundedRing:
+    """Fixed capacity circular buffer; callers do the synchronization"""
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("Capacity must be positive")
+        self._data = [None] * capacity
+        self._front = 0  # index of first element within self._data
+        self._size = 0
+
+    def __len__(self):
+        """Return the number of elements in the queue."""
+        return self._size
+
+    def is_empty(self):
+        return self._size == 0
+
+    def is_full(self):
+        return self._size == len(self._data)
+
+    def _push(self, item):
+        self._data[(self._front + self._size) % len(self._data)] = item
+        self._size += 1
+
+    def _push_many(self, items, start):
+        """Push items[start:] while there is room; return the next start"""
+        count = min(len(items) - start, len(self._data) - self._size)
+        for k in range(start, start + count):
+            self._push(items[k])
+        return start + count
+
+    def _pop(self):
+        item = self._data[self._front]
+        self._data[self._front] = None  # reclaim unused space
+        self._front = (self._front + 1) % len(self._data)
+        self._size -= 1
+        return item
+
+    def _pop_many(self, max_items):
+        return [self._pop() for _ in range(min(max_items, self._size))]
+
+
+class BlockingQueue(_BoundedRing):
+    """Bounded multi-producer multi-consumer FIFO queue for threads."""
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item, timeout=None):
+        """Add item, waiting for room up to timeout seconds (forever if None).
+
+        Raise Full exception if the queue stays full."""
+        with self._not_full:
+            if not self._not_full.wait_for(lambda: not self.is_full(), timeout):
+                raise Full("Queue is full")
+            self._push(item)
+            self._not_empty.notify()
+
+    def get(self, timeout=None):
+        """Remove and return the first item, waiting up to timeout seconds.
+
+        Raise Empty exception if the queue stays empty."""
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self.is_empty(), timeout):
+                raise Empty("Queue is empty")
+            item = self._pop()
+            self._not_full.notify()
+            return item
+
+    def try_put(self, item):
+        """Add item if there is room right now; return True if it was added"""
+        with self._lock:
+            if self.is_full():
+                return False
+            self._push(item)
+            self._not_empty.notify()
+            return True
+
+    def try_get(self, default=None):
+        """Remove and return the first item, or default if the queue is empty"""
+        with self._lock:
+            if self.is_empty():
+                return default
+            item = self._pop()
+            self._not_full.notify()
+            return item
+
+    def put_many(self, items, timeout=None):
+        """Add all the items in order, as many per lock acquisition as fit.
+
+        Raise Full exception if not all of them fit within timeout seconds;
+        the items added before that stay in the queue."""
+        items = list(items)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        start = 0
+        with self._not_full:
+            while start < len(items):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if not self._not_full.wait_for(lambda: not self.is_full(), remaining):
+                    raise Full("Queue is full")
+                old_start, start = start, self._push_many(items, start)
+                self._not_empty.notify(start - old_start)
+
+    def get_many(self, max_items, timeout=None):
+        """Remove and return up to max_items items at once.
+
+        Waits up to timeout seconds for the first one and raises Empty
+        exception if none arrives."""
+        with self._not_empty:
+            if not self._not_empty.wait_for(lambda: not self.is_empty(), timeout):
+                raise Empty("Queue is empty")
+            items = self._pop_many(max_items)
+            self._not_full.notify(len(items))
+            return items
+
+
+class AsyncBlockingQueue(_BoundedRing):
+    """Bounded FIFO queue for asyncio tasks with the BlockingQueue API.
+
+    All the tasks run on one event loop thread, so no lock is needed:
+    waiting tasks park on futures that the opposite operation resolves."""
+    def __init__(self, capacity):
+        super().__init__(capacity)
+        self._getters = deque()  # futures of tasks waiting for an item
+        self._putters = deque()  # futures of tasks waiting for room
+
+    @staticmethod
+    def _wake_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, blocked, deadline):
+        """Wait while blocked(); return False if the deadline passes first"""
+        loop = asyncio.get_running_loop()
+        while blocked():
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                return False
+            except asyncio.CancelledError:
+                # pass a wake-up we may have consumed on to the next waiter
+                if waiter.done() and not waiter.cancelled():
+                    self._wake_next(waiters)
+                raise
+        return True
+
+    @staticmethod
+    def _deadline(timeout):
+        return None if timeout is None else asyncio.get_running_loop().time() + timeout
+
+    async def put(self, item, timeout=None):
+        """Add item, waiting for room up to timeout seconds (forever if None).
+
+        Raise Full exception if the queue stays full."""
+        if not await self._wait(self._putters, self.is_full, self._deadline(timeout)):
+            raise Full("Queue is full")
+        self._push(item)
+        self._wake_next(self._getters)
+
+    async def get(self, timeout=None):
+        """Remove and return the first item, waiting up to timeout seconds.
+
+        Raise Empty exception if the queue stays empty."""
+        if not await self._wait(self._getters, self.is_empty, self._deadline(timeout)):
+            raise Empty("Queue is empty")
+        item = self._pop()
+        self._wake_next(self._putters)
+        return item
+
+    def try_put(self, item):
+        """Add item if there is room right now; return True if it was added"""
+        if self.is_full():
+            return False
+        self._push(item)
+        self._wake_next(self._getters)
+        return True
+
+    def try_get(self, default=None):
+        """Remove and return the first item, or default if the queue is empty"""
+        if self.is_empty():
+            return default
+        item = self._pop()
+        self._wake_next(self._putters)
+        return item
+
+    async def put_many(self, items, timeout=None):
+        """Add all the items in order, as many at once as fit.
+
+        Raise Full exception if not all of them fit within timeout seconds;
+        the items added before that stay in the queue."""
+        items = list(items)
+        deadline = self._deadline(timeout)
+        start = 0
+        while start < len(items):
+            if not await self._wait(self._putters, self.is_full, deadline):
+                raise Full("Queue is full")
+            old_start, start = start, self._push_many(items, start)
+            for _ in range(start - old_start):
+                self._wake_next(self._getters)
+
+    async def get_many(self, max_items, timeout=None):
+        """Remove and return up to max_items items at once.
+
+        Waits up to timeout seconds for the first one and raises Empty
+        exception if none arrives."""
+        if not await self._wait(self._getters, self.is_empty, self._deadline(timeout)):
+            raise Empty("Queue is empty")
+        items = self._pop_many(max_items)
+        for _ in range(len(items)):
+            self._wake_next(self._putters)
+        return items
+
+
+class ConcurrentStack(ArrayStack):
+    """ArrayStack safe to share between threads."""
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def push(self, item):
+        with self._lock:
+            self._data.append(item)
+
+    def pop(self):
+        with self._lock:
+            return super().pop()
+
+    def top(self):
+        with self._lock:
+            return super().top()
+
+    def try_pop(self, default=None):
+        """Remove and return the top item, or default if the stack is empty"""
+        with self._lock:
+            return self._data.pop() if self._data else default
+
+    def push_many(self, items):
+        with self._lock:
+            self._data.extend(items)
+
+    def pop_many(self, max_items):
+        """Remove and return up to max_items items, topmost first"""
+        with self._lock:
+            start = len(self._data) - min(max_items, len(self._data))
+            items = self._data[start:][::-1]
+            del self._data[start:]
+            return items
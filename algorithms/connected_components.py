@@ -0,0 +1,112 @@
+"""Connected components of huge edge lists on several processes.
+
+The edges are cut into shards. Every worker process keeps one
+ArrayWeightedQuickUnionUF over all the nodes, unions the edges of a shard
+in it and sends back only the (node, root) links it found, after which it
+resets the touched nodes for the next shard. The main process unions those
+links into the global union-find, whose flattened id array is the result.
+
+Edges come either from an iterable of (p, q) pairs or from a binary edge
+file of native int32 pairs (see write_edge_file), which workers memory-map
+and read their shards from directly.
+"""
+import mmap
+import os
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+
+from algorithms.union_find import ArrayWeightedQuickUnionUF
+
+DEFAULT_SHARD_EDGES = 1_000_000
+EDGE_SIZE = 2 * array('i').itemsize  # bytes per edge in an edge file
+
+_worker_uf = None  # union-find of the current worker process
+
+
+def write_edge_file(path, edges):
+    """Write (p, q) pairs to path as native int32 pairs; return edge count"""
+    edges = iter(edges)
+    count = 0
+    with open(path, "wb") as edge_file:
+        while True:
+            shard = array('i', chain.from_iterable(islice(edges, DEFAULT_SHARD_EDGES)))
+            if not shard:
+                return count
+            shard.tofile(edge_file)
+            count += len(shard) // 2
+
+
+def connected_components(edges, n: int, workers=None, shard_edges=DEFAULT_SHARD_EDGES):
+    """Return array('i') labelling every node 0..n-1 with its component root.
+
+    edges is an iterable of (p, q) pairs or the path of an edge file."""
+    workers = workers or os.cpu_count() or 1
+    if isinstance(edges, (str, os.PathLike)):
+        edge_count = os.path.getsize(edges) // EDGE_SIZE
+        jobs = ((_file_shard_links, os.fspath(edges), start, min(start + shard_edges, edge_count))
+                for start in range(0, edge_count, shard_edges))
+    else:
+        jobs = ((_shard_links, shard) for shard in _shards(iter(edges), shard_edges))
+    uf = ArrayWeightedQuickUnionUF(n)
+    for links in _run(jobs, n, workers):
+        pairs = iter(links)
+        uf.union_many(zip(pairs, pairs))
+    uf.find_all()
+    return uf.id
+
+
+def _shards(edges, shard_edges):
+    while True:
+        shard = array('i', chain.from_iterable(islice(edges, shard_edges)))
+        if not shard:
+            return
+        yield shard
+
+
+def _run(jobs, n, workers):
+    """Yield results of the jobs, keeping at most 2 * workers in flight"""
+    if workers == 1:
+        _init_worker(n)
+        for func, *args in jobs:
+            yield func(*args)
+        return
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(n,)) as executor:
+        pending = deque()
+        for func, *args in jobs:
+            pending.append(executor.submit(func, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _init_worker(n):
+    global _worker_uf
+    _worker_uf = ArrayWeightedQuickUnionUF(n)
+
+
+def _shard_links(shard):
+    """Union the flat (p, q, p, q...) shard; return flat (node, root) links"""
+    uf = _worker_uf
+    pairs = iter(shard)
+    uf.union_many(zip(pairs, pairs))
+    touched = set(shard)
+    links = array('i')
+    for node in touched:
+        root = uf.root(node)
+        if root != node:
+            links.append(node)
+            links.append(root)
+    # all the unions were between touched nodes, relinking them is enough
+    uf.reset(touched)
+    return links
+
+
+def _file_shard_links(path, start, stop):
+    with open(path, "rb") as edge_file:
+        with mmap.mmap(edge_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            shard = array('i')
+            shard.frombytes(mapped[start * EDGE_SIZE:stop * EDGE_SIZE])
+    return _shard_links(shard)
@@ -1,58 +1,90 @@
 from typing import Optional
 
-from my_collections.linked_list import LinkedListIterator, Node, T, DLLNode
+from algorithms.exceptions import Empty
+from algorithms.linked_list import (
+    DLLNode, LinkedListIterator, NIL, NodePool, NodePoolIterator, T
+)
 
 
 class Deque:
+    """Double-ended queue on top of a growable circular Python list.
+
+    All the add/remove operations are amortized O(1); the underlying list
+    doubles when full and halves when it is less than a quarter full."""
+    DEFAULT_CAPACITY = 8
+
     def __init__(self):
-        self.first: Optional[Node[T]] = None
-        self.last: Optional[Node[T]] = None
+        self._data = [None] * Deque.DEFAULT_CAPACITY
+        self._front = 0  # index of first element within self._data
         self.size: int = 0
 
+    def __len__(self):
+        return self.size
+
     def is_empty(self):
         return self.size == 0
 
     def add_first(self, item):
         """add item to the beginning of the list"""
-        old_first = self.first
-        self.first = Node(item, old_first)
-        if self.is_empty():
-            self.last = self.first
+        if self.size == len(self._data):
+            self._resize(2 * len(self._data))
+        self._front = (self._front - 1) % len(self._data)
+        self._data[self._front] = item
         self.size += 1
 
     def add_last(self, item):
         """add item to the end of the list"""
-        old_last = self.last
-        self.last = Node(item, None)
-        if self.is_empty():
-            self.first = self.last
-        else:
-            old_last.next = self.last
+        if self.size == len(self._data):
+            self._resize(2 * len(self._data))
+        self._data[(self._front + self.size) % len(self._data)] = item
         self.size += 1
 
     def remove_first(self):
         """remove element from the beginning of the list"""
-        first_item = self.first.item
-        self.first = self.first.next
-        self.size -= 1
         if self.is_empty():
-            self.last = None
+            raise Empty("Deque is empty")
+        first_item = self._data[self._front]
+        self._data[self._front] = None  # reclaim unused space
+        self._front = (self._front + 1) % len(self._data)
+        self.size -= 1
+        self._shrink()
         return first_item
 
     def remove_last(self):
-        cur_node = self.first
-        while cur_node.next.next:
-            cur_node = cur_node.next
-        last_item = cur_node.next.item
-        cur_node.next = None
-        self.last = cur_node
-        self.size -= 1
+        """remove element from the end of the list"""
         if self.is_empty():
-            self.first = None
+            raise Empty("Deque is empty")
+        last_place = (self._front + self.size - 1) % len(self._data)
+        last_item = self._data[last_place]
+        self._data[last_place] = None  # reclaim unused space
+        self.size -= 1
+        self._shrink()
         return last_item
 
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("Deque index out of range")
+        return self._data[(self._front + index) % len(self._data)]
+
     def __iter__(self):
-        return LinkedListIterator(self.first)
+        data, capacity = self._data, len(self._data)
+        for k in range(self._front, self._front + self.size):
+            yield data[k % capacity]
+
+    def _shrink(self):
+        capacity = len(self._data)
+        if capacity > Deque.DEFAULT_CAPACITY and self.size < capacity // 4:
+            self._resize(capacity // 2)
+
+    def _resize(self, new_capacity):
+        """Move the elements to the beginning of a list of new_capacity"""
+        old = self._data
+        tail = min(self.size, len(old) - self._front)
+        self._data = old[self._front:self._front + tail] + old[:self.size - tail]
+        self._data.extend([None] * (new_capacity - self.size))
+        self._front = 0
 
 
 class DLLDeque:
@@ -85,20 +117,80 @@ class DLLDeque:
     def remove_first(self) -> T:
         first_item = self.first.item
         self.first = self.first.next
-        self.first.previous = None
         self.size -= 1
         if self.is_empty():
             self.last = None
+        else:
+            self.first.previous = None
         return first_item
 
     def remove_last(self) -> T:
         last_item = self.last.item
         self.last = self.last.previous
-        self.last.next = None
         self.size -= 1
         if self.is_empty():
             self.first = None
+        else:
+            self.last.next = None
         return last_item
 
     def __iter__(self):
         return LinkedListIterator(self.first)
+
+
+class PooledDeque:
+    """Doubly linked deque keeping its nodes in a NodePool instead of
+    allocating a DLLNode object per item."""
+    def __init__(self):
+        self._nodes: NodePool[T] = NodePool(doubly_linked=True)
+        self.first: int = NIL
+        self.last: int = NIL
+        self.size: int = 0
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def add_first(self, item: T) -> None:
+        old_first = self.first
+        self.first = self._nodes.alloc(item, old_first, NIL)
+        if self.is_empty():
+            self.last = self.first
+        else:
+            self._nodes.previous[old_first] = self.first
+        self.size += 1
+
+    def add_last(self, item: T) -> None:
+        old_last = self.last
+        self.last = self._nodes.alloc(item, NIL, old_last)
+        if self.is_empty():
+            self.first = self.last
+        else:
+            self._nodes.next[old_last] = self.last
+        self.size += 1
+
+    def remove_first(self) -> T:
+        if self.is_empty():
+            raise Empty("Deque is empty")
+        old_first = self.first
+        self.first = self._nodes.next[old_first]
+        self.size -= 1
+        if self.is_empty():
+            self.last = NIL
+        else:
+            self._nodes.previous[self.first] = NIL
+        return self._nodes.release(old_first)
+
+    def remove_last(self) -> T:
+        if self.is_empty():
+            raise Empty("Deque is empty")
+        old_last = self.last
+        self.last = self._nodes.previous[old_last]
+        self.size -= 1
+        if self.is_empty():
+            self.first = NIL
+        else:
+            self._nodes.next[self.last] = NIL
+        return self._nodes.release(old_last)
+
+    def __iter__(self) -> NodePoolIterator:
+        return NodePoolIterator(self._nodes, self.first)
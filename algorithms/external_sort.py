@@ -0,0 +1,109 @@
+"""External (out-of-core) merge sort.
+
+Records are read in chunks that fit the memory budget, every chunk is sorted
+with natural_mergesort and spilled to a temporary run file as length-prefixed
+pickles, then the runs are k-way merged through MinPQ.
+"""
+import os
+import pickle
+import struct
+import sys
+import tempfile
+from operator import itemgetter
+
+from algorithms.priority_queue import MinPQ
+from algorithms.sorting import natural_mergesort
+
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024  # bytes of records held in memory
+DEFAULT_FAN_IN = 64  # runs merged at once
+
+_LENGTH = struct.Struct("<I")
+
+
+def external_sort(records, key=None, memory_limit=DEFAULT_MEMORY_LIMIT,
+                  fan_in=DEFAULT_FAN_IN, tmp_dir=None, reverse=False):
+    """Yield records in sorted order using temporary files for the runs.
+
+    memory_limit roughly bounds the size of a chunk sorted in memory (as
+    measured by sys.getsizeof), fan_in is the number of runs merged in one
+    pass. The sort is stable, also with reverse=True. Temporary files are
+    removed when the generator is exhausted or closed."""
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+    with tempfile.TemporaryDirectory(dir=tmp_dir, prefix="external_sort_") as run_dir:
+        runs = [_write_run(run_dir, chunk)
+                for chunk in _sorted_chunks(records, key, memory_limit, reverse)]
+        while len(runs) > fan_in:
+            runs = [_write_run(run_dir, _merge_runs(runs[i:i + fan_in], key, reverse))
+                    for i in range(0, len(runs), fan_in)]
+        yield from _merge_runs(runs, key, reverse)
+
+
+def _sorted_chunks(records, key, memory_limit, reverse):
+    chunk, chunk_size = [], 0
+    for record in records:
+        chunk.append(record)
+        chunk_size += sys.getsizeof(record)
+        if chunk_size >= memory_limit:
+            yield _sort_chunk(chunk, key, reverse)
+            chunk, chunk_size = [], 0
+    if chunk:
+        yield _sort_chunk(chunk, key, reverse)
+
+
+def _sort_chunk(chunk, key, reverse):
+    # sorting the reversed chunk and reversing it back keeps equal
+    # records in input order
+    if reverse:
+        chunk.reverse()
+    natural_mergesort(chunk, key=key)
+    if reverse:
+        chunk.reverse()
+    return chunk
+
+
+def _write_run(run_dir, records):
+    """Write records to a new run file and return its path"""
+    fd, path = tempfile.mkstemp(dir=run_dir, suffix=".run")
+    with os.fdopen(fd, "wb", buffering=1024 * 1024) as run_file:
+        write, pack = run_file.write, _LENGTH.pack
+        for record in records:
+            data = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+            write(pack(len(data)))
+            write(data)
+    return path
+
+
+def _read_run(path):
+    """Yield the records of a run file and remove the file at the end"""
+    with open(path, "rb", buffering=1024 * 1024) as run_file:
+        read, unpack, size = run_file.read, _LENGTH.unpack, _LENGTH.size
+        header = read(size)
+        while header:
+            yield pickle.loads(read(unpack(header)[0]))
+            header = read(size)
+    os.remove(path)
+
+
+def _merge_runs(paths, key, reverse=False):
+    """Yield the records of the sorted run files in sorted order.
+
+    Queue entries are (priority, run order, record, run reader); ties
+    on priority are broken by the run order, which keeps the merge stable.
+    The order is the negated run number with reverse, so that earlier runs
+    still come first."""
+    readers = [_read_run(path) for path in paths]
+    entries = []
+    for run_id, reader in enumerate(readers):
+        run_order = -run_id if reverse else run_id
+        for record in reader:
+            entries.append((record if key is None else key(record), run_order, record, reader))
+            break
+    runs_pq = MinPQ(entries, key=itemgetter(0, 1), reverse=reverse)
+    while not runs_pq.is_empty():
+        _, run_order, record, reader = runs_pq.del_min()
+        yield record
+        for next_record in reader:
+            runs_pq.insert((next_record if key is None else key(next_record),
+                            run_order, next_record, reader))
+            break
@@ -0,0 +1,300 @@
+"""Opt-in operation counting for the sorts, heaps and union-finds.
+
+Nothing here is active by default. Inside ``with instrument() as counters``
+the module level swap helpers of sorting and quicksort, the partitioning
+and heap sifting of quicksort, the swim/sink methods of the priority
+queues and the root and batch union methods of the union-finds are
+replaced by counting wrappers, and the originals are put back on exit, so
+code outside the block runs exactly as before:
+
+    with instrument() as counters:
+        quicksort(wrap(values))          # wrap() to count comparisons too
+        uf = WeightedQuickUnionUF(n)
+        ...
+    print(counters.to_json())
+    counters.dump_stats("run.prof")      # python -m pstats run.prof
+
+Counters keep totals (comparisons, swaps, array reads and writes,
+union-find path hops) and per call statistics: calls, total and max of
+the tree depth seen by every root() call and of the number of levels
+every swim()/sink() moves its item, plus the time spent.
+
+Comparisons go through a Comparator. Items compare through it once they
+are wrapped with wrap(), and MinPQ orders its priorities with it while
+instrumented, so a Comparator subclass can also change the ordering.
+"""
+from contextlib import contextmanager
+from dataclasses import dataclass
+import json
+import marshal
+import time
+import weakref
+
+from algorithms import priority_queue, quicksort, sorting, union_find
+
+_active = None  # Counters of the running instrument() block
+
+
+@dataclass
+class CallStats:
+    """Statistics of one instrumented function"""
+    calls: int = 0
+    total: int = 0  # sum of the measure (tree depth, sift length) over the calls
+    max: int = 0
+    seconds: float = 0.0
+
+    def add(self, measure, seconds):
+        self.calls += 1
+        self.total += measure
+        if measure > self.max:
+            self.max = measure
+        self.seconds += seconds
+
+
+class Counters:
+    """Operation totals and per function CallStats of an instrument() block"""
+    def __init__(self):
+        self.comparisons = 0
+        self.swaps = 0  # exchanges; a heap sift counts one per level moved
+        self.array_reads = 0
+        self.array_writes = 0
+        self.path_hops = 0
+        self.calls = {}  # name -> CallStats
+        self._code = {}  # name -> code object, for the pstats export
+
+    def record(self, name, function, measure, seconds):
+        if name not in self.calls:
+            self.calls[name] = CallStats()
+            self._code[name] = function.__code__
+        self.calls[name].add(measure, seconds)
+
+    def as_dict(self):
+        return {
+            "comparisons": self.comparisons,
+            "swaps": self.swaps,
+            "array_reads": self.array_reads,
+            "array_writes": self.array_writes,
+            "path_hops": self.path_hops,
+            "calls": {name: stats.__dict__ for name, stats in self.calls.items()},
+        }
+
+    def to_json(self, **kwargs):
+        return json.dumps(self.as_dict(), **kwargs)
+
+    def dump_json(self, path):
+        with open(path, "w") as json_file:
+            json.dump(self.as_dict(), json_file, indent=1)
+
+    def pstats_dict(self):
+        """Return the calls in the format of cProfile.Profile.stats"""
+        stats = {}
+        for name, call_stats in self.calls.items():
+            code = self._code[name]
+            stats[(code.co_filename, code.co_firstlineno, name)] = (
+                call_stats.calls, call_stats.calls, call_stats.seconds, call_stats.seconds, {})
+        return stats
+
+    def dump_stats(self, path):
+        """Write the calls like cProfile.Profile.dump_stats, for pstats.Stats"""
+        with open(path, "wb") as stats_file:
+            marshal.dump(self.pstats_dict(), stats_file)
+
+
+class Comparator:
+    """Natural ordering that counts the comparisons it makes"""
+    def __init__(self, counters=None):
+        self.counters = counters
+
+    def less(self, a, b):
+        counters = self.counters or _active
+        if counters is not None:
+            counters.comparisons += 1
+        return a < b
+
+
+class Compared:
+    """Item whose comparisons go through a Comparator"""
+    __slots__ = ("value", "comparator")
+
+    def __init__(self, value, comparator):
+        self.value = value
+        self.comparator = comparator
+
+    def __lt__(self, other):
+        return self.comparator.less(self.value, other.value)
+
+    def __gt__(self, other):
+        return self.comparator.less(other.value, self.value)
+
+    def __le__(self, other):
+        return not self.comparator.less(other.value, self.value)
+
+    def __ge__(self, other):
+        return not self.comparator.less(self.value, other.value)
+
+    def __repr__(self):
+        return f"Compared({self.value!r})"
+
+
+class TracedList(list):
+    """List counting item reads and writes, per list and in the active
+    Counters. A slice access counts as one, methods are not traced."""
+    __slots__ = ("reads", "writes")
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.reads = self.writes = 0
+
+    def __getitem__(self, index):
+        self.reads += 1
+        if _active is not None:
+            _active.array_reads += 1
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        self.writes += 1
+        if _active is not None:
+            _active.array_writes += 1
+        super().__setitem__(index, value)
+
+
+def wrap(values, comparator=None):
+    """Return values as a TracedList of Compared items"""
+    comparator = comparator or Comparator()
+    return TracedList(Compared(value, comparator) for value in values)
+
+
+def unwrap(values):
+    return [item.value for item in values]
+
+
+# -- wrappers installed by instrument() -------------------------------------
+
+def _counting_swap(inp_array, ind1, ind2):
+    _active.swaps += 1
+    inp_array[ind1], inp_array[ind2] = inp_array[ind2], inp_array[ind1]
+
+
+def _partition3_wrapper(partition3):
+    def counting_partition3(input_array, lo, hi, pivot_index):
+        lt, gt = partition3(input_array, lo, hi, pivot_index)
+        # every key smaller or bigger than the pivot was exchanged once
+        _active.swaps += (lt - lo) + (hi - gt)
+        return lt, gt
+    return counting_partition3
+
+
+def _sift_down_wrapper(name, sift_down):
+    def counting_sift_down(input_array, lo, idx, size):
+        start = time.perf_counter()
+        end = sift_down(input_array, lo, idx, size)
+        levels = (end + 1).bit_length() - (idx + 1).bit_length()
+        _active.swaps += levels
+        _active.record(name, sift_down, levels, time.perf_counter() - start)
+        return end
+    return counting_sift_down
+
+
+def _root_wrapper(name, root):
+    def counting_root(self, i):
+        start = time.perf_counter()
+        ids = self.id
+        depth, j = 0, i
+        while j != ids[j]:
+            j = ids[j]
+            depth += 1
+        result = root(self, i)
+        _active.path_hops += depth
+        _active.record(name, root, depth, time.perf_counter() - start)
+        return result
+    return counting_root
+
+
+def _union_many_wrapper(union_many):
+    def counting_union_many(self, pairs):
+        # the batch loop walks to the roots inline, union() goes through root()
+        if hasattr(pairs, "tolist"):
+            pairs = pairs.tolist()
+        for p, q in pairs:
+            self.union(p, q)
+    counting_union_many.__doc__ = union_many.__doc__
+    return counting_union_many
+
+
+def _sift_wrapper(name, sift, traced_heaps):
+    def counting_sift(self, value_id):
+        start = time.perf_counter()
+        if not isinstance(self._pq, TracedList):
+            self._pq = TracedList(self._pq)
+            if isinstance(getattr(self, "_priorities", None), list):
+                self._priorities = TracedList(self._priorities)
+            traced_heaps.append(weakref.ref(self))
+        writes = self._pq.writes
+        sift(self, value_id)
+        # every level moved writes one item, the final write places the sifted one
+        levels = self._pq.writes - writes - 1
+        _active.swaps += levels
+        _active.record(name, sift, levels, time.perf_counter() - start)
+    return counting_sift
+
+
+def _after_wrapper(comparator):
+    def less(a, b):
+        # wrapped priorities would be compared, and counted, twice
+        if isinstance(a, Compared):
+            a, b = a.value, b.value
+        return comparator.less(a, b)
+
+    def after(self):
+        if self._reverse:
+            return less
+        return lambda a, b: less(b, a)
+    return after
+
+
+@contextmanager
+def instrument(counters=None, comparator=None):
+    """Count operations inside the block; yield the Counters.
+
+    comparator (a counting Comparator by default) orders MinPQ priorities
+    while instrumented."""
+    global _active
+    if _active is not None:
+        raise RuntimeError("Instrumentation is already active")
+    counters = counters or Counters()
+    comparator = comparator or Comparator()
+    originals = []
+
+    def patch(owner, attribute, replacement):
+        originals.append((owner, attribute, owner.__dict__[attribute]))
+        setattr(owner, attribute, replacement)
+
+    for module in (sorting, quicksort):
+        patch(module, "swap", _counting_swap)
+    patch(quicksort, "partition3", _partition3_wrapper(quicksort.partition3))
+    patch(quicksort, "_sift_down", _sift_down_wrapper("quicksort._sift_down", quicksort._sift_down))
+    for uf_class in (union_find.QuickUnionUF, union_find.WeightedQuickUnionUF,
+                     union_find.ArrayWeightedQuickUnionUF, union_find.KeyedUF,
+                     union_find.RollbackUF):
+        patch(uf_class, "root", _root_wrapper(f"{uf_class.__name__}.root", uf_class.root))
+    patch(union_find.ArrayWeightedQuickUnionUF, "union_many",
+          _union_many_wrapper(union_find.ArrayWeightedQuickUnionUF.union_many))
+    traced_heaps = []
+    for pq_class in (priority_queue.MinPQ, priority_queue.IndexMinPQ):
+        for method in ("swim", "sink"):
+            patch(pq_class, method, _sift_wrapper(f"{pq_class.__name__}.{method}",
+                                                  pq_class.__dict__[method], traced_heaps))
+    patch(priority_queue.MinPQ, "_after", _after_wrapper(comparator))
+    _active = counters
+    try:
+        yield counters
+    finally:
+        _active = None
+        for owner, attribute, original in reversed(originals):
+            setattr(owner, attribute, original)
+        for heap_ref in traced_heaps:
+            heap = heap_ref()
+            if heap is not None:
+                heap._pq = list(heap._pq)
+                if isinstance(getattr(heap, "_priorities", None), TracedList):
+                    heap._priorities = list(heap._priorities)
@@ -1,4 +1,5 @@
-from typing import Optional, TypeVar, Generic
+from array import array
+from typing import Generic, List, Optional, TypeVar
 from dataclasses import dataclass
 
 T = TypeVar("T")
@@ -28,3 +29,62 @@ class LinkedListIterator:
         except AttributeError:
             raise StopIteration
         return item
+
+
+NIL = -1  # "null pointer" for NodePool slots
+
+
+class NodePool(Generic[T]):
+    """Compact node storage for linked containers.
+
+    Nodes live in parallel columns instead of separate objects: items in a
+    list, next/previous links as slot numbers in typed arrays. Released slots
+    are chained into a free list through the next column and reused by
+    the following allocations."""
+
+    def __init__(self, doubly_linked: bool = False):
+        self.item: List[Optional[T]] = []
+        self.next = array('l')
+        self.previous = array('l') if doubly_linked else None
+        self._free = NIL
+
+    def alloc(self, item: T, next_slot: int = NIL, previous_slot: int = NIL) -> int:
+        """Store item in a free slot and return the slot number"""
+        slot = self._free
+        if slot == NIL:
+            slot = len(self.item)
+            self.item.append(item)
+            self.next.append(next_slot)
+            if self.previous is not None:
+                self.previous.append(previous_slot)
+            return slot
+        self._free = self.next[slot]
+        self.item[slot] = item
+        self.next[slot] = next_slot
+        if self.previous is not None:
+            self.previous[slot] = previous_slot
+        return slot
+
+    def release(self, slot: int) -> T:
+        """Return item stored in slot and put the slot on the free list"""
+        item = self.item[slot]
+        self.item[slot] = None  # do not keep a reference to the item
+        self.next[slot] = self._free
+        self._free = slot
+        return item
+
+
+class NodePoolIterator:
+    def __init__(self, pool: NodePool[T], first: int):
+        self._pool = pool
+        self.current = first
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.current == NIL:
+            raise StopIteration
+        item = self._pool.item[self.current]
+        self.current = self._pool.next[self.current]
+        return item
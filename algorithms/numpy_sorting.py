@@ -0,0 +1,80 @@
+"""Vectorized sorting backends for numeric arrays.
+
+NumPy is optional: without it as_numpy() always returns None and the
+callers in algorithms.sorting stay on their pure Python paths. NaNs sort
+last, as they do in NumPy.
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+MERGE_BLOCK_SIZE = 1024  # blocks sorted directly before the merge passes
+
+
+def as_numpy(input_array):
+    """Return a 1-d ndarray sharing memory with input_array, or None.
+
+    Works for 1-d integer or float ndarrays and numeric array.array
+    instances; strings, booleans and objects stay on the Python paths."""
+    if np is None:
+        return None
+    if isinstance(input_array, np.ndarray):
+        if input_array.ndim == 1 and input_array.dtype.kind in 'iuf':
+            return input_array
+        return None
+    if isinstance(input_array, array) and input_array.typecode != 'u':
+        return np.frombuffer(input_array, dtype=np.dtype(input_array.typecode))
+    return None
+
+
+def sort(values):
+    """Stable sort of values in place.
+
+    Backs sorting.shellsort: one vectorized sort outruns any h-sorting
+    pass, which would need a Python level loop per row."""
+    values.sort(kind='stable')
+
+
+def mergesort(values):
+    """Stable bottom-up mergesort of values in place.
+
+    Blocks of MERGE_BLOCK_SIZE are sorted directly, then pairs of sorted
+    blocks are merged by computing the final position of every element with
+    np.searchsorted."""
+    size = len(values)
+    if size <= 1:
+        return
+    width = min(size, MERGE_BLOCK_SIZE)
+    full = size - size % width
+    values[:full].reshape(-1, width).sort(axis=1, kind='stable')
+    values[full:].sort(kind='stable')
+    src = values
+    while width < size:
+        dst = np.empty_like(values)
+        for lo in range(0, size, 2 * width):
+            mid, hi = min(lo + width, size), min(lo + 2 * width, size)
+            merge_blocks(src[lo:mid], src[mid:hi], dst[lo:hi])
+        src = dst
+        width *= 2
+    if src is not values:
+        values[:] = src
+
+
+def merge_blocks(left, right, out):
+    """Stable merge of sorted left and right into out"""
+    # searchsorted orders NaNs last like sort() does, unlike the < operator
+    if not len(right) or not np.searchsorted(right, left[-1:], side='left')[0]:
+        out[:len(left)] = left
+        out[len(left):] = right
+        return
+    # an element lands after the elements of the other block that precede it
+    out[np.arange(len(left)) + np.searchsorted(right, left, side='left')] = left
+    out[np.arange(len(right)) + np.searchsorted(left, right, side='right')] = right
+
+
+def argsort(values):
+    """Return indices that would stably sort values"""
+    return np.argsort(values, kind='stable')
@@ -0,0 +1,156 @@
+"""Multi-process sorting.
+
+The input is split into one partition per worker and the partitions are
+sorted in a ProcessPoolExecutor with natural_mergesort. The sorted runs are
+then merged in a single k-way pass: typed arrays of numbers stay in shared
+memory, where splitters sampled from the runs cut every run into one range
+per worker and each worker merges its ranges into its slice of the output;
+other data comes back pickled once and is merged with heapq.merge.
+
+Shared memory needs Python 3.8; on older versions arrays take the pickled
+path and are converted back.
+"""
+import heapq
+import os
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - Python 3.7
+    shared_memory = None
+
+from algorithms.sorting import natural_mergesort
+
+MIN_PARTITION_SIZE = 10_000  # smaller inputs are not worth a process pool
+SHARED_TYPECODES = "bBhHiIlLqQfd"  # array typecodes memoryview can cast to
+
+
+def parallel_sort(data, workers=None, key=None):
+    """Return a sorted copy of data using up to `workers` processes.
+
+    An array.array of numbers is sorted through shared memory and returned as
+    an array of the same typecode; anything else is returned as a list. The
+    key function must be picklable (a module-level function for instance).
+    The sort is stable."""
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, max(1, len(data) // MIN_PARTITION_SIZE))
+    if isinstance(data, array) and data.typecode in SHARED_TYPECODES and key is None:
+        if shared_memory is not None:
+            return _sort_shared(data, workers)
+        return array(data.typecode, _sort_pickled(data, workers, None))
+    return _sort_pickled(data, workers, key)
+
+
+def _bounds(size, parts):
+    return [size * k // parts for k in range(parts + 1)]
+
+
+def _sort_pickled(data, workers, key):
+    result = list(data)
+    if workers == 1:
+        natural_mergesort(result, key=key)
+        return result
+    bounds = _bounds(len(result), workers)
+    with ProcessPoolExecutor(workers) as executor:
+        runs = list(executor.map(_sort_partition,
+                                 [result[lo:hi] for lo, hi in zip(bounds, bounds[1:])],
+                                 [key] * workers))
+    # heapq.merge takes equal items from earlier runs first, so it is stable
+    result[:] = heapq.merge(*runs, key=key)
+    return result
+
+
+def _sort_partition(part, key):
+    natural_mergesort(part, key=key)
+    return part
+
+
+def _splitters(runs, parts):
+    """Return parts - 1 values cutting the sorted runs into parts of about
+    the same total size, from a regular sample of every run"""
+    sample = []
+    for run in runs:
+        step = max(1, len(run) // parts)
+        sample.extend(run[i] for i in range(step - 1, len(run), step))
+    sample.sort()
+    return [sample[len(sample) * k // parts] for k in range(1, parts)]
+
+
+def _sort_shared(data, workers):
+    size, typecode = len(data), data.typecode
+    if workers == 1:
+        result = data.tolist()
+        natural_mergesort(result)
+        return array(typecode, result)
+    nbytes = max(1, size * data.itemsize)
+    source = shared_memory.SharedMemory(create=True, size=nbytes)
+    target = shared_memory.SharedMemory(create=True, size=nbytes)
+    try:
+        source.buf[:size * data.itemsize] = data.tobytes()
+        bounds = _bounds(size, workers)
+        with ProcessPoolExecutor(workers) as executor:
+            list(executor.map(_sort_shared_partition, [source.name] * workers,
+                              [typecode] * workers, bounds[:-1], bounds[1:]))
+            view = source.buf.cast(typecode)
+            runs = [view[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+            # cuts[r][k]: where the k-th part starts within run r, kept
+            # ascending even when NaNs leave the splitters out of order
+            splitters = _splitters(runs, workers)
+            cuts = [list(accumulate([0] + [bisect_left(run, value) for value in splitters]
+                                    + [len(run)], max)) for run in runs]
+            for run in runs:
+                run.release()
+            view.release()
+            offset, futures = 0, []
+            for k in range(workers):
+                ranges = [(lo + run_cuts[k], lo + run_cuts[k + 1])
+                          for lo, run_cuts in zip(bounds, cuts)]
+                futures.append(executor.submit(_merge_shared_ranges, source.name, target.name,
+                                               typecode, ranges, offset))
+                offset += sum(hi - lo for lo, hi in ranges)
+            for future in futures:
+                future.result()
+        result = array(typecode)
+        result.frombytes(bytes(target.buf[:size * data.itemsize]))
+        return result
+    finally:
+        for shm in (source, target):
+            shm.close()
+            shm.unlink()
+
+
+def _sort_shared_partition(name, typecode, lo, hi):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        view = shm.buf.cast(typecode)
+        part = view[lo:hi].tolist()
+        natural_mergesort(part)
+        view[lo:hi] = array(typecode, part)
+        view.release()
+    finally:
+        shm.close()
+
+
+def _merge_shared_ranges(source_name, target_name, typecode, ranges, offset):
+    """Merge the sorted (lo, hi) ranges of the source buffer into the target
+    buffer from offset on"""
+    source = shared_memory.SharedMemory(name=source_name)
+    target = shared_memory.SharedMemory(name=target_name)
+    try:
+        source_view = source.buf.cast(typecode)
+        merged = []
+        for lo, hi in ranges:
+            merged.extend(source_view[lo:hi].tolist())
+        source_view.release()
+        # the ranges are the natural runs, so this is one merge of them
+        natural_mergesort(merged)
+        merged = array(typecode, merged)
+        target_view = target.buf.cast(typecode)
+        target_view[offset:offset + len(merged)] = merged
+        target_view.release()
+    finally:
+        source.close()
+        target.close()
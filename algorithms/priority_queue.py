@@ -1,53 +1,282 @@
-# from algorithms import utils
+import operator
+
+from algorithms.exceptions import Empty
 
-def swap(inp_array, ind1, ind2):
-    inp_array[ind1], inp_array[ind2] = inp_array[ind2], inp_array[ind1]
 
 class MinPQ:
-    def __init__(self):
+    """Min priority queue on a 1-based d-ary heap (binary by default).
+
+    Wider heaps (arity=4 for instance) are shallower, so insertions and
+    sifts touch fewer levels at the price of more comparisons per level.
+
+    The priority of a value is key(value), computed once on insertion and
+    kept in a list parallel to the heap. With reverse=True the queue
+    returns the biggest priorities first."""
+    def __init__(self, items=None, arity=2, key=None, reverse=False):
+        """Create a queue, heapifying items bottom-up in O(n) if given"""
+        self._configure(arity, key, reverse)
+        self._priorities = [None]  # self._priorities[i] belongs to self._pq[i]
+        if items is not None:
+            self.insert_many(items)
+
+    def _configure(self, arity, key, reverse):
+        if arity < 2:
+            raise ValueError("Heap arity must be at least 2")
+        self._arity = arity
+        self._key = key
+        self._reverse = reverse
         self._pq = [None]
         self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def is_empty(self):
+        return self.size == 0
     
     def _parent_idx(self, idx):
-        return idx // 2
+        return (idx - 2) // self._arity + 1
     
-    def _child_ids(self, idx):
-        return (2 * idx, 2 * idx + 1)
+    def _heapify(self):
+        for value_id in range(self._parent_idx(self.size), 0, -1):
+            self.sink(value_id)
+
+    def _after(self):
+        """Return function telling whether a priority goes after another"""
+        return operator.lt if self._reverse else operator.gt
     
     def swim(self, value_id):
-        while value_id > 1 and self._bigger(self._parent_idx(value_id), value_id):
-            swap(self._pq, self._parent_idx(value_id), value_id)
-            value_id = self._parent_idx(value_id)
+        pq, priorities, arity = self._pq, self._priorities, self._arity
+        after = self._after()
+        value, priority = pq[value_id], priorities[value_id]
+        while value_id > 1:
+            parent = (value_id - 2) // arity + 1
+            if not after(priorities[parent], priority):
+                break
+            pq[value_id] = pq[parent]
+            priorities[value_id] = priorities[parent]
+            value_id = parent
+        pq[value_id], priorities[value_id] = value, priority
     
     def sink(self, value_id):
-        while self._child_ids(value_id)[0] <= self.size:
-            childs = self._child_ids(value_id)
-            if childs[0] < self.size and self._bigger(*childs):
-                smallest_child = childs[1]
+        pq, priorities, size, arity = self._pq, self._priorities, self.size, self._arity
+        after = self._after()
+        value, priority = pq[value_id], priorities[value_id]
+        child = arity * (value_id - 1) + 2
+        while child <= size:
+            if arity == 2:
+                if child < size and after(priorities[child], priorities[child + 1]):
+                    child += 1
             else:
-                smallest_child = childs[0]
-            if not self._bigger(value_id, smallest_child):
+                first_child = child
+                for sibling in range(first_child + 1, min(first_child + arity, size + 1)):
+                    if after(priorities[child], priorities[sibling]):
+                        child = sibling
+            if not after(priority, priorities[child]):
                 break
-
-            swap(self._pq, value_id, smallest_child)
-            value_id = smallest_child
+            pq[value_id] = pq[child]
+            priorities[value_id] = priorities[child]
+            value_id = child
+            child = arity * (value_id - 1) + 2
+        pq[value_id], priorities[value_id] = value, priority
         
     def insert(self, value):
         self.size += 1
         self._pq.append(value)
+        self._priorities.append(value if self._key is None else self._key(value))
         self.swim(self.size)
-    
-    def _bigger(self, id1, id2):
-        return self._pq[id1] > self._pq[id2]
+
+    def insert_many(self, values):
+        """Insert all the values, re-heapifying when it is cheaper than swims"""
+        old_size = self.size
+        self._pq.extend(values)
+        new_values = self._pq[old_size + 1:]
+        if self._key is None:
+            self._priorities.extend(new_values)
+        else:
+            self._priorities.extend(map(self._key, new_values))
+        self.size = len(self._pq) - 1
+        if self.size - old_size > old_size:
+            self._heapify()
+        else:
+            for value_id in range(old_size + 1, self.size + 1):
+                self.swim(value_id)
+
+    def merge(self, other):
+        """Insert all the values of another MinPQ; other stays unchanged"""
+        self.insert_many(other._pq[1:])
     
     def del_min(self):
+        if self.is_empty():
+            raise Empty("Priority queue is empty")
         min_key = self._pq[1]
-        swap(self._pq, 1, self.size)
+        last_key = self._pq.pop()
+        last_priority = self._priorities.pop()
         self.size -= 1
-        self.sink(1)
-        del self._pq[self.size+1]
+        if self.size:
+            self._pq[1] = last_key
+            self._priorities[1] = last_priority
+            self.sink(1)
         return min_key
 
+    def pop_many(self, count):
+        """Remove and return up to count smallest values in ascending order"""
+        del_min = self.del_min
+        return [del_min() for _ in range(min(count, self.size))]
+
+
+class IndexMinPQ(MinPQ):
+    """Min priority queue of distinct keys with changeable priorities.
+
+    The heap holds keys; their priorities and heap positions are kept in
+    dicts, so any key can be found in O(1) and reprioritized or deleted
+    in O(log n). arity, key and reverse work as for MinPQ: the queue is
+    ordered by key(priority), computed once per priority, while priority()
+    returns the priority as given."""
+    def __init__(self, items=None, arity=2, key=None, reverse=False):
+        """Create a queue, heapifying (key, priority) pairs in O(n) if given"""
+        self._configure(arity, key, reverse)
+        self._priority = {}
+        # key -> what the heap compares, the same dict without a key function
+        self._rank = self._priority if key is None else {}
+        self._qp = {}  # key -> index of the key within self._pq
+        if items is None:
+            return
+        for item_key, priority in items:
+            if item_key in self._priority:
+                raise ValueError(f"Duplicate key {item_key!r}")
+            self._set_priority(item_key, priority)
+            self._qp[item_key] = len(self._pq)
+            self._pq.append(item_key)
+        self.size = len(self._pq) - 1
+        self._heapify()
+
+    def __contains__(self, key):
+        return key in self._qp
+
+    def contains(self, key):
+        return key in self._qp
+
+    def priority(self, key):
+        return self._priority[key]
+
+    def min_key(self):
+        if self.is_empty():
+            raise Empty("Priority queue is empty")
+        return self._pq[1]
+
+    def min_priority(self):
+        return self._priority[self.min_key()]
+
+    def _rank_of(self, priority):
+        return priority if self._key is None else self._key(priority)
+
+    def _set_priority(self, key, priority):
+        self._priority[key] = priority
+        if self._key is not None:
+            self._rank[key] = self._key(priority)
+
+    def swim(self, value_id):
+        pq, qp, ranks, arity = self._pq, self._qp, self._rank, self._arity
+        after = self._after()
+        key = pq[value_id]
+        rank = ranks[key]
+        while value_id > 1:
+            parent = (value_id - 2) // arity + 1
+            parent_key = pq[parent]
+            if not after(ranks[parent_key], rank):
+                break
+            pq[value_id] = parent_key
+            qp[parent_key] = value_id
+            value_id = parent
+        pq[value_id] = key
+        qp[key] = value_id
+
+    def sink(self, value_id):
+        pq, qp, ranks, size, arity = self._pq, self._qp, self._rank, self.size, self._arity
+        after = self._after()
+        key = pq[value_id]
+        rank = ranks[key]
+        child = arity * (value_id - 1) + 2
+        while child <= size:
+            child_rank = ranks[pq[child]]
+            for sibling in range(child + 1, min(child + arity, size + 1)):
+                sibling_rank = ranks[pq[sibling]]
+                if after(child_rank, sibling_rank):
+                    child, child_rank = sibling, sibling_rank
+            if not after(rank, child_rank):
+                break
+            child_key = pq[child]
+            pq[value_id] = child_key
+            qp[child_key] = value_id
+            value_id = child
+            child = arity * (value_id - 1) + 2
+        pq[value_id] = key
+        qp[key] = value_id
+
+    def insert(self, key, priority):
+        """Add key with the given priority"""
+        if key in self._qp:
+            raise ValueError(f"Duplicate key {key!r}")
+        self._set_priority(key, priority)
+        self.size += 1
+        self._pq.append(key)
+        self.swim(self.size)
+
+    def insert_many(self, items):
+        """Insert (key, priority) pairs"""
+        for key, priority in items:
+            self.insert(key, priority)
+
+    def merge(self, other):
+        """Insert all the keys of another IndexMinPQ; other stays unchanged"""
+        self.insert_many(other._priority.items())
+
+    def del_min(self):
+        """Remove and return the key with the smallest priority"""
+        key = self.min_key()
+        self.delete(key)
+        return key
+
+    def delete(self, key):
+        """Remove key from the queue"""
+        value_id = self._qp.pop(key)
+        del self._priority[key]
+        self._rank.pop(key, None)
+        last_key = self._pq.pop()
+        self.size -= 1
+        if value_id <= self.size:
+            self._pq[value_id] = last_key
+            self._qp[last_key] = value_id
+            self.swim(value_id)
+            self.sink(self._qp[last_key])
+
+    def change_key(self, key, priority):
+        """Set a new priority for key"""
+        old_rank = self._rank[key]
+        self._set_priority(key, priority)
+        if self._after()(old_rank, self._rank[key]):
+            self.swim(self._qp[key])
+        else:
+            self.sink(self._qp[key])
+
+    def decrease_key(self, key, priority):
+        """Move key towards the front of the queue.
+
+        Priorities follow the queue order: with reverse=True the new
+        priority may not be smaller than the current one."""
+        if self._after()(self._rank_of(priority), self._rank[key]):
+            raise ValueError("New priority goes after the current one")
+        self.change_key(key, priority)
+
+    def increase_key(self, key, priority):
+        """Move key towards the back of the queue.
+
+        Priorities follow the queue order: with reverse=True the new
+        priority may not be bigger than the current one."""
+        if self._after()(self._rank[key], self._rank_of(priority)):
+            raise ValueError("New priority goes before the current one")
+        self.change_key(key, priority)
 
 if __name__ == '__main__':
     mpq = MinPQ()
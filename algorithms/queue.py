@@ -1,6 +1,8 @@
 from typing import Optional
 
-from algorithms.linked_list import LinkedListIterator, Node, T
+from algorithms.linked_list import (
+    LinkedListIterator, NIL, Node, NodePool, NodePoolIterator, T
+)
 from algorithms.exceptions import Empty
 
 
@@ -36,13 +38,55 @@ class Queue:
         return LinkedListIterator(self.first)
 
 
+class PooledQueue:
+    """Linked FIFO queue keeping its nodes in a NodePool instead of
+    allocating a Node object per item."""
+    def __init__(self):
+        self._nodes: NodePool[T] = NodePool()
+        self.first: int = NIL
+        self.last: int = NIL
+        self.size: int = 0
+
+    def enqueue(self, item: T) -> None:
+        """add item to the end of the list"""
+        old_last = self.last
+        self.last = self._nodes.alloc(item)
+        if self.is_empty():
+            self.first = self.last
+        else:
+            self._nodes.next[old_last] = self.last
+        self.size += 1
+
+    def dequeue(self) -> T:
+        """remove element from the beginning of the list"""
+        if self.is_empty():
+            raise Empty("Queue is empty")
+        old_first = self.first
+        self.first = self._nodes.next[old_first]
+        self.size -= 1
+        if self.is_empty():
+            self.last = NIL
+        return self._nodes.release(old_first)
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+    def __iter__(self) -> NodePoolIterator:
+        return NodePoolIterator(self._nodes, self.first)
+
+
 class ArrayQueue:
-    """FIFO queue implementation using a Python list as underlying storage."""
-    DEFAULT_CAPACITY = 10
+    """FIFO queue implementation using a Python list as underlying storage.
+
+    The list is a ring buffer of power-of-two capacity, so positions wrap
+    with a bit mask. It doubles when full and halves when less than a
+    quarter full."""
+    DEFAULT_CAPACITY = 16
 
     def __init__(self):
         """Create an empty queue."""
         self._data = [None] * ArrayQueue.DEFAULT_CAPACITY
+        self._mask = ArrayQueue.DEFAULT_CAPACITY - 1  # capacity - 1
         self._size = 0
         self._front = 0  # index of first element within self._data
 
@@ -66,10 +110,24 @@ class ArrayQueue:
         """Add element to the back of the queue."""
         if self._size == len(self._data):
             self._resize(2 * len(self._data))
-        next_place = (self._front + self._size) % len(self._data)
-        self._data[next_place] = item
+        self._data[(self._front + self._size) & self._mask] = item
         self._size += 1
 
+    def enqueue_many(self, items):
+        """Add all the elements to the back of the queue."""
+        items = list(items)
+        new_size = self._size + len(items)
+        capacity = len(self._data)
+        while capacity < new_size:
+            capacity *= 2
+        if capacity != len(self._data):
+            self._resize(capacity)
+        start = (self._front + self._size) & self._mask
+        head = min(len(items), capacity - start)
+        self._data[start:start + head] = items[:head]
+        self._data[:len(items) - head] = items[head:]
+        self._size = new_size
+
     def dequeue(self):
         """Remove and return the first element of the queue.
 
@@ -78,18 +136,53 @@ class ArrayQueue:
             raise Empty("Queue is empty")
         first_item = self._data[self._front]
         self._data[self._front] = None  # reclaim unused space
-        self._front = (self._front + 1) % len(self._data)
+        self._front = (self._front + 1) & self._mask
         self._size -= 1
-        if 0 < self._size < len(self._data) // 4:
-            self._resize(len(self._data // 2))
+        if self._size < len(self._data) // 4 and len(self._data) > ArrayQueue.DEFAULT_CAPACITY:
+            self._resize(len(self._data) // 2)
         return first_item
 
+    def dequeue_many(self, count):
+        """Remove and return up to count elements from the front of the queue.
+
+        Raise Empty exception if the queue is empty and ValueError if count
+        is negative."""
+        if count < 0:
+            raise ValueError("count must not be negative")
+        if self.is_empty():
+            raise Empty("Queue is empty")
+        count = min(count, self._size)
+        capacity = len(self._data)
+        head = min(count, capacity - self._front)
+        items = self._data[self._front:self._front + head] + self._data[:count - head]
+        # reclaim unused space
+        self._data[self._front:self._front + head] = [None] * head
+        self._data[:count - head] = [None] * (count - head)
+        self._front = (self._front + count) & self._mask
+        self._size -= count
+        while self._size < capacity // 4 and capacity > ArrayQueue.DEFAULT_CAPACITY:
+            capacity //= 2
+        if capacity != len(self._data):
+            self._resize(capacity)
+        return items
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("Queue index out of range")
+        return self._data[(self._front + index) & self._mask]
+
+    def __iter__(self):
+        data, mask = self._data, self._mask
+        for k in range(self._front, self._front + self._size):
+            yield data[k & mask]
+
     def _resize(self, new_capacity):
-        """Resize to a new list of capacity >= len(self._data)."""
+        """Move the elements to the beginning of a list of new_capacity."""
         old = self._data
-        self._data = [None] * new_capacity
-        walk = self._front
-        for k in range(self._size):
-            self._data[k] = old[walk]
-            walk = (1 + walk) % len(old)
+        head = min(self._size, len(old) - self._front)
+        self._data = old[self._front:self._front + head] + old[:self._size - head]
+        self._data.extend([None] * (new_capacity - self._size))
+        self._mask = new_capacity - 1
         self._front = 0
@@ -1,27 +1,142 @@
 from random import shuffle
 
+INSERTION_SORT_CUTOFF = 16  # ranges shorter than that are insertion sorted
+NINTHER_CUTOFF = 40  # ranges at least that long take a ninther as pivot
+
+
 def swap(inp_array, ind1, ind2):
     inp_array[ind1], inp_array[ind2] = inp_array[ind2], inp_array[ind1]
 
-def quicksort(input_array, lo, hi):
-    if lo >= hi:
+def quicksort(input_array, lo=0, hi=None, key=None, reverse=False):
+    """Sort input_array[lo:hi + 1] in place (the whole list by default).
+
+    Introsort: iterative 3-way quicksort with median-of-three/ninther pivots,
+    insertion sort for short ranges and heapsort once the partitioning gets
+    deeper than 2*log2(n). Not stable, except when key is given."""
+    if hi is None:
+        hi = len(input_array) - 1
+    if hi <= lo:
+        return
+    if key is None:
+        _introsort(input_array, lo, hi)
+        if reverse:
+            input_array[lo:hi + 1] = input_array[hi:lo - 1 if lo else None:-1]
         return
-    partition_index = partition(input_array, lo, hi)
-    quicksort(input_array, lo, partition_index - 1)
-    quicksort(input_array, partition_index + 1, hi)
+    # the index makes decorated entries unique, so items are never compared
+    sign = -1 if reverse else 1
+    decorated = [(key(item), sign * i, item)
+                 for i, item in enumerate(input_array[lo:hi + 1])]
+    _introsort(decorated, 0, len(decorated) - 1)
+    if reverse:
+        decorated.reverse()
+    input_array[lo:hi + 1] = [item for _, _, item in decorated]
+
+def _introsort(input_array, lo, hi):
+    stack = [(lo, hi, 2 * (hi - lo + 1).bit_length())]
+    while stack:
+        lo, hi, depth_limit = stack.pop()
+        # partition the range, keep the bigger part for later and go on
+        # with the smaller one, so the stack stays O(log n) deep
+        while hi - lo >= INSERTION_SORT_CUTOFF and depth_limit > 0:
+            depth_limit -= 1
+            lt, gt = partition3(input_array, lo, hi, _pivot_index(input_array, lo, hi))
+            if lt - lo < hi - gt:
+                stack.append((gt + 1, hi, depth_limit))
+                hi = lt - 1
+            else:
+                stack.append((lo, lt - 1, depth_limit))
+                lo = gt + 1
+        if hi - lo < INSERTION_SORT_CUTOFF:
+            _insertion_sort(input_array, lo, hi)
+        else:
+            _heapsort(input_array, lo, hi)
+
+def _median_of_three(input_array, i, j, k):
+    a, b, c = input_array[i], input_array[j], input_array[k]
+    if a < b:
+        if b < c:
+            return j
+        return k if a < c else i
+    if a < c:
+        return i
+    return k if b < c else j
+
+def _pivot_index(input_array, lo, hi):
+    mid = lo + (hi - lo) // 2
+    if hi - lo + 1 < NINTHER_CUTOFF:
+        return _median_of_three(input_array, lo, mid, hi)
+    eps = (hi - lo + 1) // 8
+    return _median_of_three(
+        input_array,
+        _median_of_three(input_array, lo, lo + eps, lo + 2 * eps),
+        _median_of_three(input_array, mid - eps, mid, mid + eps),
+        _median_of_three(input_array, hi - 2 * eps, hi - eps, hi),
+    )
+
+def partition3(input_array, lo, hi, pivot_index):
+    """Dijkstra 3-way partitioning around input_array[pivot_index].
+
+    Return (lt, gt) such that input_array[lt:gt + 1] holds the keys equal to
+    the pivot, smaller keys are to the left and bigger ones to the right."""
+    swap(input_array, lo, pivot_index)
+    pivot = input_array[lo]
+    lt, i, gt = lo, lo + 1, hi
+    while i <= gt:
+        item = input_array[i]
+        if item < pivot:
+            input_array[i] = input_array[lt]
+            input_array[lt] = item
+            lt += 1
+            i += 1
+        elif pivot < item:
+            input_array[i] = input_array[gt]
+            input_array[gt] = item
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+def _insertion_sort(input_array, lo, hi):
+    for i in range(lo + 1, hi + 1):
+        item = input_array[i]
+        j = i
+        while j > lo and item < input_array[j - 1]:
+            input_array[j] = input_array[j - 1]
+            j -= 1
+        input_array[j] = item
+
+def _heapsort(input_array, lo, hi):
+    size = hi - lo + 1
+    for idx in range(size // 2 - 1, -1, -1):
+        _sift_down(input_array, lo, idx, size)
+    for last in range(size - 1, 0, -1):
+        swap(input_array, lo, lo + last)
+        _sift_down(input_array, lo, 0, last)
+
+def _sift_down(input_array, lo, idx, size):
+    """Sink input_array[lo + idx] in the max-heap input_array[lo:lo + size];
+    return the index (relative to lo) it ends up at"""
+    item = input_array[lo + idx]
+    child = 2 * idx + 1
+    while child < size:
+        if child + 1 < size and input_array[lo + child] < input_array[lo + child + 1]:
+            child += 1
+        if not item < input_array[lo + child]:
+            break
+        input_array[lo + idx] = input_array[lo + child]
+        idx = child
+        child = 2 * idx + 1
+    input_array[lo + idx] = item
+    return idx
 
 def partition(input_array, lo, hi):
     i = lo + 1
     j = hi
     partition_char = input_array[lo]
     while True:
-        for char in input_array[i:hi]:
-            if char > partition_char:
-                break
+        while i < hi and not input_array[i] > partition_char:
             i += 1
-        for char in input_array[j:lo:-1]:
-            if char < partition_char:
-                break
+        while j > lo and not input_array[j] < partition_char:
             j -= 1
         if i >= j:
             break
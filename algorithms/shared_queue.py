@@ -0,0 +1,213 @@
+"""Single-producer single-consumer ring buffer queue of binary records.
+
+The queue lives in a block of shared memory or in a memory-mapped file, so a
+producer and a consumer in different processes exchange records without
+pickling: a record is copied once into the ring and read back either as
+bytes or as a zero-copy memoryview. Since the read and write positions are
+stored in the buffer itself, a file-backed queue picks up where it left off
+after a restart.
+
+Records are either length-prefixed byte strings of any size, or all exactly
+record_size bytes. A length-prefixed record never wraps around the end of
+the ring; the space left at the end is skipped with a marker instead.
+
+Shared memory needs Python 3.8; older versions only have file-backed
+queues.
+"""
+import mmap
+import os
+import struct
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # pragma: no cover - Python 3.7
+    shared_memory = None
+
+from algorithms.exceptions import Empty, Full
+
+MAGIC = b"RINGQ001"
+# magic, capacity, record_size, head, tail, enqueued count, dequeued count
+_HEADER = struct.Struct("<8sQQQQQQ")
+HEADER_SIZE = 64  # _HEADER padded, data starts here
+_LENGTH = struct.Struct("<I")
+_WRAP = 0xFFFFFFFF  # length marking the rest of the ring as skipped
+_HEAD_OFFSET, _TAIL_OFFSET, _IN_OFFSET, _OUT_OFFSET = 24, 32, 40, 48
+_COUNTER = struct.Struct("<Q")
+
+
+class SharedRingQueue:
+    """ArrayQueue-like FIFO queue of bytes records in a shared buffer.
+
+    Use create()/attach() for shared memory or open_file() for a file.
+    Exactly one process may enqueue and one may dequeue at a time."""
+    def __init__(self, buffer, owner=None):
+        """Wrap an initialized buffer; use the constructors below instead."""
+        self._owner = owner  # SharedMemory or mmap keeping the buffer alive
+        self._buf = memoryview(buffer)
+        magic, self._capacity, self._record_size = _HEADER.unpack_from(self._buf)[:3]
+        if magic != MAGIC:
+            raise ValueError("Buffer does not hold a ring queue")
+
+    @staticmethod
+    def _init_header(buffer, capacity, record_size):
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if record_size and capacity % record_size:
+            raise ValueError("Capacity must be a multiple of record_size")
+        _HEADER.pack_into(buffer, 0, MAGIC, capacity, record_size, 0, 0, 0, 0)
+
+    @staticmethod
+    def _require_shared_memory():
+        if shared_memory is None:
+            raise ImportError("Shared memory queues need Python 3.8, use open_file()")
+
+    @classmethod
+    def create(cls, capacity, record_size=0, name=None):
+        """Create a queue in new shared memory of capacity data bytes"""
+        cls._require_shared_memory()
+        shm = shared_memory.SharedMemory(name=name, create=True, size=HEADER_SIZE + capacity)
+        cls._init_header(shm.buf, capacity, record_size)
+        return cls(shm.buf, shm)
+
+    @classmethod
+    def attach(cls, name):
+        """Open a queue created by another process under name"""
+        cls._require_shared_memory()
+        shm = shared_memory.SharedMemory(name=name)
+        return cls(shm.buf, shm)
+
+    @classmethod
+    def open_file(cls, path, capacity=None, record_size=0):
+        """Open the queue stored in path, creating it if it does not exist.
+
+        An existing queue keeps its records, capacity and record size."""
+        exists = os.path.exists(path) and os.path.getsize(path) >= HEADER_SIZE
+        if not exists and capacity is None:
+            raise ValueError("Capacity is required to create a queue file")
+        with open(path, "r+b" if exists else "w+b") as queue_file:
+            if not exists:
+                queue_file.truncate(HEADER_SIZE + capacity)
+            mapped = mmap.mmap(queue_file.fileno(), 0)
+        if not exists:
+            cls._init_header(mapped, capacity, record_size)
+        return cls(mapped, mapped)
+
+    @property
+    def name(self):
+        """Shared memory name to attach() to, None for file-backed queues"""
+        return getattr(self._owner, "name", None)
+
+    def _get(self, offset):
+        return _COUNTER.unpack_from(self._buf, offset)[0]
+
+    def _set(self, offset, value):
+        _COUNTER.pack_into(self._buf, offset, value)
+
+    def __len__(self):
+        """Return the number of records in the queue."""
+        return self._get(_IN_OFFSET) - self._get(_OUT_OFFSET)
+
+    def is_empty(self):
+        """Return True if queue is empty."""
+        return self._get(_HEAD_OFFSET) == self._get(_TAIL_OFFSET)
+
+    def enqueue(self, record):
+        """Add a bytes-like record to the back of the queue.
+
+        Raise Full exception if there is not enough free space."""
+        record = memoryview(record).cast("B")
+        size, capacity = record.nbytes, self._capacity
+        head, tail = self._get(_HEAD_OFFSET), self._get(_TAIL_OFFSET)
+        position = tail % capacity
+        if self._record_size:
+            if size != self._record_size:
+                raise ValueError(f"Records must be {self._record_size} bytes long")
+            if tail - head + size > capacity:
+                raise Full("Queue is full")
+            start = position
+        else:
+            needed = _LENGTH.size + size
+            if needed > capacity:
+                raise ValueError("Record is bigger than the queue")
+            skip = capacity - position if needed > capacity - position else 0
+            if tail - head + skip + needed > capacity:
+                raise Full("Queue is full")
+            if skip:
+                if skip >= _LENGTH.size:
+                    _LENGTH.pack_into(self._buf, HEADER_SIZE + position, _WRAP)
+                tail += skip
+                position = 0
+            _LENGTH.pack_into(self._buf, HEADER_SIZE + position, size)
+            start = position + _LENGTH.size
+        self._buf[HEADER_SIZE + start:HEADER_SIZE + start + size] = record
+        # publish the record only once its bytes are in place
+        self._set(_TAIL_OFFSET, tail + (start - position) + size)
+        self._set(_IN_OFFSET, self._get(_IN_OFFSET) + 1)
+
+    def _first_record(self):
+        """Return (data offset, size, head after it) of the first record"""
+        head, tail = self._get(_HEAD_OFFSET), self._get(_TAIL_OFFSET)
+        if head == tail:
+            raise Empty("Queue is empty")
+        capacity = self._capacity
+        position = head % capacity
+        if self._record_size:
+            return position, self._record_size, head + self._record_size
+        if capacity - position < _LENGTH.size or \
+                _LENGTH.unpack_from(self._buf, HEADER_SIZE + position)[0] == _WRAP:
+            head += capacity - position
+            position = 0
+        size = _LENGTH.unpack_from(self._buf, HEADER_SIZE + position)[0]
+        start = position + _LENGTH.size
+        return start, size, head + _LENGTH.size + size
+
+    def peek(self):
+        """Return a zero-copy memoryview of the first record.
+
+        The view is valid until the record is dequeued or discarded; release
+        it before closing the queue. Raise Empty exception if the queue is
+        empty."""
+        start, size, _ = self._first_record()
+        return self._buf[HEADER_SIZE + start:HEADER_SIZE + start + size]
+
+    def first(self):
+        """Return a copy of the first record.
+
+        Raise Empty exception if the queue is empty."""
+        view = self.peek()
+        try:
+            return bytes(view)
+        finally:
+            view.release()
+
+    def discard(self):
+        """Remove the first record without copying it.
+
+        Raise Empty exception if the queue is empty."""
+        _, _, new_head = self._first_record()
+        self._set(_HEAD_OFFSET, new_head)
+        self._set(_OUT_OFFSET, self._get(_OUT_OFFSET) + 1)
+
+    def dequeue(self):
+        """Remove and return the first record as bytes.
+
+        Raise Empty exception if the queue is empty."""
+        record = self.first()
+        self.discard()
+        return record
+
+    def flush(self):
+        """Write a file-backed queue to disk"""
+        if isinstance(self._owner, mmap.mmap):
+            self._owner.flush()
+
+    def close(self):
+        """Detach from the buffer; the queue itself stays"""
+        self._buf.release()
+        if self._owner is not None:
+            self._owner.close()
+
+    def unlink(self):
+        """Destroy shared memory of the queue (call once, from one process)"""
+        if shared_memory is not None and isinstance(self._owner, shared_memory.SharedMemory):
+            self._owner.unlink()
@@ -1,3 +1,8 @@
+from bisect import bisect_left, bisect_right
+
+from algorithms import numpy_sorting
+
+
 def selection_sort(input_array):
     array_size = len(input_array)
     for i in range(array_size):
@@ -28,6 +33,10 @@ def insertion_sort_reverse(input_array):
 
 
 def shellsort(input_array):
+    numeric = numpy_sorting.as_numpy(input_array)
+    if numeric is not None:
+        numpy_sorting.sort(numeric)
+        return
     array_size = len(input_array)
     h = 1
     while h < array_size / 3:
@@ -45,6 +54,115 @@ def shellsort(input_array):
 def swap(inp_array, ind1, ind2):
     inp_array[ind1], inp_array[ind2] = inp_array[ind2], inp_array[ind1]
 
+MIN_RUN = 16  # natural runs shorter than that are extended by insertion sort
+
+
+def natural_mergesort(input_array, key=None):
+    """Stable in-place sort merging the natural ascending runs bottom-up.
+
+    Runs shorter than MIN_RUN are extended with insertion sort, merges of
+    runs that are already in order are skipped, and the list and a single
+    auxiliary buffer swap roles on every pass instead of copying back."""
+    numeric = numpy_sorting.as_numpy(input_array) if key is None else None
+    if numeric is not None:
+        numpy_sorting.mergesort(numeric)
+        return
+    if key is None:
+        _natural_mergesort(input_array)
+        return
+    # the index makes decorated entries unique, so items are never compared
+    decorated = [(key(item), i, item) for i, item in enumerate(input_array)]
+    _natural_mergesort(decorated)
+    input_array[:] = [item for _, _, item in decorated]
+
+
+def argsort(input_array):
+    """Return the list of indices that would stably sort input_array.
+
+    NumPy and numeric typed arrays get an ndarray of indices instead."""
+    numeric = numpy_sorting.as_numpy(input_array)
+    if numeric is not None:
+        return numpy_sorting.argsort(numeric)
+    indices = list(range(len(input_array)))
+    natural_mergesort(indices, key=input_array.__getitem__)
+    return indices
+
+
+def _natural_mergesort(input_array):
+    array_size = len(input_array)
+    run_starts = _find_runs(input_array)
+    src, dst = input_array, input_array[:]
+    while len(run_starts) > 1:
+        merged_starts = []
+        for k in range(0, len(run_starts), 2):
+            lo = run_starts[k]
+            if k + 1 == len(run_starts):
+                dst[lo:] = src[lo:]
+                merged_starts.append(lo)
+                break
+            mid = run_starts[k + 1]
+            hi = run_starts[k + 2] if k + 2 < len(run_starts) else array_size
+            if src[mid] < src[mid - 1]:
+                _merge_runs(src, dst, lo, mid, hi)
+            else:
+                dst[lo:hi] = src[lo:hi]
+            merged_starts.append(lo)
+        run_starts = merged_starts
+        src, dst = dst, src
+    if src is not input_array:
+        input_array[:] = src
+
+
+def _find_runs(input_array):
+    """Return start indices of ascending runs at least MIN_RUN long"""
+    array_size = len(input_array)
+    run_starts = []
+    lo = 0
+    while lo < array_size:
+        run_starts.append(lo)
+        hi = lo + 1
+        while hi < array_size and not input_array[hi] < input_array[hi - 1]:
+            hi += 1
+        if hi - lo < MIN_RUN and hi < array_size:
+            hi = min(lo + MIN_RUN, array_size)
+            _insertion_sort_range(input_array, lo, hi)
+        lo = hi
+    return run_starts
+
+
+def _insertion_sort_range(input_array, lo, hi):
+    """Stable insertion sort of input_array[lo:hi]"""
+    for i in range(lo + 1, hi):
+        item = input_array[i]
+        j = i
+        while j > lo and item < input_array[j - 1]:
+            input_array[j] = input_array[j - 1]
+            j -= 1
+        input_array[j] = item
+
+
+def _merge_runs(src, dst, lo, mid, hi):
+    """Stable merge of src[lo:mid] and src[mid:hi] into dst[lo:hi]"""
+    # the parts of the runs that are already in place are copied as slices
+    i = bisect_right(src, src[mid], lo, mid)
+    dst[lo:i] = src[lo:i]
+    end = bisect_left(src, src[mid - 1], mid, hi)
+    dst[end:hi] = src[end:hi]
+    j, k = mid, i
+    while i < mid and j < end:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            i += 1
+        k += 1
+    if i < mid:
+        dst[k:end] = src[i:mid]
+    else:
+        dst[k:end] = src[j:end]
+
+
 def merge(input_array, aux_array, lo, mid, hi):
     for i in range(lo, hi + 1):
         aux_array[i] = input_array[i]
@@ -65,7 +183,15 @@ def merge(input_array, aux_array, lo, mid, hi):
             j += 1
     return input_array
 
-def mergesort(input_array, aux_array, lo, hi):
+def mergesort(input_array, aux_array=None, lo=0, hi=None):
+    if hi is None:
+        hi = len(input_array) - 1
+    if aux_array is None:
+        numeric = numpy_sorting.as_numpy(input_array)
+        if numeric is not None:
+            numpy_sorting.mergesort(numeric[lo:hi + 1])
+            return
+        aux_array = [None] * len(input_array)
     if hi <= lo:
         return
     mid = lo + (hi - lo) // 2
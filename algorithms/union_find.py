@@ -1,3 +1,12 @@
+from array import array
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
 class QuickUnionUF:
     def __init__(self, n: int):
         self.id = list(range(n))
@@ -41,3 +50,270 @@ class WeightedQuickUnionUF:
         else:
             self.id[j] = i
             self.sz[i] += self.sz[j]
+
+
+class ArrayWeightedQuickUnionUF:
+    """WeightedQuickUnionUF over array('i') storage with batch operations.
+
+    Ids and sizes are kept unboxed, 4 bytes per element each. When NumPy is
+    installed it works on the same memory to flatten all the trees at once.
+    A histogram of the component sizes is kept up to date by the unions."""
+    def __init__(self, n: int):
+        self.id = array('i', range(n))
+        self.sz = array('i', [1]) * n
+        self.count = n  # number of components
+        self._size_counts = {1: n} if n else {}  # size -> number of components
+
+    def reset(self, nodes=None):
+        """Make every element a singleton component again, in place.
+
+        With nodes, only those elements are relinked, which is enough when
+        every union since the last reset was between two of them."""
+        n = len(self.id)
+        if nodes is None:
+            self.id[:] = array('i', range(n))
+            self.sz[:] = array('i', [1]) * n
+        else:
+            ids, sz = self.id, self.sz
+            for node in nodes:
+                ids[node] = node
+                sz[node] = 1
+        self.count = n
+        self._size_counts = {1: n} if n else {}
+
+    def __len__(self):
+        return len(self.id)
+
+    def root(self, i: int):
+        ids = self.id
+        while (i != ids[i]):
+            ids[i] = ids[ids[i]]
+            i = ids[i]
+        return i
+
+    def connected(self, p: int, q: int):
+        return self.root(p) == self.root(q)
+
+    def union(self, p: int, q: int):
+        i = self.root(p)
+        j = self.root(q)
+        if i == j:
+            return
+        if self.sz[i] < self.sz[j]:
+            i, j = j, i
+        self.id[j] = i
+        self._merge_sizes(self.sz[i], self.sz[j])
+        self.sz[i] += self.sz[j]
+        self.count -= 1
+
+    def _merge_sizes(self, size1, size2):
+        counts = self._size_counts
+        for size in (size1, size2):
+            if counts[size] == 1:
+                del counts[size]
+            else:
+                counts[size] -= 1
+        counts[size1 + size2] = counts.get(size1 + size2, 0) + 1
+
+    def union_many(self, pairs):
+        """Union every (p, q) pair, e.g. a list of tuples or a (k, 2) ndarray"""
+        if np is not None and isinstance(pairs, np.ndarray):
+            pairs = pairs.tolist()
+        ids, sz = self.id, self.sz
+        merge_sizes = self._merge_sizes
+        merged = 0
+        for p, q in pairs:
+            while p != ids[p]:
+                ids[p] = ids[ids[p]]
+                p = ids[p]
+            while q != ids[q]:
+                ids[q] = ids[ids[q]]
+                q = ids[q]
+            if p == q:
+                continue
+            if sz[p] < sz[q]:
+                p, q = q, p
+            ids[q] = p
+            merge_sizes(sz[p], sz[q])
+            sz[p] += sz[q]
+            merged += 1
+        self.count -= merged
+
+    def connected_many(self, pairs):
+        """Answer connected(p, q) for every pair.
+
+        A (k, 2) ndarray of pairs gets a boolean ndarray, computed from the
+        flattened trees; other iterables get a list."""
+        if np is not None and isinstance(pairs, np.ndarray):
+            roots = self.find_all()
+            return roots[pairs[:, 0]] == roots[pairs[:, 1]]
+        root = self.root
+        return [root(p) == root(q) for p, q in pairs]
+
+    def find_all(self):
+        """Point every element straight to its root and return the roots.
+
+        The result is an ndarray with NumPy and an array('i') without it."""
+        if np is None:
+            root = self.root
+            for i in range(len(self.id)):
+                self.id[i] = root(i)
+            return array('i', self.id)
+        ids = np.frombuffer(self.id, dtype=np.intc)
+        while True:
+            parents = ids[ids]
+            if np.array_equal(parents, ids):
+                return parents
+            ids[:] = parents
+
+    def component_count(self):
+        return self.count
+
+    def component_size(self, p: int):
+        return self.sz[self.root(p)]
+
+    def component_sizes(self):
+        """Return a read-only {size: number of components} view, in O(1)"""
+        return MappingProxyType(self._size_counts)
+
+
+class KeyedUF:
+    """Union-find over arbitrary hashable keys discovered on the fly.
+
+    Keys are interned to dense ids on first union; the id, rank and next
+    arrays double in size when they run out of room. Union by rank with
+    full path compression. Members of a component form a circular list
+    through the next array, so a component is listed without scanning
+    all the elements."""
+    INITIAL_CAPACITY = 16
+
+    def __init__(self, keys=()):
+        self._ids = {}  # key -> dense id
+        self._keys = []  # dense id -> key
+        self.id = array('l', range(KeyedUF.INITIAL_CAPACITY))
+        self.rank = array('b', bytes(KeyedUF.INITIAL_CAPACITY))
+        self.next = array('l', range(KeyedUF.INITIAL_CAPACITY))
+        self.count = 0  # number of components
+        for key in keys:
+            self.add(key)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._ids
+
+    def add(self, key):
+        """Add key as a singleton component unless it is known already"""
+        if key in self._ids:
+            return self._ids[key]
+        new_id = len(self._keys)
+        if new_id == len(self.id):
+            self._grow()
+        self._ids[key] = new_id
+        self._keys.append(key)
+        self.count += 1
+        return new_id
+
+    def _grow(self):
+        old_capacity = len(self.id)
+        self.id.extend(range(old_capacity, 2 * old_capacity))
+        self.rank.extend(bytes(old_capacity))
+        self.next.extend(range(old_capacity, 2 * old_capacity))
+
+    def root(self, i: int):
+        ids = self.id
+        root = i
+        while root != ids[root]:
+            root = ids[root]
+        while i != root:
+            ids[i], i = root, ids[i]
+        return root
+
+    def find(self, key):
+        """Return the key representing the component of key"""
+        return self._keys[self.root(self._ids[key])]
+
+    def connected(self, p, q):
+        if p not in self._ids or q not in self._ids:
+            return p == q
+        return self.root(self._ids[p]) == self.root(self._ids[q])
+
+    def union(self, p, q):
+        i = self.root(self.add(p))
+        j = self.root(self.add(q))
+        if i == j:
+            return
+        if self.rank[i] < self.rank[j]:
+            i, j = j, i
+        elif self.rank[i] == self.rank[j]:
+            self.rank[i] += 1
+        self.id[j] = i
+        # splice the two circular member lists into one
+        self.next[i], self.next[j] = self.next[j], self.next[i]
+        self.count -= 1
+
+    def members(self, key):
+        """Iterate over the keys in the component of key"""
+        start = self._ids[key]
+        current = start
+        while True:
+            yield self._keys[current]
+            current = self.next[current]
+            if current == start:
+                return
+
+
+class RollbackUF:
+    """Weighted quick-union with an undo log instead of path compression.
+
+    Union by size alone keeps trees O(log n) deep, and without path
+    compression a union changes exactly one link, so it can be undone in
+    O(1). snapshot() marks the current state and rollback(snapshot) undoes
+    all the unions made after it, as needed by offline dynamic
+    connectivity."""
+    def __init__(self, n: int):
+        self.id = list(range(n))
+        self.sz = [1] * n
+        self.count = n  # number of components
+        self._history = []  # roots linked by each union, None for no-ops
+
+    def root(self, i: int):
+        while (i != self.id[i]):
+            i = self.id[i]
+        return i
+
+    def connected(self, p: int, q: int):
+        return self.root(p) == self.root(q)
+
+    def union(self, p: int, q: int):
+        i = self.root(p)
+        j = self.root(q)
+        if i == j:
+            self._history.append(None)
+            return
+        if self.sz[i] < self.sz[j]:
+            i, j = j, i
+        self.id[j] = i
+        self.sz[i] += self.sz[j]
+        self.count -= 1
+        self._history.append(j)
+
+    def snapshot(self):
+        """Return a token for the current state, to pass to rollback"""
+        return len(self._history)
+
+    def rollback(self, snapshot=None):
+        """Undo the unions made after snapshot (the last union by default)"""
+        if snapshot is None:
+            snapshot = len(self._history) - 1
+        if not 0 <= snapshot <= len(self._history):
+            raise ValueError("Invalid snapshot")
+        while len(self._history) > snapshot:
+            j = self._history.pop()
+            if j is None:
+                continue
+            i = self.id[j]
+            self.id[j] = j
+            self.sz[i] -= self.sz[j]
+            self.count += 1
@@ -0,0 +1,63 @@
+"""ArrayQueue single and bulk throughput vs collections.deque."""
+import collections
+import sys
+
+from algorithms.queue import ArrayQueue
+from benchmarks.common import best_time, report
+
+BATCH = 256
+
+
+def single(n):
+    queue = ArrayQueue()
+    for i in range(n):
+        queue.enqueue(i)
+    for _ in range(n):
+        queue.dequeue()
+
+
+def bulk(n):
+    queue = ArrayQueue()
+    batch = list(range(BATCH))
+    for _ in range(n // BATCH):
+        queue.enqueue_many(batch)
+    while not queue.is_empty():
+        queue.dequeue_many(BATCH)
+
+
+def steady(n):
+    """Queue staying around 1000 elements, right where resizes could thrash"""
+    queue = ArrayQueue()
+    for i in range(1000):
+        queue.enqueue(i)
+    for i in range(n):
+        queue.enqueue(i)
+        queue.dequeue()
+
+
+def deque_single(n):
+    queue = collections.deque()
+    for i in range(n):
+        queue.append(i)
+    for _ in range(n):
+        queue.popleft()
+
+
+def deque_bulk(n):
+    queue = collections.deque()
+    batch = list(range(BATCH))
+    for _ in range(n // BATCH):
+        queue.extend(batch)
+    while queue:
+        [queue.popleft() for _ in range(min(BATCH, len(queue)))]
+
+
+def main(n=1_000_000):
+    report(f"enqueue + dequeue of n={n:,} items", [
+        (func.__name__, f"{2 * n / best_time(func, n):,.0f} ops/s")
+        for func in (single, bulk, steady, deque_single, deque_bulk)
+    ])
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,73 @@
+"""Collinear points: CollinearEngine and the NumPy backend against the
+original per-suffix scan.
+
+Point sets follow the Coursera inputs: random points on a 32768 x 32768
+grid, plus a few planted lines of 4 to 8 points. The original scan only
+runs up to 2,000 points and CollinearEngine up to 10,000; pass sizes to
+override the defaults, e.g. 100000 for the NumPy backend alone."""
+import random
+import sys
+import time
+
+from benchmarks.common import report
+from exercises.collinear_numpy import NumpyCollinearEngine, np
+from exercises.collinear_points import CollinearEngine, Point, find_max_line_segment
+
+SIZES = (1000, 2000, 4000, 10000)
+ORIGINAL_MAX_SIZE = 2000
+ENGINE_MAX_SIZE = 10000
+
+
+def point_set(n, lines=None, grid=32768):
+    """Return n distinct points, lines of them planted on lines"""
+    lines = n // 100 if lines is None else lines
+    coordinates = set()
+    while len(coordinates) < sum(range(4, 9)) * lines // 5:
+        dx, dy = random.randint(-200, 200), random.randint(1, 200)
+        x, y = random.randrange(grid), random.randrange(grid // 2)
+        coordinates.update((x + i * dx, y + i * dy) for i in range(random.randint(4, 8)))
+    while len(coordinates) < n:
+        coordinates.add((random.randrange(grid), random.randrange(grid)))
+    points = [Point(x, y) for x, y in coordinates]
+    random.shuffle(points)
+    return points
+
+
+def original_segments(points):
+    points = sorted(points)
+    segments = []
+    for i, point in enumerate(points):
+        segment = find_max_line_segment(point, points[i:])
+        if segment:
+            segments.append(segment)
+    return segments
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main(*sizes):
+    random.seed(42)
+    for n in sizes or SIZES:
+        points = point_set(n)
+        rows = []
+        if n <= ENGINE_MAX_SIZE:
+            count, elapsed = timed(lambda: CollinearEngine(points).number_of_segments())
+            rows.append(("CollinearEngine", f"{count} segments", f"{elapsed:.2f} s"))
+        if np is not None:
+            for workers in (1, None):
+                count, elapsed = timed(
+                    lambda: NumpyCollinearEngine(points, workers=workers).number_of_segments())
+                rows.append((f"numpy, workers={workers or 'all'}", f"{count} segments",
+                             f"{elapsed:.2f} s"))
+        if n <= ORIGINAL_MAX_SIZE:
+            found, elapsed = timed(original_segments, points)
+            rows.append(("original scan", f"{len(found)} segments", f"{elapsed:.2f} s"))
+        report(f"n={n:,}", rows)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
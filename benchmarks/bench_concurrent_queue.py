@@ -0,0 +1,87 @@
+"""Contention benchmark: N producer and M consumer threads.
+
+Compares BlockingQueue single-item and batched operations with the
+standard library queue.Queue."""
+import queue
+import sys
+import threading
+import time
+
+from algorithms.concurrent_queue import BlockingQueue
+from benchmarks.common import report
+
+BATCH = 64
+STOP = object()
+
+
+def run_threads(producer, consumer, producers, consumers):
+    threads = ([threading.Thread(target=producer) for _ in range(producers)]
+               + [threading.Thread(target=consumer) for _ in range(consumers)])
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads[:producers]:
+        thread.join()
+    return start, threads[producers:]
+
+
+def single_items(make_queue, put, get, n, producers, consumers):
+    work = make_queue()
+
+    def producer():
+        for i in range(n // producers):
+            put(work, i)
+
+    def consumer():
+        while get(work) is not STOP:
+            pass
+
+    start, consumer_threads = run_threads(producer, consumer, producers, consumers)
+    for _ in range(consumers):
+        put(work, STOP)
+    for thread in consumer_threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def batches(n, producers, consumers):
+    work = BlockingQueue(1024)
+
+    def producer():
+        items = list(range(BATCH))
+        for _ in range(n // producers // BATCH):
+            work.put_many(items)
+
+    def consumer():
+        while True:
+            stops = work.get_many(BATCH).count(STOP)
+            if stops:
+                # leave the other stop signals to the other consumers
+                work.put_many([STOP] * (stops - 1))
+                return
+
+    start, consumer_threads = run_threads(producer, consumer, producers, consumers)
+    for _ in range(consumers):
+        work.put(STOP)
+    for thread in consumer_threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main(n=200_000):
+    rows = []
+    for producers, consumers in ((1, 1), (4, 1), (1, 4), (4, 4)):
+        blocking = single_items(lambda: BlockingQueue(1024), BlockingQueue.put,
+                                BlockingQueue.get, n, producers, consumers)
+        stdlib = single_items(lambda: queue.Queue(1024), queue.Queue.put,
+                              queue.Queue.get, n, producers, consumers)
+        batched = batches(n, producers, consumers)
+        rows.append((f"{producers} producers/{consumers} consumers",
+                     f"{n / blocking:,.0f}/s put/get",
+                     f"{n / batched:,.0f}/s batched",
+                     f"{n / stdlib:,.0f}/s queue.Queue"))
+    report(f"items through a 1024-slot queue, n={n:,}", rows)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
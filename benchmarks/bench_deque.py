@@ -0,0 +1,48 @@
+"""Circular-array Deque vs linked deques and collections.deque."""
+import collections
+import sys
+
+from algorithms.deque import Deque, DLLDeque, PooledDeque
+from benchmarks.common import best_time, report
+
+
+class StdDeque(collections.deque):
+    """collections.deque under the algorithms.deque method names"""
+    add_first = collections.deque.appendleft
+    add_last = collections.deque.append
+    remove_first = collections.deque.popleft
+    remove_last = collections.deque.pop
+
+
+def push_pop_both_ends(cls, n):
+    deque = cls()
+    for i in range(n):
+        deque.add_last(i)
+        deque.add_first(i)
+    for _ in range(n):
+        deque.remove_last()
+        deque.remove_first()
+
+
+def remove_last_heavy(cls, n):
+    """Sliding-window style: mostly add_last followed by remove_last"""
+    deque = cls()
+    for i in range(n):
+        deque.add_last(i)
+        deque.add_last(i)
+        deque.remove_last()
+    for _ in range(n):
+        deque.remove_last()
+
+
+def main(n=200_000):
+    rows = []
+    for cls in (Deque, DLLDeque, PooledDeque, StdDeque):
+        rows.append((cls.__name__,
+                     f"{4 * n / best_time(push_pop_both_ends, cls, n):,.0f} ops/s",
+                     f"{4 * n / best_time(remove_last_heavy, cls, n):,.0f} ops/s"))
+    report(f"both ends / remove_last heavy, n={n:,}", rows)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
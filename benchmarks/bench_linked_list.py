@@ -0,0 +1,57 @@
+"""Dataclass nodes vs NodePool backed containers: memory and throughput."""
+import sys
+
+from algorithms.deque import DLLDeque, PooledDeque
+from algorithms.queue import PooledQueue, Queue
+from benchmarks.common import best_time, peak_memory, report
+
+
+def fill_queue(cls, n):
+    queue = cls()
+    for i in range(n):
+        queue.enqueue(i)
+    return queue
+
+
+def churn_queue(cls, n):
+    queue = fill_queue(cls, n)
+    for i in range(n):
+        queue.dequeue()
+        queue.enqueue(i)
+    for _ in range(n):
+        queue.dequeue()
+
+
+def fill_deque(cls, n):
+    deque = cls()
+    for i in range(n // 2):
+        deque.add_first(i)
+        deque.add_last(i)
+    return deque
+
+
+def churn_deque(cls, n):
+    deque = fill_deque(cls, n)
+    for i in range(n // 2):
+        deque.remove_first()
+        deque.add_last(i)
+        deque.remove_last()
+        deque.add_first(i)
+
+
+def main(n=200_000):
+    rows = []
+    for cls, fill, churn in ((Queue, fill_queue, churn_queue),
+                             (PooledQueue, fill_queue, churn_queue),
+                             (DLLDeque, fill_deque, churn_deque),
+                             (PooledDeque, fill_deque, churn_deque)):
+        _, peak = peak_memory(fill, cls, n)
+        rows.append((cls.__name__,
+                     f"{peak / n:.1f} B/item",
+                     f"{n / best_time(fill, cls, n):,.0f} fill/s",
+                     f"{n / best_time(churn, cls, n):,.0f} churn/s"))
+    report(f"linked containers, n={n:,}", rows)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
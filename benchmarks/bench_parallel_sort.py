@@ -0,0 +1,24 @@
+"""parallel_sort scaling over 1..N worker processes."""
+import os
+import random
+import sys
+from array import array
+
+from algorithms.parallel_sort import parallel_sort
+from benchmarks.common import best_time, report
+
+
+def main(n=1_000_000, max_workers=None):
+    max_workers = max_workers or os.cpu_count() or 1
+    numbers = array('d', (random.random() for _ in range(n)))
+    records = [(random.randrange(n), str(i)) for i in range(n)]
+    rows = []
+    for workers in range(1, max_workers + 1):
+        rows.append((f"{workers} worker(s)",
+                     f"{best_time(parallel_sort, numbers, workers, repeat=1):.2f} s array('d')",
+                     f"{best_time(parallel_sort, records, workers, repeat=1):.2f} s tuples"))
+    report(f"parallel_sort, n={n:,}", rows)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
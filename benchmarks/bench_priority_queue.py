@@ -0,0 +1,61 @@
+"""MinPQ (binary and 4-ary) vs heapq on random, sorted and adversarial keys."""
+import heapq
+import random
+import sys
+
+from algorithms.priority_queue import MinPQ
+from benchmarks.common import best_time, report
+
+
+def distributions(n):
+    keys = list(range(n))
+    random.shuffle(keys)
+    return {
+        'random': keys,
+        'sorted': list(range(n)),
+        # every insertion swims all the way up to the root
+        'adversarial': list(range(n, 0, -1)),
+    }
+
+
+def minpq_inserts(keys, arity):
+    pq = MinPQ(arity=arity)
+    for key in keys:
+        pq.insert(key)
+    pq.pop_many(len(keys))
+
+
+def minpq_bulk(keys, arity):
+    MinPQ(keys, arity=arity).pop_many(len(keys))
+
+
+def heapq_pushes(keys):
+    heap = []
+    for key in keys:
+        heapq.heappush(heap, key)
+    for _ in range(len(keys)):
+        heapq.heappop(heap)
+
+
+def heapq_bulk(keys):
+    heap = list(keys)
+    heapq.heapify(heap)
+    for _ in range(len(keys)):
+        heapq.heappop(heap)
+
+
+def main(n=100_000):
+    for name, keys in distributions(n).items():
+        rows = [
+            ('MinPQ insert+pop', f"{best_time(minpq_inserts, keys, 2):.3f} s"),
+            ('MinPQ bulk+pop', f"{best_time(minpq_bulk, keys, 2):.3f} s"),
+            ('MinPQ 4-ary insert+pop', f"{best_time(minpq_inserts, keys, 4):.3f} s"),
+            ('MinPQ 4-ary bulk+pop', f"{best_time(minpq_bulk, keys, 4):.3f} s"),
+            ('heapq push+pop', f"{best_time(heapq_pushes, keys):.3f} s"),
+            ('heapq heapify+pop', f"{best_time(heapq_bulk, keys):.3f} s"),
+        ]
+        report(f"{name} keys, n={n:,}", rows)
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
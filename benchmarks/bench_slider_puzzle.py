@@ -0,0 +1,68 @@
+"""Heuristic evaluations per solve: comparing nodes vs priorities in MinPQ.
+
+Before: SearchNode.__gt__ recomputed Board.manhattan() on every heap
+comparison. After: MinPQ computes the priority once per insertion."""
+
+from algorithms.priority_queue import MinPQ
+from benchmarks.common import best_time, report
+from exercises.slider_puzzle import Board, SearchNode, Solver
+
+PUZZLES = [
+    [[0, 1, 3], [4, 2, 5], [7, 8, 6]],
+    [[1, 2, 3], [0, 7, 6], [5, 4, 8]],
+    [[8, 1, 3], [4, 0, 2], [7, 6, 5]],
+    [[1, 2, 3, 4], [5, 6, 0, 8], [9, 10, 7, 11], [13, 14, 15, 12]],
+]
+
+
+class ComparedSearchNode(SearchNode):
+    """SearchNode ordered by comparisons, as before the key= support"""
+    def __gt__(self, other):
+        return (self.moves + self.board.manhattan()
+                > other.moves + other.board.manhattan())
+
+
+def solve_comparing_nodes(board):
+    boards_pq = MinPQ()
+    boards_pq.insert(ComparedSearchNode(board))
+    while True:
+        node = boards_pq.del_min()
+        if node.board.is_goal():
+            return node
+        for neighbor in node.board.neighbors():
+            if node.prev_node and neighbor == node.prev_node.board:
+                continue
+            boards_pq.insert(ComparedSearchNode(neighbor, node.moves + 1, node))
+
+
+def count_manhattan_calls(solve, tiles):
+    calls = 0
+    manhattan = Board.manhattan
+
+    def counting_manhattan(board):
+        nonlocal calls
+        calls += 1
+        return manhattan(board)
+
+    Board.manhattan = counting_manhattan
+    try:
+        solve(Board(tiles))
+    finally:
+        Board.manhattan = manhattan
+    return calls
+
+
+def main():
+    rows = []
+    for tiles in PUZZLES:
+        label = "/".join("".join(map(str, row)) for row in tiles)
+        rows.append((label,
+                     count_manhattan_calls(solve_comparing_nodes, tiles),
+                     count_manhattan_calls(lambda b: Solver(b, heuristic=Board.manhattan).solution(), tiles),
+                     f"{best_time(solve_comparing_nodes, Board(tiles)):.4f} s",
+                     f"{best_time(lambda: Solver(Board(tiles)).solution()):.4f} s"))
+    report("manhattan() calls and time: compared nodes vs keyed MinPQ", rows)
+
+
+if __name__ == '__main__':
+    main()
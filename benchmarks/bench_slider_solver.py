@@ -0,0 +1,59 @@
+"""Solver algorithms and heuristics on the puzzle corpus.
+
+Pass "hard" to include the 4x4 puzzles needing 40+ moves (IDA* only) and
+"pdb" to add IDA* with the pattern database heuristic (built and cached on
+first use, which takes a couple of minutes for 4x4)."""
+import sys
+import time
+
+from benchmarks.common import report
+from benchmarks.slider_puzzle_corpus import HARD_PUZZLES, PUZZLES
+from exercises.pattern_database import PatternDatabase
+from exercises.slider_puzzle import Board, Solver
+
+CONFIGURATIONS = [
+    ("astar", "manhattan"),
+    ("astar", "linear_conflict"),
+    ("idastar", "manhattan"),
+    ("idastar", "linear_conflict"),
+]
+
+
+def solve(tiles, optimal, algorithm, heuristic):
+    solver = Solver(Board(tiles), algorithm, heuristic)
+    start = time.perf_counter()
+    moves = solver.moves_to_solve()
+    elapsed = time.perf_counter() - start
+    if moves != optimal:
+        raise AssertionError(f"{tiles}: {moves} moves instead of {optimal}")
+    return f"{solver.expanded:,} / {elapsed:.2f}s"
+
+
+def main(*options):
+    databases = {}
+
+    def pdb_result(tiles, optimal):
+        if len(tiles) not in databases:
+            databases[len(tiles)] = PatternDatabase.cached(len(tiles))
+        return ("idastar pdb", solve(tiles, optimal, "idastar", databases[len(tiles)]))
+
+    for tiles, optimal in PUZZLES:
+        configurations = CONFIGURATIONS
+        if len(tiles) > 3 and optimal > 30:
+            configurations = [c for c in CONFIGURATIONS if c != ("astar", "manhattan")]
+        results = [(f"{algorithm} {heuristic}", solve(tiles, optimal, algorithm, heuristic))
+                   for algorithm, heuristic in configurations]
+        if "pdb" in options:
+            results.append(pdb_result(tiles, optimal))
+        report(f"{len(tiles)}x{len(tiles)} board, {optimal} moves (expanded / time)", results)
+    if "hard" in options:
+        for tiles, optimal in HARD_PUZZLES:
+            results = [("idastar linear_conflict",
+                        solve(tiles, optimal, "idastar", "linear_conflict"))]
+            if "pdb" in options:
+                results.append(pdb_result(tiles, optimal))
+            report(f"{len(tiles)}x{len(tiles)} board, {optimal} moves (expanded / time)", results)
+
+
+if __name__ == '__main__':
+    main(*sys.argv[1:])
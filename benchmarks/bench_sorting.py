@@ -0,0 +1,47 @@
+"""Sorting engines on random and partially sorted, production-like data."""
+import random
+import sys
+
+from algorithms.quicksort import quicksort
+from algorithms.sorting import mergesort, natural_mergesort
+from benchmarks.common import best_time, report
+
+
+def distributions(n):
+    nearly_sorted = list(range(n))
+    for _ in range(n // 100):
+        i, j = random.randrange(n), random.randrange(n)
+        nearly_sorted[i], nearly_sorted[j] = nearly_sorted[j], nearly_sorted[i]
+    # daily batches appended to an already sorted log
+    batches = []
+    for _ in range(20):
+        batches.extend(sorted(random.random() for _ in range(n // 20)))
+    return {
+        'random': [random.random() for _ in range(n)],
+        'sorted': list(range(n)),
+        'reversed': list(range(n, 0, -1)),
+        'nearly sorted (1% swaps)': nearly_sorted,
+        'sorted batches (20 runs)': batches,
+        'sorted + random tail': sorted(random.random() for _ in range(n - n // 10))
+                                + [random.random() for _ in range(n // 10)],
+    }
+
+
+def run(sort, data):
+    sort(list(data))
+
+
+def main(n=100_000):
+    sorts = {
+        'natural_mergesort': natural_mergesort,
+        'mergesort': mergesort,
+        'quicksort': quicksort,
+        'builtin sorted': sorted,
+    }
+    for name, data in distributions(n).items():
+        report(f"{name}, n={n:,}",
+               [(label, f"{best_time(run, sort, data):.3f} s") for label, sort in sorts.items()])
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
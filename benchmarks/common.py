@@ -0,0 +1,37 @@
+"""Small helpers shared by the benchmark scripts.
+
+Run any benchmark from the repository root, e.g.::
+
+    python -m benchmarks.bench_linked_list
+"""
+import time
+import tracemalloc
+
+
+def best_time(func, *args, repeat=3):
+    """Return the best wall time in seconds out of `repeat` calls"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def peak_memory(func, *args):
+    """Return (result, peak bytes allocated by python) of a single call"""
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def report(title, rows):
+    """Print rows of (label, value...) as an aligned table"""
+    print(title)
+    for label, *values in rows:
+        print(f"  {label:<28}" + "".join(f" {value:>18}" for value in values))
+    print()
@@ -0,0 +1,437 @@
+"""Benchmark harness over the algorithms and exercises modules.
+
+    python -m benchmarks.harness [--quick] [--only GROUP] [--output FILE]
+                                 [--baseline FILE] [--threshold 0.1]
+
+Every case runs on each of its input distributions and reports:
+
+* ops/sec: elements (or operations) processed per second, best of --repeat
+* comparisons, swaps, array writes and the deepest union-find path or
+  longest heap sift, counted by algorithms.instrumentation in a separate
+  run (sorts, priority queues and union-finds)
+* peak memory allocated by Python during one run, from tracemalloc
+
+Results are saved as JSON. With --baseline, every case whose ops/sec fell
+by more than --threshold against the baseline file is listed as a
+regression and the exit status is 1. `make bench` compares a run with
+benchmarks/results/baseline.json, which `make bench-baseline` writes.
+"""
+from dataclasses import dataclass
+from typing import Callable, Sequence
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from algorithms.concurrent_queue import BlockingQueue, ConcurrentStack
+from algorithms.deque import Deque, DLLDeque, PooledDeque
+from algorithms.instrumentation import instrument, wrap
+from algorithms.priority_queue import IndexMinPQ, MinPQ
+from algorithms.queue import ArrayQueue, PooledQueue, Queue
+from algorithms.quicksort import quicksort
+from algorithms.shared_queue import SharedRingQueue, shared_memory
+from algorithms.sorting import insertin_sort, mergesort, natural_mergesort, selection_sort, shellsort
+from algorithms.stack import ArrayStack
+from algorithms.union_find import (ArrayWeightedQuickUnionUF, KeyedUF, QuickUnionUF, RollbackUF,
+                                   WeightedQuickUnionUF)
+from benchmarks.common import report
+from benchmarks.slider_puzzle_corpus import PUZZLES
+from exercises.caesar_cipher import CaesarCipher
+from exercises.collinear_points import CollinearEngine, Point
+from exercises.matching_delimiters import validate
+from exercises.slider_puzzle import Board, Solver
+
+SIZE = 20_000  # elements per run, quadratic cases use SIZE // 10
+QUICK_FACTOR = 10  # --quick divides every size by that
+REGRESSION_THRESHOLD = 0.10
+DEFAULT_DISTRIBUTIONS = ("random", "sorted", "reversed", "few-unique")
+
+
+# -- input distributions ----------------------------------------------------
+
+def _random(n, rng):
+    return [rng.randrange(n * 4) for _ in range(n)]
+
+
+def _few_unique(n, rng):
+    return [rng.randrange(8) for _ in range(n)]
+
+
+def antiquicksort(sort, n):
+    """Return an input of n ints on which sort does as many comparisons as
+    McIlroy's adversary can force.
+
+    The adversary decides comparisons lazily: all values start as "gas",
+    and when two gas items are compared one of them (preferably the
+    current pivot candidate) is frozen to the next smallest value. Since
+    the sort is deterministic, feeding it the frozen values replays the
+    same bad comparisons."""
+    gas = n
+    values = [gas] * n
+    frozen = 0
+    candidate = 0
+
+    class Adversary:
+        __slots__ = ("index",)
+
+        def __init__(self, index):
+            self.index = index
+
+        def _compare(self, other):
+            nonlocal frozen, candidate
+            x, y = self.index, other.index
+            if values[x] == gas and values[y] == gas:
+                if x == candidate:
+                    values[x] = frozen
+                else:
+                    values[y] = frozen
+                frozen += 1
+            if values[x] == gas:
+                candidate = x
+            elif values[y] == gas:
+                candidate = y
+            return values[x] - values[y]
+
+        def __lt__(self, other):
+            return self._compare(other) < 0
+
+        def __gt__(self, other):
+            return self._compare(other) > 0
+
+        def __le__(self, other):
+            return self._compare(other) <= 0
+
+        def __ge__(self, other):
+            return self._compare(other) >= 0
+
+    sort([Adversary(i) for i in range(n)])
+    return values
+
+
+_adversarial_inputs = {}
+
+
+def _adversarial(n, rng):
+    if n not in _adversarial_inputs:
+        _adversarial_inputs[n] = antiquicksort(quicksort, n)
+    return list(_adversarial_inputs[n])
+
+
+DISTRIBUTIONS = {
+    "random": _random,
+    "sorted": lambda n, rng: sorted(_random(n, rng)),
+    "reversed": lambda n, rng: sorted(_random(n, rng), reverse=True),
+    "few-unique": _few_unique,
+    "adversarial": _adversarial,
+}
+
+
+# -- cases ------------------------------------------------------------------
+
+@dataclass
+class Case:
+    """One benchmarked operation.
+
+    prepare(data) builds a fresh argument from the distribution data (kept
+    out of the timing), run(argument) is timed and ops(argument) gives the
+    number of operations one run does. counted cases run once more under
+    instrument(), wrapped ones over wrap()ped elements so that their
+    comparisons are counted too. Cases whose prepare() ignores the data,
+    such as a fixed corpus, are not sized and report ops() as their n."""
+    group: str
+    name: str
+    prepare: Callable
+    run: Callable
+    distributions: Sequence[str] = DEFAULT_DISTRIBUTIONS
+    size_factor: float = 1.0
+    ops: Callable = len
+    counted: bool = False
+    wrapped: bool = False
+    sized: bool = True
+
+
+def _sort_case(name, sort, distributions=DEFAULT_DISTRIBUTIONS, size_factor=1.0):
+    return Case("sorting", name, list, sort, distributions, size_factor,
+                counted=True, wrapped=True)
+
+
+def _twice(items):
+    return 2 * len(items)
+
+
+def _drain_pq(items):
+    pq = MinPQ()
+    for item in items:
+        pq.insert(item)
+    while not pq.is_empty():
+        pq.del_min()
+
+
+def _heapify_pq(items):
+    pq = MinPQ(items)
+    while not pq.is_empty():
+        pq.del_min()
+
+
+def _drain_index_pq(items):
+    pq = IndexMinPQ()
+    for key, item in enumerate(items):
+        pq.insert(key, item)
+    while not pq.is_empty():
+        pq.del_min()
+
+
+def _union_pairs(data):
+    """Link the sites of consecutive values over len(data) sites: random
+    data links random sites, sorted and reversed data build long chains,
+    few-unique data repeats unions among a handful of sites"""
+    n = len(data)
+    return n, [(data[i - 1] % n, data[i] % n) for i in range(n)]
+
+
+def _union_case(name, factory, size_factor=1.0):
+    def run(prepared):
+        n, pairs = prepared
+        uf = factory(n)
+        for p, q in pairs:
+            uf.union(p, q)
+        for p, q in pairs:
+            uf.connected(q, p)
+    return Case("union_find", name, _union_pairs, run, size_factor=size_factor,
+                ops=lambda prepared: 2 * prepared[0], counted=True)
+
+
+def _fifo(factory, put, get):
+    def run(items):
+        container = factory(len(items))
+        for item in items:
+            put(container, item)
+        for _ in items:
+            get(container)
+    return run
+
+
+def _queue_case(name, factory, put, get):
+    return Case("queues", name, list, _fifo(factory, put, get), ("random",),
+                ops=_twice)
+
+
+def _shared_ring(items):
+    queue = SharedRingQueue.create(8 * len(items), record_size=8)
+    try:
+        for item in items:
+            queue.enqueue(item.to_bytes(8, "little"))
+        for _ in items:
+            queue.dequeue()
+    finally:
+        queue.close()
+        queue.unlink()
+
+
+def _board_tiles(data):
+    return [tiles for tiles, _ in PUZZLES if len(tiles) == 3]
+
+
+def _solve_boards(boards):
+    for tiles in boards:
+        Solver(Board(tiles), "idastar", "linear_conflict").moves_to_solve()
+
+
+def _points(data):
+    return [Point(x, y) for x, y in {(value % 256, value // 256 % 256) for value in data}]
+
+
+def _text(data):
+    words = ["the", "eagle", "is", "in", "play", "meet", "at", "joe's", "Quick", "BROWN"]
+    return " ".join(words[value % len(words)] for value in data) * 5
+
+
+def _nested(data):
+    return "".join("([{"[value % 3] for value in data) + "".join(
+        ")]}"[value % 3] for value in reversed(data))
+
+
+CASES = [
+    _sort_case("selection_sort", selection_sort, size_factor=0.1),
+    _sort_case("insertion_sort", insertin_sort, size_factor=0.1),
+    _sort_case("shellsort", shellsort),
+    _sort_case("mergesort", mergesort),
+    _sort_case("natural_mergesort", natural_mergesort),
+    _sort_case("quicksort", quicksort, DEFAULT_DISTRIBUTIONS + ("adversarial",)),
+    Case("priority_queue", "MinPQ insert/del_min", list, _drain_pq, ops=_twice, counted=True),
+    Case("priority_queue", "MinPQ heapify/del_min", list, _heapify_pq, counted=True),
+    Case("priority_queue", "IndexMinPQ insert/del_min", list, _drain_index_pq, ops=_twice,
+         counted=True, wrapped=True),
+    _union_case("QuickUnionUF", QuickUnionUF, size_factor=0.1),
+    _union_case("WeightedQuickUnionUF", WeightedQuickUnionUF),
+    _union_case("ArrayWeightedQuickUnionUF", ArrayWeightedQuickUnionUF),
+    _union_case("KeyedUF", lambda n: KeyedUF(range(n))),
+    _union_case("RollbackUF", RollbackUF),
+    _queue_case("Queue", lambda n: Queue(), Queue.enqueue, Queue.dequeue),
+    _queue_case("PooledQueue", lambda n: PooledQueue(), PooledQueue.enqueue, PooledQueue.dequeue),
+    _queue_case("ArrayQueue", lambda n: ArrayQueue(), ArrayQueue.enqueue, ArrayQueue.dequeue),
+    _queue_case("BlockingQueue", BlockingQueue, BlockingQueue.put, BlockingQueue.get),
+    _queue_case("ArrayStack", lambda n: ArrayStack(), ArrayStack.push, ArrayStack.pop),
+    _queue_case("ConcurrentStack", lambda n: ConcurrentStack(), ConcurrentStack.push,
+                ConcurrentStack.pop),
+    _queue_case("Deque", lambda n: Deque(), Deque.add_last, Deque.remove_first),
+    _queue_case("DLLDeque", lambda n: DLLDeque(), DLLDeque.add_last, DLLDeque.remove_first),
+    _queue_case("PooledDeque", lambda n: PooledDeque(), PooledDeque.add_first,
+                PooledDeque.remove_last),
+    # shared memory needs Python 3.8
+    *([Case("queues", "SharedRingQueue", list, _shared_ring, ("random",), ops=_twice)]
+      if shared_memory is not None else []),
+    Case("exercises", "slider_puzzle 3x3 corpus", _board_tiles, _solve_boards, ("random",),
+         sized=False),
+    Case("exercises", "CollinearEngine", _points, lambda points: CollinearEngine(
+        points).number_of_segments(), ("random", "few-unique"), size_factor=0.1),
+    Case("exercises", "CaesarCipher encrypt+crack", _text, lambda text: CaesarCipher.crack(
+        CaesarCipher(7).encrypt(text)), ("random",)),
+    Case("exercises", "matching_delimiters validate", _nested, validate, ("random",)),
+]
+
+
+# -- running ----------------------------------------------------------------
+
+@dataclass
+class Result:
+    group: str
+    case: str
+    distribution: str
+    n: int
+    seconds: float
+    ops_per_sec: float
+    peak_bytes: int
+    comparisons: int = None
+    swaps: int = None
+    writes: int = None
+    max_depth: int = None  # deepest union-find path or longest heap sift
+    calls: dict = None  # algorithms.instrumentation CallStats by function
+
+    @property
+    def key(self):
+        return f"{self.group}/{self.case}/{self.distribution}/{self.n}"
+
+
+def run_case(case, distribution, size, repeat, seed=42):
+    n = max(1, int(size * case.size_factor))
+    data = DISTRIBUTIONS[distribution](n, random.Random(seed))
+    best = float("inf")
+    for _ in range(repeat):
+        argument = case.prepare(data)
+        start = time.perf_counter()
+        case.run(argument)
+        best = min(best, time.perf_counter() - start)
+    argument = case.prepare(data)
+    ops = case.ops(argument)
+    tracemalloc.start()
+    try:
+        case.run(argument)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    result = Result(case.group, case.name, distribution, n if case.sized else ops, best,
+                    ops / best if best else float("inf"), peak)
+    if case.counted:
+        with instrument() as counters:
+            case.run(wrap(case.prepare(data)) if case.wrapped else case.prepare(data))
+        result.comparisons = counters.comparisons
+        result.swaps = counters.swaps
+        result.writes = counters.array_writes
+        result.max_depth = max((stats.max for stats in counters.calls.values()), default=None)
+        result.calls = counters.as_dict()["calls"]
+    return result
+
+
+def run_all(cases, size, repeat):
+    results = []
+    for case in cases:
+        for distribution in case.distributions:
+            results.append(run_case(case, distribution, size, repeat))
+    return results
+
+
+def print_results(results):
+    groups = {}
+    for result in results:
+        groups.setdefault((result.group, result.distribution), []).append(result)
+    for (group, distribution), rows in groups.items():
+        report(f"{group}, {distribution} (n, ops/sec, comparisons, swaps, writes, "
+               "max depth/sift, peak memory)",
+               [(result.case, f"{result.n:,}", f"{result.ops_per_sec:,.0f}",
+                 *("-" if count is None else f"{count:,}" for count in (
+                     result.comparisons, result.swaps, result.writes, result.max_depth)),
+                 f"{result.peak_bytes / 1024:,.0f} KiB") for result in rows])
+
+
+def save_results(results, path, quick):
+    document = {
+        "meta": {
+            "date": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "quick": quick,
+        },
+        "results": {result.key: result.__dict__ for result in results},
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as results_file:
+        json.dump(document, results_file, indent=1, sort_keys=True)
+
+
+def find_regressions(results, baseline_path, threshold=REGRESSION_THRESHOLD):
+    """Return (key, baseline ops/sec, ops/sec) of the results more than
+    threshold slower than in the baseline file"""
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)["results"]
+    regressions = []
+    for result in results:
+        before = baseline.get(result.key)
+        if before and result.ops_per_sec < before["ops_per_sec"] * (1 - threshold):
+            regressions.append((result.key, before["ops_per_sec"], result.ops_per_sec))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the benchmark suite")
+    parser.add_argument("--quick", action="store_true",
+                        help=f"divide input sizes by {QUICK_FACTOR}")
+    parser.add_argument("--size", type=int, default=SIZE)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", action="append", default=[],
+                        help="run only this group or case (repeatable)")
+    parser.add_argument("--output", default=None, help="save the results as JSON")
+    parser.add_argument("--baseline", default=None, help="JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD,
+                        help="relative ops/sec drop reported as a regression")
+    args = parser.parse_args(argv)
+
+    size = args.size // QUICK_FACTOR if args.quick else args.size
+    cases = [case for case in CASES
+             if not args.only or case.group in args.only or case.name in args.only]
+    results = run_all(cases, size, args.repeat)
+    print_results(results)
+    if args.output:
+        save_results(results, args.output, args.quick)
+        print(f"Results saved to {args.output}")
+    if args.baseline:
+        if not os.path.exists(args.baseline):
+            print(f"No baseline at {args.baseline}, nothing to compare")
+            return 0
+        regressions = find_regressions(results, args.baseline, args.threshold)
+        report(f"{len(regressions)} regressions over {args.threshold:.0%} "
+               "(baseline ops/sec, ops/sec)",
+               [(key, f"{before:,.0f}", f"{after:,.0f}") for key, before, after in regressions])
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
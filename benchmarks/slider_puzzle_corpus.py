@@ -0,0 +1,24 @@
+"""Slider puzzles with their known optimal number of moves.
+
+The two 31-move 3x3 boards are the hardest 8-puzzles there are; the others
+come from random walks away from the goal, solved with IDA* and the linear
+conflict heuristic."""
+
+PUZZLES = [
+    ([[1, 2, 3], [4, 0, 5], [7, 8, 6]], 2),
+    ([[3, 7, 5], [1, 0, 4], [2, 8, 6]], 18),
+    ([[8, 5, 0], [3, 7, 6], [1, 2, 4]], 24),
+    ([[0, 4, 2], [5, 3, 8], [6, 7, 1]], 24),
+    ([[4, 7, 6], [1, 8, 3], [0, 2, 5]], 26),
+    ([[8, 6, 7], [2, 5, 4], [3, 0, 1]], 31),
+    ([[6, 4, 7], [8, 5, 0], [3, 2, 1]], 31),
+    ([[1, 2, 7, 3], [5, 0, 4, 8], [9, 10, 14, 6], [13, 11, 12, 15]], 18),
+    ([[2, 9, 3, 4], [1, 14, 10, 7], [0, 13, 11, 12], [6, 5, 15, 8]], 30),
+    ([[5, 1, 11, 6], [15, 13, 3, 2], [14, 9, 0, 4], [10, 12, 7, 8]], 38),
+]
+
+# minutes of pure Python search each, only run on request
+HARD_PUZZLES = [
+    ([[2, 5, 4, 11], [14, 1, 15, 6], [0, 10, 3, 12], [13, 8, 9, 7]], 42),
+    ([[6, 7, 1, 14], [3, 10, 11, 8], [0, 2, 15, 12], [5, 4, 9, 13]], 48),
+]
@@ -1,30 +1,106 @@
-class CaesarCipher:
+from collections import Counter
+import math
+import string
+
+ALPHABET = string.ascii_uppercase
+CHUNK_SIZE = 1 << 16  # characters (or bytes) translated per stream read
+SAMPLE_SIZE = 1 << 14  # prefix of the ciphertext the cracker looks at
+
+# relative frequencies of A..Z in English text
+ENGLISH_FREQUENCIES = [
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+]
+_LOG_FREQUENCIES = [math.log(frequency) for frequency in ENGLISH_FREQUENCIES]
+
+
+class SubstitutionCipher:
+    """Monoalphabetic substitution cipher.
+
+    key is the 26 letters the plain letters A..Z turn into. Both cases are
+    substituted, everything else is left alone. Translation tables for str
+    and bytes are built once, so encrypt/decrypt are a single translate()
+    call and work on either type."""
+
+    def __init__(self, key):
+        key = key.upper()
+        if sorted(key) != list(ALPHABET):
+            raise ValueError("The key must be a permutation of the 26 letters")
+        self._forward = key
+        self._backward = ''.join(ALPHABET[key.index(letter)] for letter in ALPHABET)
+        plain = ALPHABET + ALPHABET.lower()
+        coded = key + key.lower()
+        self._encoder = (str.maketrans(plain, coded),
+                         bytes.maketrans(plain.encode(), coded.encode()))
+        self._decoder = (str.maketrans(coded, plain),
+                         bytes.maketrans(coded.encode(), plain.encode()))
+
+    def encrypt(self, decoded_str):
+        return self._transform(decoded_str, self._encoder)
+
+    def decrypt(self, encoded_str):
+        return self._transform(encoded_str, self._decoder)
+
+    def encrypt_stream(self, source, target, chunk_size=CHUNK_SIZE):
+        """Encrypt source into target chunk by chunk; return the count of
+        characters (or bytes) written.
+
+        source and target are text or binary file objects, or mmaps."""
+        return self._transform_stream(source, target, self._encoder, chunk_size)
+
+    def decrypt_stream(self, source, target, chunk_size=CHUNK_SIZE):
+        """Decrypt source into target, see encrypt_stream()"""
+        return self._transform_stream(source, target, self._decoder, chunk_size)
+
+    @staticmethod
+    def _transform(original, tables):
+        str_table, bytes_table = tables
+        if isinstance(original, str):
+            return original.translate(str_table)
+        return bytes(original).translate(bytes_table)
+
+    def _transform_stream(self, source, target, tables, chunk_size):
+        written = 0
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return written
+            target.write(self._transform(chunk, tables))
+            written += len(chunk)
+
+
+class CaesarCipher(SubstitutionCipher):
     """Class for doing encryption and decryption using Caesar cipher"""
 
     def __init__(self, shift):
         """Construct Caesar cipher using given integer shift for rotation"""
-        alphabet_size = 26
-        encoder = [None] * alphabet_size
-        decoder = [None] * alphabet_size
-        for i in range(alphabet_size):
-            encoder[i] = chr((i + shift) % alphabet_size + ord("A"))
-            decoder[i] = chr((i - shift) % alphabet_size + ord("A"))
-        self._forward = ''.join(encoder)
-        self._backward = ''.join(decoder)
+        self.shift = shift % len(ALPHABET)
+        super().__init__(ALPHABET[self.shift:] + ALPHABET[:self.shift])
 
-    def encrypt(self, decoded_str):
-        return self._transform(decoded_str, self._forward)
+    @classmethod
+    def crack(cls, encoded, sample_size=SAMPLE_SIZE):
+        """Return the cipher that most likely produced encoded (str or bytes)"""
+        return cls(best_shift(encoded, sample_size))
 
-    def decrypt(self, encoded_str):
-        return self._transform(encoded_str, self._backward)
 
-    def _transform(self, original, code):
-        msg = list(original)
-        for k in range(len(msg)):
-            if msg[k].isupper():
-                j = ord(msg[k]) - ord('A')
-                msg[k] = code[j]
-        return ''.join(msg)
+def best_shift(encoded, sample_size=SAMPLE_SIZE):
+    """Guess the Caesar shift of English text by frequency analysis.
+
+    Letters of the first sample_size characters are counted in one Counter
+    pass, then every shift is scored by the log-likelihood of the plain
+    letters it implies under English letter frequencies."""
+    sample = encoded[:sample_size]
+    if not isinstance(sample, str):
+        sample = bytes(sample).decode("latin-1")
+    counts = Counter(sample.upper())
+    observed = [counts[letter] for letter in ALPHABET]
+
+    def log_likelihood(shift):
+        return sum(observed[(i + shift) % len(ALPHABET)] * weight
+                   for i, weight in enumerate(_LOG_FREQUENCIES))
+
+    return max(range(len(ALPHABET)), key=log_likelihood)
 
 
 if __name__ == '__main__':
@@ -34,3 +110,4 @@ if __name__ == '__main__':
     print("Secret: ", coded)
     answer = cipher.decrypt(coded)
     print("Message: ", answer)
+    print("Cracked shift: ", CaesarCipher.crack(coded).shift)
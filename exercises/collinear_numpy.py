@@ -0,0 +1,154 @@
+"""Vectorized, multi-core backend for collinear points.
+
+Points are kept as one (n, 2) int64 array of x, y rows sorted by (y, x)
+instead of Point objects. For every origin the exact reduced slopes to the
+points after it are computed as whole arrays (np.gcd, floor division),
+packed into one int64 key each and grouped by sorting. Origins are dealt
+out round-robin to worker processes, which attach to the coordinates in
+shared memory, so each worker gets a fair mix of long and short suffixes.
+Shared memory needs Python 3.8, older versions stay on one process.
+
+NumPy is optional: without it as_coordinates() returns None and callers
+stay on CollinearEngine.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+from exercises.collinear_points import LineSegment, Point
+
+MIN_PARALLEL_POINTS = 2000  # fewer points are not worth a process pool
+MAX_SPAN = 2 ** 31  # keeps the packed slope keys inside int64
+
+_shared = {}  # per worker process: the coordinates and their shared memory
+
+
+def as_coordinates(points):
+    """Return points (Points, (x, y) pairs or an (n, 2) array) as a sorted
+    (n, 2) int64 array, None without NumPy.
+
+    Raises ValueError on repeated points or coordinates spanning MAX_SPAN
+    or more."""
+    if np is None:
+        return None
+    if isinstance(points, np.ndarray):
+        coordinates = points.astype(np.int64).reshape(-1, 2)
+    else:
+        coordinates = np.array([(point.x, point.y) if isinstance(point, Point) else point
+                                for point in points], dtype=np.int64).reshape(-1, 2)
+    coordinates = coordinates[np.lexsort((coordinates[:, 0], coordinates[:, 1]))]
+    if len(coordinates):
+        repeated = np.flatnonzero(np.all(coordinates[1:] == coordinates[:-1], axis=1))
+        if len(repeated):
+            x, y = coordinates[repeated[0]]
+            raise ValueError(f"Repeated point {Point(int(x), int(y))}")
+        if int(np.ptp(coordinates)) >= MAX_SPAN:
+            raise ValueError(f"Coordinates must span less than {MAX_SPAN}")
+    return coordinates
+
+
+def _origin_groups(coordinates, origins, min_points):
+    """Return (origin, farthest point, dy, dx) rows of every slope shared by
+    min_points - 1 or more of the points after each origin"""
+    span = int(np.ptp(coordinates)) if len(coordinates) else 0
+    width = 2 * span + 1
+    groups = []
+    for i in origins:
+        deltas = coordinates[i + 1:] - coordinates[i]
+        dx, dy = deltas[:, 0], deltas[:, 1]
+        divisor = np.gcd(dx, dy)
+        dx //= divisor
+        dy //= divisor
+        # dy >= 0 and -span <= dx <= span, so this is a one-to-one packing
+        keys = dy * width + (dx + span)
+        order = np.argsort(keys)
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+        lengths = np.diff(np.append(starts, len(keys)))
+        big = lengths >= min_points - 1
+        if not big.any():
+            continue
+        # points come in order, so the biggest index of a group is its farthest point
+        for j in np.maximum.reduceat(order, starts)[big].tolist():
+            groups.append((int(i), int(i) + 1 + j, int(dy[j]), int(dx[j])))
+    return groups
+
+
+def _attach(name, size):
+    from multiprocessing import shared_memory
+    shm = shared_memory.SharedMemory(name=name)
+    _shared["shm"] = shm
+    _shared["coordinates"] = np.ndarray((size, 2), dtype=np.int64, buffer=shm.buf)
+
+
+def _shared_origin_groups(first, step, min_points):
+    coordinates = _shared["coordinates"]
+    return _origin_groups(coordinates, range(first, len(coordinates), step), min_points)
+
+
+def find_segments(coordinates, min_points=4, workers=None):
+    """Return every maximal segment through min_points or more points of a
+    sorted coordinate array as an (m, 4) array of x1, y1, x2, y2 rows"""
+    size = len(coordinates)
+    workers = workers or os.cpu_count() or 1
+    parallel = workers > 1 and size >= MIN_PARALLEL_POINTS
+    if parallel:
+        try:
+            from multiprocessing import shared_memory
+        except ImportError:  # Python 3.7
+            parallel = False
+    if not parallel:
+        groups = _origin_groups(coordinates, range(size), min_points)
+    else:
+        shm = shared_memory.SharedMemory(create=True, size=max(1, coordinates.nbytes))
+        try:
+            np.ndarray(coordinates.shape, dtype=np.int64, buffer=shm.buf)[:] = coordinates
+            with ProcessPoolExecutor(workers, initializer=_attach,
+                                     initargs=(shm.name, size)) as executor:
+                groups = [group for worker_groups in executor.map(
+                    _shared_origin_groups, range(workers), [workers] * workers,
+                    [min_points] * workers) for group in worker_groups]
+        finally:
+            shm.close()
+            shm.unlink()
+    # a line is first seen from its smallest point, later origins on it
+    # only see sub-segments
+    groups.sort()
+    segments = []
+    found_lines = set()
+    for i, j, dy, dx in groups:
+        x, y = coordinates[i]
+        line = (dy, dx, dx * int(y) - dy * int(x))
+        if line not in found_lines:
+            found_lines.add(line)
+            segments.append((i, j))
+    segments = np.array(segments, dtype=np.int64).reshape(-1, 2)
+    return np.hstack((coordinates[segments[:, 0]], coordinates[segments[:, 1]]))
+
+
+class NumpyCollinearEngine:
+    """CollinearEngine interface on top of find_segments()"""
+    def __init__(self, points, min_points=4, workers=None):
+        self.coordinates = as_coordinates(points)
+        if self.coordinates is None:
+            raise ImportError("NumpyCollinearEngine needs NumPy")
+        self.min_points = min_points
+        self.workers = workers
+        self._segments = None
+
+    def segment_array(self):
+        """Return the segments as an (m, 4) array of x1, y1, x2, y2 rows"""
+        if self._segments is None:
+            self._segments = find_segments(self.coordinates, self.min_points, self.workers)
+        return self._segments
+
+    def segments(self):
+        for x1, y1, x2, y2 in self.segment_array().tolist():
+            yield LineSegment(Point(x1, y1), Point(x2, y2))
+
+    def number_of_segments(self):
+        return len(self.segment_array())
@@ -1,5 +1,6 @@
 from functools import total_ordering
 from collections import Counter
+from operator import floordiv
 import math
 
 @total_ordering
@@ -38,23 +39,80 @@ class LineSegment:
         return f"{self.p} -> {self.q}"
 
 
+class CollinearEngine:
+    """Finds every maximal line segment through min_points or more points.
+
+    Slopes are kept as exact reduced integer fractions (dy, dx), with dy > 0
+    or dy == 0 and dx > 0, so no two distinct lines ever share a key. For
+    every origin only the points after it in (y, x) order are grouped by
+    slope; the first origin of a line is its smallest point, so its group
+    spans the whole segment, and the line (slope plus dx*y - dy*x, which
+    is the same for all its points) is remembered so that sub-segments seen
+    from later origins are skipped. Each segment is reported once.
+
+    Results are cached: segments() streams them as they are found and later
+    calls replay the cache before resuming the search."""
+    def __init__(self, points, min_points=4):
+        self.points = sorted(points)
+        for i in range(1, len(self.points)):
+            if self.points[i] == self.points[i - 1]:
+                raise ValueError(f"Repeated point {self.points[i]}")
+        self.min_points = min_points
+        self._segments = []
+        self._search = self._find_segments()
+
+    def _find_segments(self):
+        xs = [point.x for point in self.points]
+        ys = [point.y for point in self.points]
+        found_lines = set()
+        min_others = self.min_points - 1
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            # the pairs are done by map/zip/Counter, which run at C speed
+            dxs = [other_x - x for other_x in xs[i + 1:]]
+            dys = [other_y - y for other_y in ys[i + 1:]]
+            divisors = list(map(math.gcd, dxs, dys))
+            slopes = list(zip(map(floordiv, dys, divisors), map(floordiv, dxs, divisors)))
+            # a slope shared by k points makes k - 1 repeats, most origins have too few
+            if len(set(slopes)) + min_others - 1 > len(slopes):
+                continue
+            # the points come in order, so the last one of a slope is the farthest
+            farthest = dict(zip(slopes, range(i + 1, len(xs))))
+            for slope, count in Counter(slopes).items():
+                if count >= min_others:
+                    line = (slope, slope[1] * y - slope[0] * x)
+                    if line not in found_lines:
+                        found_lines.add(line)
+                        yield LineSegment(self.points[i], self.points[farthest[slope]])
+
+    def segments(self):
+        """Yield every maximal segment"""
+        i = 0
+        while True:
+            if i == len(self._segments):
+                segment = next(self._search, None)
+                if segment is None:
+                    return
+                self._segments.append(segment)
+            yield self._segments[i]
+            i += 1
+
+    def number_of_segments(self):
+        for _ in self.segments():
+            pass
+        return len(self._segments)
+
+
 class FastCollinearPoints():
+    """Segments of 4 or more collinear points, found by CollinearEngine"""
     def __init__(self, points):
-        self.points = sorted(points)
+        self._engine = CollinearEngine(points)
+        self.points = self._engine.points
 
     def number_of_segments(self):
-        number_of_segments = 0
-        for id, point in enumerate(self.points):
-            segment = find_max_line_segment(point, self.points[id:])
-            if segment:
-                number_of_segments += 1
-        return number_of_segments
+        return self._engine.number_of_segments()
 
     def segments(self):
-        for id, point in enumerate(self.points):
-            segment = find_max_line_segment(point, self.points[id:])
-            if segment:
-                yield segment
+        return self._engine.segments()
 
 def find_max_line_segment(origin_point, other_points):
     point_slopes = dict()
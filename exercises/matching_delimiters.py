@@ -1,3 +1,8 @@
+from array import array
+from dataclasses import dataclass
+from typing import Optional
+import re
+
 from algorithms.stack import ArrayStack
 
 
@@ -15,3 +20,139 @@ def is_matched(expression: str) -> bool:
             if righty.index(character) != lefty.index(S.pop()):
                 return False
     return S.is_empty()
+
+
+@dataclass
+class Mismatch:
+    """First delimiter error found by DelimiterValidator.
+
+    offset, line and column (1-based) locate the offending closer, or the
+    end of the input when openers are left unclosed. expected is the closer
+    that was due there, None for a closer with nothing open."""
+    offset: int
+    line: int
+    column: int
+    found: Optional[str]
+    expected: Optional[str]
+    opened_at: Optional[int] = None  # offset of the unmatched opener
+
+
+class DelimiterValidator:
+    """Streaming delimiter checker for str or bytes chunks of any size.
+
+    Chunks are scanned with one regex for the delimiter, quote and escape
+    characters only, open delimiters are kept as small integers in an array
+    based stack. Inside quotes delimiters are ignored and the escape
+    character hides the character after it."""
+    def __init__(self, pairs="()[]{}", quotes="", escape="\\"):
+        if len(pairs) % 2:
+            raise ValueError("pairs must list opener/closer characters in pairs")
+        self._openers, self._closers = pairs[0::2], pairs[1::2]
+        self._quotes = quotes
+        self._escape = escape if quotes else ""
+        self._specials = pairs + quotes + self._escape
+        self._pattern = re.compile(f"[{re.escape(self._specials)}]")
+        self._bytes_pattern = None  # compiled on the first bytes chunk
+        # character -> (kind, opener index); bytes scans see latin-1 codes
+        self._kinds = {}
+        for index, (opener, closer) in enumerate(zip(self._openers, self._closers)):
+            self._kinds[opener] = ("open", index)
+            self._kinds[closer] = ("close", index)
+        for quote in quotes:
+            self._kinds[quote] = ("quote", 0)
+        if self._escape:
+            self._kinds[self._escape] = ("escape", 0)
+        self._kinds.update({ord(char): kind for char, kind in list(self._kinds.items())})
+        self._stack = array('B')  # indices of the open delimiters
+        self._opened_at = array('q')  # offsets of the open delimiters
+        self._quote = None  # quote character of the string we are in
+        self._skip_to = 0  # offset of the first character not escaped
+        self.offset = 0  # characters consumed so far
+        self._line = 1
+        self._line_start = 0  # offset of the first character of self._line
+        self.mismatch: Optional[Mismatch] = None
+
+    def feed(self, chunk) -> bool:
+        """Scan the next chunk; return False once a mismatch has been found"""
+        if self.mismatch is not None:
+            return False
+        if isinstance(chunk, (bytes, bytearray)):
+            pattern = self._bytes_pattern or self._compile_bytes_pattern()
+        else:
+            pattern = self._pattern
+        kinds, stack, opened_at = self._kinds, self._stack, self._opened_at
+        base = self.offset
+        for match in pattern.finditer(chunk):
+            position = base + match.start()
+            if position < self._skip_to:
+                continue
+            kind, index = kinds[chunk[match.start()]]
+            if self._quote is not None:
+                if kind == "escape":
+                    self._skip_to = position + 2
+                elif kind == "quote" and chunk[match.start()] == self._quote:
+                    self._quote = None
+            elif kind == "open":
+                stack.append(index)
+                opened_at.append(position)
+            elif kind == "close":
+                if not stack or stack[-1] != index:
+                    expected = self._closers[stack[-1]] if stack else None
+                    self._report(chunk, match.start(), self._char(chunk[match.start()]),
+                                 expected, opened_at[-1] if stack else None)
+                    return False
+                stack.pop()
+                opened_at.pop()
+            elif kind == "quote":
+                self._quote = chunk[match.start()]
+        self._advance(chunk, len(chunk))
+        return True
+
+    def close(self) -> Optional[Mismatch]:
+        """Finish the input; return the first Mismatch or None if it is fine"""
+        if self.mismatch is None and self._stack:
+            self.mismatch = Mismatch(self.offset, self._line, self.offset - self._line_start + 1,
+                                     None, self._closers[self._stack[-1]], self._opened_at[-1])
+        return self.mismatch
+
+    def _compile_bytes_pattern(self):
+        """Compile the pattern of the specials bytes can hold, as latin-1 codes"""
+        specials = "".join(char for char in self._specials if ord(char) < 256)
+        # an empty class is invalid, (?!) never matches
+        source = f"[{re.escape(specials)}]" if specials else "(?!)"
+        self._bytes_pattern = re.compile(source.encode("latin-1"))
+        return self._bytes_pattern
+
+    @staticmethod
+    def _char(token):
+        return chr(token) if isinstance(token, int) else token
+
+    def _advance(self, chunk, end):
+        """Account for the lines of chunk[:end] and move offset past it"""
+        newline = b"\n" if isinstance(chunk, (bytes, bytearray)) else "\n"
+        lines = chunk.count(newline, 0, end)
+        if lines:
+            self._line += lines
+            self._line_start = self.offset + chunk.rfind(newline, 0, end) + 1
+        self.offset += end
+
+    def _report(self, chunk, index, found, expected, opened_at):
+        self._advance(chunk, index)
+        self.mismatch = Mismatch(self.offset, self._line, self.offset - self._line_start + 1,
+                                 found, expected, opened_at)
+
+
+def validate(chunks, pairs="()[]{}", quotes="", escape="\\") -> Optional[Mismatch]:
+    """Check a str/bytes or an iterable of chunks; return first Mismatch or None"""
+    if isinstance(chunks, (str, bytes, bytearray)):
+        chunks = [chunks]
+    validator = DelimiterValidator(pairs, quotes, escape)
+    for chunk in chunks:
+        if not validator.feed(chunk):
+            break
+    return validator.close()
+
+
+def validate_stream(stream, chunk_size=1 << 20, **options) -> Optional[Mismatch]:
+    """Check a text or binary file object, reading chunk_size at a time"""
+    return validate(iter(lambda: stream.read(chunk_size), stream.read(0)), **options)
@@ -0,0 +1,169 @@
+"""Disjoint additive pattern databases for the slider puzzle.
+
+The tiles are split into disjoint groups (patterns). For every pattern a
+retrograde breadth-first search from the goal finds, for each placement of
+the pattern tiles, the fewest moves of those tiles needed to bring them
+home, with the other tiles treated as indistinguishable and moves of
+them free. Since every move moves a tile of exactly one pattern, the sum
+over the patterns is still a lower bound of the moves to the goal, and a
+much tighter one than manhattan distance.
+
+Tables are bytearrays indexed by the pattern tile cells written in base
+n*n. They are saved to a cache file which later runs memory-map, so a
+Solver starts looking values up right away.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
+import mmap
+import os
+import struct
+import sys
+
+DEFAULT_PATTERNS = {
+    3: [(1, 2, 3, 4), (5, 6, 7, 8)],
+    4: [(1, 2, 3, 4, 5), (6, 7, 8, 9, 10), (11, 12, 13, 14, 15)],
+    5: [(1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12),
+        (13, 14, 15, 16), (17, 18, 19, 20), (21, 22, 23, 24)],
+}
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "slider_puzzle")
+
+_MAGIC = b"PDB1"
+_HEADER = struct.Struct("<4sBB")  # magic, dim, number of patterns
+_UNSEEN = 255
+
+
+class PatternDatabase:
+    """Additive pattern database heuristic; call it with a Board."""
+    def __init__(self, dim, patterns, tables, owner=None):
+        self.dim = dim
+        self.patterns = [tuple(pattern) for pattern in patterns]
+        self._tables = tables
+        self._owner = owner  # mmap the tables are views of, if any
+        self._tiles = [bytes(pattern) for pattern in self.patterns]
+
+    @classmethod
+    def build(cls, dim, patterns=None, workers=None):
+        """Generate the tables, one pattern per worker process"""
+        patterns = patterns or DEFAULT_PATTERNS[dim]
+        _check_patterns(dim, patterns)
+        if workers == 1 or len(patterns) == 1:
+            tables = [build_table(dim, pattern) for pattern in patterns]
+        else:
+            with ProcessPoolExecutor(workers) as executor:
+                tables = list(executor.map(build_table, [dim] * len(patterns), patterns))
+        return cls(dim, patterns, tables)
+
+    @classmethod
+    def cached(cls, dim, patterns=None, cache_dir=DEFAULT_CACHE_DIR, workers=None):
+        """Load the database from the cache, building and saving it first if
+        it is not there yet"""
+        patterns = patterns or DEFAULT_PATTERNS[dim]
+        digest = hashlib.sha1(repr([tuple(p) for p in patterns]).encode()).hexdigest()[:12]
+        path = os.path.join(cache_dir, f"pdb-{dim}x{dim}-{digest}.bin")
+        if not os.path.exists(path):
+            os.makedirs(cache_dir, exist_ok=True)
+            cls.build(dim, patterns, workers).save(path)
+        return cls.load(path)
+
+    def save(self, path):
+        """Write the database to path (atomically replacing it)"""
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as pdb_file:
+            pdb_file.write(_HEADER.pack(_MAGIC, self.dim, len(self.patterns)))
+            for pattern in self.patterns:
+                pdb_file.write(bytes([len(pattern)]) + bytes(pattern))
+            for table in self._tables:
+                pdb_file.write(table)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a database written by save()"""
+        with open(path, "rb") as pdb_file:
+            mapped = mmap.mmap(pdb_file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, dim, count = _HEADER.unpack_from(mapped)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not a pattern database")
+        offset = _HEADER.size
+        patterns = []
+        for _ in range(count):
+            size = mapped[offset]
+            patterns.append(tuple(mapped[offset + 1:offset + 1 + size]))
+            offset += 1 + size
+        tables = []
+        for pattern in patterns:
+            table_size = (dim * dim) ** len(pattern)
+            tables.append(memoryview(mapped)[offset:offset + table_size])
+            offset += table_size
+        return cls(dim, patterns, tables, mapped)
+
+    def __call__(self, board):
+        """Return the heuristic value of board, never below its manhattan"""
+        cells = board._cells
+        cell_count = self.dim * self.dim
+        total = 0
+        for tiles, table in zip(self._tiles, self._tables):
+            index = 0
+            for tile in reversed(tiles):
+                index = index * cell_count + cells.index(tile)
+            total += table[index]
+        return max(total, board.manhattan())
+
+
+def _check_patterns(dim, patterns):
+    tiles = [tile for pattern in patterns for tile in pattern]
+    if len(set(tiles)) != len(tiles) or not set(tiles) <= set(range(1, dim * dim)):
+        raise ValueError("Patterns must be disjoint groups of tiles 1..n*n-1")
+
+
+def build_table(dim, pattern):
+    """Return the table of one pattern as a bytearray.
+
+    0-1 breadth-first search over (blank cell, pattern tile cells) states:
+    moving a pattern tile costs 1, moving any other tile costs 0. The table
+    keeps the minimum over the blank cells."""
+    cell_count = dim * dim
+    size = len(pattern)
+    # states are blank + cell_count * (cells of the pattern tiles in base cell_count)
+    weights = [cell_count ** (k + 1) for k in range(size)]
+    moves = [[cell + step for step, ok in ((-dim, cell >= dim), (dim, cell < cell_count - dim),
+                                           (-1, cell % dim), (1, cell % dim < dim - 1)) if ok]
+             for cell in range(cell_count)]
+    goal = cell_count - 1 + sum((tile - 1) * weight for tile, weight in zip(pattern, weights))
+    distances = bytearray([_UNSEEN]) * (cell_count ** (size + 1))
+    distances[goal] = 0
+    table = bytearray([_UNSEEN]) * (cell_count ** size)
+    queue = deque([goal])
+    while queue:
+        state = queue.popleft()
+        distance = distances[state]
+        blank, placement = state % cell_count, state // cell_count
+        if distance < table[placement]:
+            table[placement] = distance
+        cells = []
+        rest = placement
+        for _ in range(size):
+            rest, cell = divmod(rest, cell_count)
+            cells.append(cell)
+        for target in moves[blank]:
+            if target in cells:
+                # the pattern tile at target slides into the blank
+                tile_weight = weights[cells.index(target)]
+                new_state = state - blank + target + (blank - target) * tile_weight
+                if distance + 1 < distances[new_state]:
+                    distances[new_state] = distance + 1
+                    queue.append(new_state)
+            else:
+                new_state = state - blank + target
+                if distance < distances[new_state]:
+                    distances[new_state] = distance
+                    queue.appendleft(new_state)
+    return table
+
+
+if __name__ == '__main__':
+    # python exercises/pattern_database.py 4  builds and caches the 4x4 tables
+    for dimension in map(int, sys.argv[1:] or ["3"]):
+        database = PatternDatabase.cached(dimension)
+        print(f"{dimension}x{dimension}: patterns {database.patterns}")
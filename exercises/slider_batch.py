@@ -0,0 +1,178 @@
+"""Batch solving of slider puzzles across a process pool.
+
+Boards are read in the Coursera text format: the dimension n followed by
+n rows of n tiles, 0 for the blank, any number of boards one after the
+other. Every board gets one JSON line with its moves, expanded boards and
+solve time, in input order:
+
+    python exercises/slider_batch.py puzzles/*.txt --workers 8 --max-expanded 1000000
+    cat puzzle4x4-*.txt | python exercises/slider_batch.py --heuristic pdb --cache results.jsonl
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from exercises.slider_puzzle import HEURISTICS, Board, SearchBudgetExceeded, Solver
+
+_databases = {}  # dim -> PatternDatabase, loaded once per worker process
+
+
+def read_boards(lines):
+    """Yield the tiles of every board in lines (a file, stdin or any
+    iterable of strings), reading no further than the board at hand"""
+    tokens = (int(token) for line in lines for token in line.split())
+    for dim in tokens:
+        tiles = [[next(tokens, None) for _ in range(dim)] for _ in range(dim)]
+        if any(tile is None for row in tiles for tile in row):
+            raise ValueError(f"Input ends in the middle of a {dim}x{dim} board")
+        if sorted(tile for row in tiles for tile in row) != list(range(dim * dim)):
+            raise ValueError(f"Not a {dim}x{dim} board: {tiles}")
+        yield tiles
+
+
+def board_key(tiles):
+    return tuple(tile for row in tiles for tile in row)
+
+
+def solve_board(tiles, algorithm="idastar", heuristic="linear_conflict",
+                max_expanded=None, time_limit=None):
+    """Solve one board and return its result record.
+
+    status is "solved", "unsolvable" or "budget" when the search ran over
+    max_expanded or time_limit. heuristic "pdb" uses the cached pattern
+    database of the board size."""
+    if heuristic == "pdb":
+        if len(tiles) not in _databases:
+            from exercises.pattern_database import PatternDatabase
+            _databases[len(tiles)] = PatternDatabase.cached(len(tiles))
+        heuristic = _databases[len(tiles)]
+    solver = Solver(Board(tiles), algorithm, heuristic, max_expanded, time_limit)
+    start = time.perf_counter()
+    try:
+        moves = solver.moves_to_solve()
+        status = "solved" if moves >= 0 else "unsolvable"
+    except SearchBudgetExceeded:
+        moves, status = None, "budget"
+    return {
+        "board": tiles,
+        "status": status,
+        "moves": moves,
+        "expanded": solver.expanded,
+        "seconds": round(time.perf_counter() - start, 6),
+    }
+
+
+class ResultCache:
+    """Results by board. With a path, solved and unsolvable results are
+    loaded from and appended to that JSON lines file, so they carry over
+    to later runs; budget and error results are only kept for the current
+    run."""
+    def __init__(self, path=None):
+        self._results = {}
+        self._file = None
+        if path is not None:
+            if os.path.exists(path):
+                with open(path) as cache_file:
+                    for line in cache_file:
+                        if line.strip():
+                            result = json.loads(line)
+                            self._results[board_key(result["board"])] = result
+            self._file = open(path, "a")
+
+    def __contains__(self, key):
+        return key in self._results
+
+    def __getitem__(self, key):
+        return self._results[key]
+
+    def __len__(self):
+        return len(self._results)
+
+    def add(self, key, result):
+        self._results[key] = result
+        if self._file is not None and result["status"] in ("solved", "unsolvable"):
+            self._file.write(json.dumps(result) + "\n")
+            self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def solve_batch(boards, workers=None, cache=None, window=None, **options):
+    """Solve boards across worker processes, yielding result records in
+    input order with "cached" telling whether the board was solved before.
+
+    boards may be any iterable, such as read_boards() over a stream; at most
+    window boards (4 per worker by default) are in flight at once. options
+    are passed on to solve_board(). A board whose worker raised gets a
+    record with status "error" and the exception, the other boards go on."""
+    workers = workers or os.cpu_count() or 1
+    window = window or 4 * workers
+    cache = ResultCache() if cache is None else cache
+    pending = {}  # key -> (tiles, future) of boards being solved
+    order = deque()  # keys of boards not yielded yet
+
+    def finish(key):
+        if key in pending:
+            tiles, future = pending.pop(key)
+            try:
+                result = future.result()
+            except Exception as error:
+                result = {"board": tiles, "status": "error", "error": repr(error)}
+            cache.add(key, result)
+            return dict(result, cached=False)
+        return dict(cache[key], cached=True)
+
+    with ProcessPoolExecutor(workers) as executor:
+        for tiles in boards:
+            key = board_key(tiles)
+            if key not in cache and key not in pending:
+                pending[key] = (tiles, executor.submit(solve_board, tiles, **options))
+            order.append(key)
+            while order and (len(pending) >= window or order[0] not in pending
+                             or pending[order[0]][1].done()):
+                yield finish(order.popleft())
+        while order:
+            yield finish(order.popleft())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve slider puzzles in parallel")
+    parser.add_argument("files", nargs="*", help="board files, stdin if none")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--algorithm", choices=("astar", "idastar"), default="idastar")
+    parser.add_argument("--heuristic", choices=(*HEURISTICS, "pdb"), default="linear_conflict",
+                        help="pdb is the pattern database of the board size")
+    parser.add_argument("--max-expanded", type=int, default=None,
+                        help="give up on a board after expanding this many")
+    parser.add_argument("--time-limit", type=float, default=None,
+                        help="give up on a board after this many seconds")
+    parser.add_argument("--cache", default=None, help="JSON lines file of earlier results")
+    args = parser.parse_args(argv)
+
+    def lines():
+        if not args.files:
+            yield from sys.stdin
+        for name in args.files:
+            with open(name) as board_file:
+                yield from board_file
+
+    cache = ResultCache(args.cache)
+    try:
+        for result in solve_batch(read_boards(lines()), args.workers, cache,
+                                  algorithm=args.algorithm, heuristic=args.heuristic,
+                                  max_expanded=args.max_expanded, time_limit=args.time_limit):
+            print(json.dumps(result), flush=True)
+    finally:
+        cache.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,9 @@
+from bisect import bisect_left
 from dataclasses import dataclass
 from typing import Optional
 import os
 import sys
+import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from algorithms.priority_queue import MinPQ
@@ -11,15 +13,56 @@ class SearchNode:
     board: 'Board'
     moves: int = 0
     prev_node: Optional['SearchNode'] = None
+    priority: int = 0  # moves plus the heuristic estimate of moves left
+
+
+def search_priority(node: SearchNode):
+    """A* priority; among equal ones prefer nodes deeper in the search"""
+    return node.priority, -node.moves
 
-    def __gt__(self, other):
-        return self.board.manhattan() > other.board.manhattan()
 
 class Board:
+    """n-by-n slider puzzle board.
+
+    Tiles are stored as a flat bytes string, row after row, with the blank
+    position and the hamming/manhattan distances cached. A neighbor is
+    made by one swap and gets its distances updated from the moved tile
+    only, so neighbors() is O(n^2) for the copy and O(1) for the rest.
+    Boards are hashable."""
+    _distance_tables = {}  # dim -> distance[tile][cell], goal cell of tile
 
     def __init__(self, tiles):
-        self.tiles = tiles
         self._dim = len(tiles)
+        self._cells = bytes(tile for row in tiles for tile in row)
+        self._zero = self._cells.index(0)
+        distance = self._distances(self._dim)
+        self._manhattan = sum(distance[tile][cell] for cell, tile in enumerate(self._cells))
+        self._hamming = sum(1 for cell, tile in enumerate(self._cells)
+                            if tile and tile != cell + 1)
+
+    @classmethod
+    def _from_cells(cls, dim, cells, zero, manhattan, hamming):
+        board = cls.__new__(cls)
+        board._dim, board._cells, board._zero = dim, cells, zero
+        board._manhattan, board._hamming = manhattan, hamming
+        return board
+
+    @classmethod
+    def _distances(cls, dim):
+        """Return table of manhattan distances of every tile from every cell"""
+        if dim not in cls._distance_tables:
+            table = [[0] * (dim * dim)]  # the blank does not count
+            for tile in range(1, dim * dim):
+                goal_row, goal_col = divmod(tile - 1, dim)
+                table.append([abs(goal_row - cell // dim) + abs(goal_col - cell % dim)
+                              for cell in range(dim * dim)])
+            cls._distance_tables[dim] = table
+        return cls._distance_tables[dim]
+
+    @property
+    def tiles(self):
+        dim = self._dim
+        return [list(self._cells[row * dim:(row + 1) * dim]) for row in range(dim)]
 
     def __str__(self):
         row_str = [repr(row).strip("[]") for row in self.tiles]
@@ -29,112 +72,228 @@ class Board:
         return self._dim
 
     def hamming(self):
-        hamm_dist = 0
-        for row_id in range(self._dim):
-            for col_id in range(self._dim):
-                if self.tiles[row_id][col_id] == 0:
-                    continue
-                goal_tile = self._get_goal_by_position(row_id, col_id)
-                if self.tiles[row_id][col_id] != goal_tile:
-                    hamm_dist += 1
-        return hamm_dist
-
+        return self._hamming
 
     def manhattan(self):
-        dist = 0
-        for row_id in range(self._dim):
-            for col_id in range(self._dim):
-                if self.tiles[row_id][col_id] == 0:
-                    continue
-                goal_row, goal_col = self._get_position_by_goal(self.tiles[row_id][col_id])
-                dist += abs(goal_row - row_id) + abs(goal_col - col_id)
-        return dist
-
-    
-    def _get_goal_by_position(self, row, col):
-        return row * self._dim + col + 1
-    
-    def _get_position_by_goal(self, goal_tile):
-        row_id = goal_tile // self._dim
-        if goal_tile % self._dim == 0:
-            row_id -= 1
-            col_id = self._dim - 1
-        else:
-            col_id = goal_tile % self._dim - 1
-        return row_id, col_id
+        return self._manhattan
 
     def is_goal(self):
-        goal_board = [[self._get_goal_by_position(i, j) for j in range(self._dim)] for i in range(self._dim)]
-        goal_board[self._dim - 1][self._dim - 1] = 0
-        return self.tiles == goal_board
+        return self._manhattan == 0
 
     def __eq__(self, other):
-        self.tiles == other.tiles
+        return isinstance(other, Board) and self._cells == other._cells
+
+    def __hash__(self):
+        return hash(self._cells)
+
+    def _moved(self, cell):
+        """Return the board with the tile at cell slid into the blank"""
+        zero, cells = self._zero, bytearray(self._cells)
+        tile = cells[cell]
+        cells[zero], cells[cell] = tile, 0
+        distance = self._distances(self._dim)[tile]
+        hamming = self._hamming + (tile != zero + 1) - (tile != cell + 1)
+        manhattan = self._manhattan + distance[zero] - distance[cell]
+        return Board._from_cells(self._dim, bytes(cells), cell, manhattan, hamming)
 
     def neighbors(self):
         zero_row, zero_col = self._get_zero_pos()
         for row in (zero_row + 1, zero_row - 1):
             if (0 <= row <= self._dim - 1):
-                new_tiles = [x[:] for x in self.tiles]
-                new_tiles[zero_row][zero_col] = self.tiles[row][zero_col]
-                new_tiles[row][zero_col] = self.tiles[zero_row][zero_col]
-                yield new_tiles
+                yield self._moved(row * self._dim + zero_col)
         
         for col in (zero_col + 1, zero_col - 1):
             if (0 <= col <= self._dim - 1):
-                new_tiles = [x[:] for x in self.tiles]
-                new_tiles[zero_row][zero_col] = self.tiles[zero_row][col]
-                new_tiles[zero_row][col] = self.tiles[zero_row][zero_col]
-                yield new_tiles
-        
+                yield self._moved(zero_row * self._dim + col)
+
+    def linear_conflict(self):
+        """Manhattan distance plus 2 moves for every tile that has to leave
+        its goal row (column) to let other tiles of that row (column) pass.
+
+        A lower bound of moves to the goal, tighter than manhattan."""
+        dim, cells = self._dim, self._cells
+        extra = 0
+        for line in range(dim):
+            row_tiles = [cells[line * dim + col] for col in range(dim)]
+            col_tiles = [cells[row * dim + line] for row in range(dim)]
+            # goal columns of row tiles that belong to that row and vice versa
+            extra += _conflicts([(tile - 1) % dim for tile in row_tiles
+                                 if tile and (tile - 1) // dim == line])
+            extra += _conflicts([(tile - 1) // dim for tile in col_tiles
+                                 if tile and (tile - 1) % dim == line])
+        return self._manhattan + 2 * extra
 
     def twin(self):
-        pass
+        """Return the board with two (non-blank) tiles of one row swapped"""
+        tiles = self.tiles
+        row = 1 if 0 in tiles[0][:2] else 0
+        tiles[row][0], tiles[row][1] = tiles[row][1], tiles[row][0]
+        return Board(tiles)
 
     def _get_zero_pos(self):
-        for row_id in range(self._dim):
-             for col_id in range(self._dim):
-                if self.tiles[row_id][col_id] == 0:
-                    return row_id, col_id
+        return divmod(self._zero, self._dim)
+
+
+def _conflicts(goals):
+    """Return how many tiles must leave the line so the others are in order
+
+    That is len(goals) minus its longest increasing subsequence."""
+    tails = []
+    for goal in goals:
+        idx = bisect_left(tails, goal)
+        if idx == len(tails):
+            tails.append(goal)
+        else:
+            tails[idx] = goal
+    return len(goals) - len(tails)
+
+
+class SearchBudgetExceeded(Exception):
+    """Raised by Solver when the search passes its node or time budget"""
+
+
+HEURISTICS = {
+    'hamming': Board.hamming,
+    'manhattan': Board.manhattan,
+    'linear_conflict': Board.linear_conflict,
+}
 
 
 class Solver:
-    def __init__(self, init_board: Board):
+    """Optimal slider puzzle solver.
+
+    algorithm is "astar" (A* with a closed set of expanded boards) or
+    "idastar" (iterative deepening A*, memory linear in the solution length,
+    the better choice for 4x4 and bigger boards). heuristic is a name from
+    HEURISTICS or any admissible function of a Board, such as a pattern
+    database. max_expanded and time_limit (seconds) bound the search, which
+    raises SearchBudgetExceeded when it runs over either of them."""
+    def __init__(self, init_board: Board, algorithm="astar", heuristic="manhattan",
+                 max_expanded=None, time_limit=None):
+        if algorithm not in ("astar", "idastar"):
+            raise ValueError(f"Unknown algorithm {algorithm!r}")
         self.initial = init_board
+        self._algorithm = algorithm
+        self._heuristic = HEURISTICS[heuristic] if isinstance(heuristic, str) else heuristic
+        self._max_expanded = max_expanded
+        self._time_limit = time_limit
+        self._deadline = None
+        self._solution = None
+        self._searched = False
+        self.expanded = 0  # boards expanded by the search
 
     def is_solvable(self) -> bool:
+        """Check the permutation parity of the tiles.
+
+        On odd width boards a move never changes the parity of inversions,
+        so it has to be even as for the goal. On even width boards a vertical
+        move flips it along with the blank row, so inversions plus the row of
+        the blank has to be odd, as for the goal."""
         inversions = 0
-        tiles = [item for row in self.initial for item in row]
-        for i in range(len(tiles - 1)):
+        tiles = [item for row in self.initial.tiles for item in row]
+        for i in range(len(tiles) - 1):
             for j in range(i + 1, len(tiles)):
                 if tiles[i] and tiles[j] and tiles[i] > tiles[j]:
                     inversions += 1
-        return inversions % 2 == 0
+        dim = self.initial.dimension()
+        if dim % 2:
+            return inversions % 2 == 0
+        zero_row = tiles.index(0) // dim
+        return (inversions + zero_row) % 2 == 1
 
     def moves_to_solve(self) -> int:
-        pass
+        """Return minimum number of moves, -1 if the board is unsolvable"""
+        solution = self.solution()
+        return -1 if solution is None else len(solution) - 1
 
     def solution(self):
-        if not self.is_solvable():
-            return None
-        boards_pq = MinPQ()
-        boards_pq.insert(SearchNode(self.initial))
+        """Return boards from the initial one to the goal, None if unsolvable"""
+        if not self._searched:
+            if self.is_solvable():
+                if self._time_limit is not None:
+                    self._deadline = time.perf_counter() + self._time_limit
+                self.expanded = 0
+                search = self._astar if self._algorithm == "astar" else self._idastar
+                self._solution = search()
+            self._searched = True
+        return self._solution
+
+    def _count_expansion(self):
+        self.expanded += 1
+        if self._max_expanded is not None and self.expanded > self._max_expanded:
+            raise SearchBudgetExceeded(f"expanded more than {self._max_expanded} boards")
+        # the clock is only read every 256 expansions
+        if (self._deadline is not None and not self.expanded & 255
+                and time.perf_counter() > self._deadline):
+            raise SearchBudgetExceeded(f"searched longer than {self._time_limit}s")
+
+    def _astar(self):
+        heuristic = self._heuristic
+        boards_pq = MinPQ(key=search_priority)
+        boards_pq.insert(SearchNode(self.initial, 0, None, heuristic(self.initial)))
+        # fewest moves found to each board; with an inconsistent (but
+        # admissible) heuristic a board may be reached cheaper later on and
+        # is then expanded again
+        best_moves = {self.initial: 0}
         while True:
             min_board_node = boards_pq.del_min()
             min_board = min_board_node.board
-            min_board_moves = min_board_node.moves
+            if min_board_node.moves > best_moves[min_board]:
+                continue
             if min_board.is_goal():
                 break
-
+            self._count_expansion()
+            moves = min_board_node.moves + 1
             for neighbor in min_board.neighbors():
-                if neighbor == min_board.prev_node.board.tiles:
+                if moves < best_moves.get(neighbor, moves + 1):
+                    best_moves[neighbor] = moves
+                    boards_pq.insert(SearchNode(
+                        neighbor,
+                        moves,
+                        min_board_node,
+                        moves + heuristic(neighbor),
+                    ))
+        path = []
+        while min_board_node:
+            path.append(min_board_node.board)
+            min_board_node = min_board_node.prev_node
+        return path[::-1]
+
+    def _idastar(self):
+        heuristic = self._heuristic
+        path = [self.initial]
+        on_path = {self.initial}
+        found = object()  # search() result once the goal is reached
+
+        def search(board, moves, bound):
+            """Depth-first search below bound; return the smallest f over it"""
+            priority = moves + heuristic(board)
+            if priority > bound:
+                return priority
+            if board.is_goal():
+                return found
+            self._count_expansion()
+            smallest = None
+            for neighbor in board.neighbors():
+                if neighbor in on_path:
                     continue
-                boards_pq.insert(SearchNode(
-                    Board(neighbor),
-                    min_board_moves + 1,
-                    min_board_node
-                ))
-        return min_board_node
+                path.append(neighbor)
+                on_path.add(neighbor)
+                result = search(neighbor, moves + 1, bound)
+                if result is found:
+                    return found
+                path.pop()
+                on_path.discard(neighbor)
+                if result is not None and (smallest is None or result < smallest):
+                    smallest = result
+            return smallest
+
+        bound = heuristic(self.initial)
+        while True:
+            result = search(self.initial, 0, bound)
+            if result is found:
+                return path
+            bound = result
 
 
 if __name__ == '__main__':
@@ -142,10 +301,7 @@ if __name__ == '__main__':
     initial = Board(tiles)
 
     solver = Solver(initial)
-    solution = solver.solution()
-    print(f"Minimum number of moves = {solution.moves}")
-    current_node = solution
-    while current_node:
-        print(current_node.board)
-        current_node = current_node.prev_node
-        print()
\ No newline at end of file
+    print(f"Minimum number of moves = {solver.moves_to_solve()}")
+    for board in solver.solution():
+        print(board)
+        print()
@@ -0,0 +1,100 @@
+from collections import deque
+import random
+
+import pytest
+
+from algorithms.exceptions import Empty
+from algorithms.queue import ArrayQueue
+
+
+def _wrapped_queue():
+    """Queue of 10..19 whose elements wrap around the end of the list"""
+    queue = ArrayQueue()
+    queue.enqueue_many(range(12))
+    queue.dequeue_many(10)
+    queue.enqueue_many(range(12, 20))
+    assert queue._front + len(queue) > len(queue._data)
+    return queue
+
+
+def test_shrinking_does_not_crash():
+    # dequeue used to call len(self._data // 2) once under a quarter full
+    queue = ArrayQueue()
+    for i in range(100):
+        queue.enqueue(i)
+    assert [queue.dequeue() for _ in range(100)] == list(range(100))
+    assert len(queue._data) == ArrayQueue.DEFAULT_CAPACITY
+
+
+def test_capacity_stays_a_power_of_two():
+    queue = ArrayQueue()
+    for size in (17, 100, 1000, 3):
+        queue.enqueue_many(range(size))
+        capacity = len(queue._data)
+        assert capacity & (capacity - 1) == 0 and capacity >= len(queue)
+        queue.dequeue_many(size)
+
+
+def test_enqueue_many_wraps_around():
+    queue = _wrapped_queue()
+    assert list(queue) == list(range(10, 20))
+    assert len(queue._data) == ArrayQueue.DEFAULT_CAPACITY
+
+
+def test_dequeue_many_wraps_around():
+    queue = _wrapped_queue()
+    assert queue.dequeue_many(7) == list(range(10, 17))
+    assert queue.dequeue_many(100) == [17, 18, 19]
+    assert all(slot is None for slot in queue._data)
+    with pytest.raises(Empty):
+        queue.dequeue_many(1)
+
+
+def test_dequeue_many_rejects_negative_count():
+    queue = _wrapped_queue()
+    with pytest.raises(ValueError):
+        queue.dequeue_many(-1)
+    assert queue.dequeue_many(0) == []
+    assert len(queue) == 10
+
+
+def test_getitem_and_iter_follow_queue_order():
+    queue = _wrapped_queue()
+    assert [queue[k] for k in range(10)] == list(range(10, 20))
+    assert queue[-1] == 19 and queue[-10] == 10
+    with pytest.raises(IndexError):
+        queue[10]
+    with pytest.raises(IndexError):
+        queue[-11]
+    assert queue.first() == 10
+
+
+def test_matches_collections_deque():
+    rng = random.Random(5)
+    queue, expected = ArrayQueue(), deque()
+    for step in range(3000):
+        operation = rng.randrange(4)
+        if operation == 0:
+            queue.enqueue(step)
+            expected.append(step)
+        elif operation == 1:
+            items = list(range(step, step + rng.randrange(40)))
+            queue.enqueue_many(items)
+            expected.extend(items)
+        elif operation == 2 and expected:
+            assert queue.dequeue() == expected.popleft()
+        elif expected:
+            count = rng.randrange(50)
+            assert queue.dequeue_many(count) == [expected.popleft()
+                                                 for _ in range(min(count, len(expected)))]
+        assert len(queue) == len(expected)
+    assert list(queue) == list(expected)
+
+
+def test_empty_queue():
+    queue = ArrayQueue()
+    with pytest.raises(Empty):
+        queue.dequeue()
+    with pytest.raises(Empty):
+        queue.first()
+    assert list(queue) == []
@@ -0,0 +1,77 @@
+import io
+import mmap
+
+import pytest
+
+from exercises.caesar_cipher import ALPHABET, CaesarCipher, SubstitutionCipher, best_shift
+
+TEXT = ("It was the best of times, it was the worst of times, it was the age of "
+        "wisdom, it was the age of foolishness, it was the epoch of belief, it was "
+        "the epoch of incredulity, it was the season of Light, it was the season of "
+        "Darkness, it was the spring of hope, it was the winter of despair.\n")
+
+
+@pytest.mark.parametrize("shift", [0, 1, 3, 13, 25, 26, -1, 29])
+def test_str_and_bytes_round_trip(shift):
+    cipher = CaesarCipher(shift)
+    assert cipher.shift == shift % 26
+    coded = cipher.encrypt(TEXT)
+    assert cipher.decrypt(coded) == TEXT
+    assert cipher.encrypt(TEXT.encode()) == coded.encode()
+    assert cipher.decrypt(bytearray(coded.encode())) == TEXT.encode()
+    assert (coded == TEXT) == (shift % 26 == 0)
+
+
+def test_only_letters_change_and_keep_their_case():
+    assert CaesarCipher(3).encrypt("Xyz, abc! 123 é") == "Abc, def! 123 é"
+    assert CaesarCipher(3).decrypt(b"Abc\xff") == b"Xyz\xff"
+
+
+def test_substitution_key():
+    key = "QWERTYUIOPASDFGHJKLZXCVBNM"
+    cipher = SubstitutionCipher(key.lower())
+    assert cipher.encrypt(ALPHABET + ALPHABET.lower()) == key + key.lower()
+    assert cipher.decrypt(cipher.encrypt(TEXT)) == TEXT
+    with pytest.raises(ValueError):
+        SubstitutionCipher(key[:-1] + "Q")
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1 << 16])
+def test_streams_over_chunks(chunk_size):
+    cipher = CaesarCipher(11)
+    text = TEXT * 20
+    coded = io.StringIO()
+    assert cipher.encrypt_stream(io.StringIO(text), coded, chunk_size) == len(text)
+    assert coded.getvalue() == cipher.encrypt(text)
+    plain = io.StringIO()
+    assert cipher.decrypt_stream(io.StringIO(coded.getvalue()), plain, chunk_size) == len(text)
+    assert plain.getvalue() == text
+
+    binary = io.BytesIO()
+    assert cipher.encrypt_stream(io.BytesIO(text.encode()), binary, chunk_size) == len(text)
+    assert binary.getvalue() == cipher.encrypt(text).encode()
+
+
+def test_stream_from_mmap(tmp_path):
+    path = tmp_path / "coded.txt"
+    path.write_bytes(CaesarCipher(5).encrypt(TEXT.encode()))
+    with open(path, "rb") as coded_file:
+        with mmap.mmap(coded_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            plain = io.BytesIO()
+            assert CaesarCipher(5).decrypt_stream(mapped, plain, 100) == len(TEXT)
+    assert plain.getvalue() == TEXT.encode()
+
+
+@pytest.mark.parametrize("shift", range(26))
+def test_crack_recovers_the_shift(shift):
+    coded = CaesarCipher(shift).encrypt(TEXT)
+    cracked = CaesarCipher.crack(coded)
+    assert cracked.shift == shift
+    assert cracked.decrypt(coded) == TEXT
+    assert CaesarCipher.crack(coded.encode()).shift == shift
+
+
+def test_crack_looks_at_a_sample_only():
+    coded = CaesarCipher(7).encrypt(TEXT) + "Q" * 10000
+    assert best_shift(coded, sample_size=len(TEXT)) == 7
+    assert best_shift(coded) != 7
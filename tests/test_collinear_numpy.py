@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from exercises import collinear_numpy
+from exercises.collinear_numpy import MAX_SPAN, NumpyCollinearEngine, as_coordinates, find_segments
+from exercises.collinear_points import CollinearEngine, Point
+from tests.test_collinear_points import DEGENERATE, brute_force, random_pairs
+
+
+def _numpy_segments(pairs, min_points=4, workers=1):
+    segments = find_segments(as_coordinates(pairs), min_points, workers).tolist()
+    assert len(segments) == len(set(map(tuple, segments)))
+    return set(map(tuple, segments))
+
+
+@pytest.mark.parametrize("name", sorted(DEGENERATE))
+@pytest.mark.parametrize("min_points", [2, 3, 4, 5])
+def test_degenerate_inputs_match_brute_force(name, min_points):
+    pairs = DEGENERATE[name]
+    assert _numpy_segments(pairs, min_points) == brute_force(pairs, min_points)
+
+
+def test_random_inputs_match_brute_force():
+    rng = random.Random(23)
+    for _ in range(30):
+        pairs = random_pairs(rng, rng.randrange(5, 36), rng.choice([6, 9, 20]))
+        for min_points in (3, 4):
+            assert _numpy_segments(pairs, min_points) == brute_force(pairs, min_points)
+
+
+def test_parallel_path_matches(monkeypatch):
+    monkeypatch.setattr(collinear_numpy, "MIN_PARALLEL_POINTS", 10)
+    rng = random.Random(3)
+    pairs = DEGENERATE["crossing"] + random_pairs(rng, 30, 9)
+    pairs = list(dict.fromkeys(pairs))
+    assert _numpy_segments(pairs, 4, workers=3) == brute_force(pairs)
+    pairs = random_pairs(rng, 400, 40)
+    engine = CollinearEngine([Point(x, y) for x, y in pairs], 5)
+    expected = {(s.p.x, s.p.y, s.q.x, s.q.y) for s in engine.segments()}
+    assert _numpy_segments(pairs, 5, workers=2) == expected
+
+
+def test_input_kinds_and_order():
+    pairs = [(2, 1), (0, 0), (1, 0), (-5, 3)]
+    expected = [[0, 0], [1, 0], [2, 1], [-5, 3]]
+    assert as_coordinates(pairs).tolist() == expected
+    assert as_coordinates([Point(x, y) for x, y in pairs]).tolist() == expected
+    assert as_coordinates(np.array(pairs, dtype=np.int32)).tolist() == expected
+    assert as_coordinates([]).shape == (0, 2)
+    assert find_segments(as_coordinates([])).shape == (0, 4)
+
+
+def test_repeated_points_and_span_are_rejected():
+    with pytest.raises(ValueError, match=r"Repeated point \(1, 2\)"):
+        as_coordinates([(0, 0), (1, 2), (3, 3), (1, 2)])
+    with pytest.raises(ValueError, match="span"):
+        as_coordinates([(0, 0), (MAX_SPAN, 1)])
+    assert len(as_coordinates([(0, 0), (MAX_SPAN - 1, 1)])) == 2
+
+
+def test_engine_interface():
+    engine = NumpyCollinearEngine([Point(x, y) for x, y in DEGENERATE["vertical"]], workers=1)
+    assert engine.number_of_segments() == 1
+    assert [str(segment) for segment in engine.segments()] == ["(7, -3) -> (7, 9)"]
+    assert engine.segment_array() is engine.segment_array()
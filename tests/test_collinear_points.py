@@ -0,0 +1,94 @@
+from itertools import combinations
+import random
+
+import pytest
+
+from exercises.collinear_points import CollinearEngine, FastCollinearPoints, Point
+
+
+def brute_force(pairs, min_points=4):
+    """Return the (x1, y1, x2, y2) maximal segments by checking every line
+    through two points against all the others"""
+    segments = set()
+    for (x1, y1), (x2, y2) in combinations(pairs, 2):
+        line = [(y, x) for x, y in pairs if (x2 - x1) * (y - y1) == (y2 - y1) * (x - x1)]
+        if len(line) >= min_points:
+            (y1, x1), (y2, x2) = min(line), max(line)
+            segments.add((x1, y1, x2, y2))
+    return segments
+
+
+def _engine_segments(pairs, min_points=4):
+    engine = CollinearEngine([Point(x, y) for x, y in pairs], min_points)
+    segments = [(s.p.x, s.p.y, s.q.x, s.q.y) for s in engine.segments()]
+    assert len(segments) == len(set(segments)) == engine.number_of_segments()
+    return set(segments)
+
+
+def random_pairs(rng, count, side):
+    return rng.sample([(x, y) for x in range(side) for y in range(side)], count)
+
+
+DEGENERATE = {
+    "empty": [],
+    "too few": [(0, 0), (1, 1), (2, 2)],
+    "one line": [(3 * k, -2 * k + 1) for k in range(12)],
+    "grid": [(x, y) for x in range(5) for y in range(5)],
+    "vertical": [(7, y) for y in (5, -3, 0, 9, 2)] + [(1, 1)],
+    "horizontal": [(x, -4) for x in (8, 0, -9, 3)] + [(0, 0), (0, 1)],
+    # a vertical, a horizontal and two diagonal segments crossing at (0, 0)
+    "crossing": ([(0, y) for y in range(-2, 3)] + [(x, 0) for x in (-2, -1, 1, 2)]
+                 + [(k, k) for k in (-2, -1, 1, 2)] + [(k, -k) for k in (-3, -1, 1, 3)]),
+    "near slopes": [(0, 0), (1000000, 999999), (2000000, 1999998), (3000000, 2999997),
+                    (1000000, 1000000), (2000000, 2000000), (3000000, 3000001)],
+}
+
+
+@pytest.mark.parametrize("name", sorted(DEGENERATE))
+@pytest.mark.parametrize("min_points", [2, 3, 4, 5])
+def test_degenerate_inputs_match_brute_force(name, min_points):
+    pairs = DEGENERATE[name]
+    assert _engine_segments(pairs, min_points) == brute_force(pairs, min_points)
+
+
+def test_random_inputs_match_brute_force():
+    rng = random.Random(22)
+    for _ in range(30):
+        pairs = random_pairs(rng, rng.randrange(5, 36), rng.choice([6, 9, 20]))
+        for min_points in (3, 4):
+            assert _engine_segments(pairs, min_points) == brute_force(pairs, min_points)
+
+
+def test_vertical_horizontal_and_overlapping_segments():
+    assert _engine_segments(DEGENERATE["vertical"]) == {(7, -3, 7, 9)}
+    assert _engine_segments(DEGENERATE["horizontal"]) == {(-9, -4, 8, -4)}
+    assert _engine_segments(DEGENERATE["crossing"], 5) == {
+        (0, -2, 0, 2), (-2, 0, 2, 0), (-2, -2, 2, 2), (3, -3, -3, 3)}
+    # sub-segments of a line are never reported, however the points come
+    pairs = [(k, 2 * k) for k in (9, 0, 4, 1, 7, 3, 8)]
+    assert _engine_segments(pairs) == {(0, 0, 9, 18)}
+    assert _engine_segments(DEGENERATE["near slopes"]) == {(0, 0, 3000000, 2999997)}
+
+
+def test_repeated_points_are_rejected():
+    with pytest.raises(ValueError, match=r"Repeated point \(1, 2\)"):
+        CollinearEngine([Point(0, 0), Point(1, 2), Point(3, 3), Point(1, 2)])
+
+
+def test_segments_are_found_once_and_replayed():
+    pairs = DEGENERATE["grid"]
+    engine = CollinearEngine([Point(x, y) for x, y in pairs])
+    stream = engine.segments()
+    first = [next(stream), next(stream)]
+    assert len(engine._segments) == 2
+    replay = list(engine.segments())
+    assert replay[:2] == first and len(replay) == len(brute_force(pairs))
+    assert list(stream) == replay[2:]
+    assert engine.number_of_segments() == len(replay)
+    assert all(a is b for a, b in zip(engine.segments(), replay))
+
+
+def test_fast_collinear_points():
+    collinear = FastCollinearPoints([Point(x, y) for x, y in DEGENERATE["one line"]])
+    assert collinear.number_of_segments() == 1
+    assert [str(segment) for segment in collinear.segments()] == ["(33, -21) -> (0, 1)"]
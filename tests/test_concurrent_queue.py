@@ -0,0 +1,108 @@
+import asyncio
+import threading
+
+import pytest
+
+from algorithms.concurrent_queue import AsyncBlockingQueue, BlockingQueue, ConcurrentStack
+from algorithms.exceptions import Empty, Full
+
+
+def test_blocking_queue_is_fifo_and_bounded():
+    queue = BlockingQueue(3)
+    for item in "abc":
+        queue.put(item)
+    assert queue.is_full() and not queue.try_put("d")
+    with pytest.raises(Full):
+        queue.put("d", timeout=0.01)
+    assert queue.get() == "a"
+    queue.put("d")
+    assert queue.get_many(10) == ["b", "c", "d"]
+    assert queue.try_get("none") == "none"
+    with pytest.raises(Empty):
+        queue.get(timeout=0.01)
+    with pytest.raises(ValueError):
+        BlockingQueue(0)
+
+
+def test_blocking_queue_producers_and_consumers():
+    queue = BlockingQueue(8)
+    received = []
+    lock = threading.Lock()
+
+    def produce(first):
+        queue.put_many(range(first, first + 500))
+
+    def consume():
+        for _ in range(500):
+            item = queue.get(timeout=5)
+            with lock:
+                received.append(item)
+
+    threads = ([threading.Thread(target=produce, args=(k * 500,)) for k in range(4)]
+               + [threading.Thread(target=consume) for _ in range(4)])
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(received) == list(range(2000))
+    assert queue.is_empty()
+
+
+def test_async_blocking_queue():
+    async def scenario():
+        queue = AsyncBlockingQueue(2)
+        received = []
+
+        async def consume():
+            for _ in range(100):
+                received.append(await queue.get(timeout=5))
+
+        consumer = asyncio.ensure_future(consume())
+        await queue.put_many(range(100), timeout=5)
+        await consumer
+        assert received == list(range(100))
+        await queue.put("a")
+        await queue.put("b")
+        with pytest.raises(Full):
+            await queue.put("c", timeout=0.01)
+        assert await queue.get_many(5) == ["a", "b"]
+        with pytest.raises(Empty):
+            await queue.get(timeout=0.01)
+
+    asyncio.run(scenario())
+
+
+def test_concurrent_stack_pop_many():
+    stack = ConcurrentStack()
+    stack.push_many(range(5))
+    assert stack.pop_many(2) == [4, 3]
+    assert stack.pop_many(0) == []
+    assert stack.pop_many(3) == [2, 1, 0]  # count == len
+    assert stack.is_empty()
+    stack.push_many("abc")
+    assert stack.pop_many(10) == ["c", "b", "a"]  # count > len
+    assert stack.pop_many(1) == []
+    assert stack.try_pop("none") == "none"
+    with pytest.raises(Empty):
+        stack.pop()
+
+
+def test_concurrent_stack_threads_lose_nothing():
+    stack = ConcurrentStack()
+    popped = []
+    lock = threading.Lock()
+
+    def work(first):
+        for k in range(first, first + 1000, 10):
+            stack.push_many(range(k, k + 10))
+            items = stack.pop_many(7)
+            with lock:
+                popped.extend(items)
+
+    threads = [threading.Thread(target=work, args=(k * 1000,)) for k in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    popped.extend(stack.pop_many(len(stack)))
+    assert sorted(popped) == list(range(4000))
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from algorithms.connected_components import connected_components, write_edge_file
+
+
+def _partition(labels):
+    """Canonical form of a labelling: the first node of each component"""
+    first = {}
+    return [first.setdefault(label, node) for node, label in enumerate(labels)]
+
+
+def _edges(n, count, seed):
+    rng = random.Random(seed)
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(count)]
+
+
+@pytest.fixture(scope="module")
+def graph():
+    n, edges = 400, _edges(400, 350, 1)
+    reference = connected_components(edges, n, workers=1, shard_edges=len(edges))
+    return n, edges, _partition(reference)
+
+
+def test_single_shard_labels_roots():
+    labels = connected_components([(0, 1), (2, 3), (1, 3), (5, 4)], 7, workers=1)
+    assert _partition(labels) == [0, 0, 0, 0, 4, 4, 6]
+    assert all(labels[labels[node]] == labels[node] for node in range(7))
+
+
+def test_multi_shard_crossing_components():
+    labels = connected_components([(0, 1), (2, 3), (0, 2)], 4, workers=1, shard_edges=2)
+    assert _partition(labels) == [0, 0, 0, 0]
+
+
+@pytest.mark.parametrize("shard_edges", [1, 7, 100])
+def test_multi_shard_matches_single_shard(graph, shard_edges):
+    n, edges, expected = graph
+    labels = connected_components(iter(edges), n, workers=1, shard_edges=shard_edges)
+    assert _partition(labels) == expected
+
+
+def test_edge_file(graph, tmp_path):
+    n, edges, expected = graph
+    path = tmp_path / "edges.bin"
+    assert write_edge_file(str(path), edges) == len(edges)
+    labels = connected_components(path, n, workers=1, shard_edges=33)
+    assert _partition(labels) == expected
+
+
+@pytest.mark.parametrize("from_file", [False, True])
+def test_several_workers(graph, tmp_path, from_file):
+    n, edges, expected = graph
+    source = edges
+    if from_file:
+        source = str(tmp_path / "edges.bin")
+        write_edge_file(source, edges)
+    labels = connected_components(source, n, workers=3, shard_edges=20)
+    assert _partition(labels) == expected
+
+
+def test_no_edges():
+    assert list(connected_components([], 3, workers=1)) == [0, 1, 2]
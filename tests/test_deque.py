@@ -0,0 +1,88 @@
+from collections import deque
+import random
+
+import pytest
+
+from algorithms.deque import Deque
+from algorithms.exceptions import Empty
+from algorithms.instrumentation import TracedList
+
+
+def test_remove_last_touches_one_slot():
+    items = Deque()
+    for i in range(1000):
+        items.add_last(i)
+    items._data = TracedList(items._data)
+    assert items.remove_last() == 999
+    assert (items._data.reads, items._data.writes) == (1, 1)
+
+
+def test_wraps_around_at_both_ends():
+    items = Deque()
+    for i in range(3):
+        items.add_last(i)
+    for i in range(1, 4):
+        items.add_first(-i)
+    # front has wrapped to the end of the capacity 8 list
+    assert len(items._data) == Deque.DEFAULT_CAPACITY
+    assert items._front == Deque.DEFAULT_CAPACITY - 3
+    assert list(items) == [-3, -2, -1, 0, 1, 2]
+    assert [items.remove_last(), items.remove_first()] == [2, -3]
+    assert list(items) == [-2, -1, 0, 1]
+
+
+def test_grows_and_shrinks():
+    items = Deque()
+    for i in range(100):
+        items.add_first(i)
+    assert len(items._data) == 128
+    assert list(items) == list(range(99, -1, -1))
+    while len(items) > 10:
+        items.remove_last()
+    assert len(items._data) < 128
+    assert len(items._data) >= Deque.DEFAULT_CAPACITY
+    assert list(items) == list(range(99, 89, -1))
+
+
+def test_indexing():
+    items = Deque()
+    for i in range(5):
+        items.add_first(i)
+    assert [items[k] for k in range(5)] == [4, 3, 2, 1, 0]
+    assert items[-1] == 0 and items[-5] == 4
+    with pytest.raises(IndexError):
+        items[5]
+    with pytest.raises(IndexError):
+        items[-6]
+
+
+def test_matches_collections_deque():
+    rng = random.Random(11)
+    items, expected = Deque(), deque()
+    for i in range(5000):
+        operation = rng.randrange(4)
+        if operation == 0:
+            items.add_first(i)
+            expected.appendleft(i)
+        elif operation == 1:
+            items.add_last(i)
+            expected.append(i)
+        elif operation == 2 and expected:
+            assert items.remove_first() == expected.popleft()
+        elif operation == 3 and expected:
+            assert items.remove_last() == expected.pop()
+    assert list(items) == list(expected)
+    assert len(items) == len(expected)
+
+
+def test_raises_empty():
+    items = Deque()
+    with pytest.raises(Empty):
+        items.remove_first()
+    with pytest.raises(Empty):
+        items.remove_last()
+    items.add_last(1)
+    items.remove_first()
+    assert items.is_empty()
+    with pytest.raises(Empty):
+        items.remove_last()
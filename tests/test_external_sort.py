@@ -0,0 +1,91 @@
+import operator
+import os
+import random
+import sys
+
+import pytest
+
+from algorithms import external_sort as external_sort_module
+from algorithms.external_sort import external_sort
+
+CHUNK = 10  # records per run with the memory limit below
+MEMORY_LIMIT = CHUNK * sys.getsizeof(10 ** 6)
+
+
+@pytest.fixture
+def written_runs(monkeypatch):
+    runs = []
+    write_run = external_sort_module._write_run
+
+    def spy(run_dir, records):
+        path = write_run(run_dir, records)
+        runs.append(path)
+        return path
+
+    monkeypatch.setattr(external_sort_module, "_write_run", spy)
+    return runs
+
+
+def _values(n, seed=1):
+    rng = random.Random(seed)
+    return [rng.randrange(10 ** 6, 2 * 10 ** 6) for _ in range(n)]
+
+
+def test_spills_several_runs(tmp_path, written_runs):
+    values = _values(95)
+    result = list(external_sort(iter(values), memory_limit=MEMORY_LIMIT, tmp_dir=tmp_path))
+    assert result == sorted(values)
+    assert len(written_runs) == 10
+
+
+def test_multi_pass_merge_with_fan_in_two(tmp_path, written_runs):
+    values = _values(80, seed=2)
+    result = list(external_sort(values, memory_limit=MEMORY_LIMIT, fan_in=2,
+                                tmp_dir=tmp_path))
+    assert result == sorted(values)
+    # 8 chunk runs, then 4 and 2 merged runs before the final merge
+    assert len(written_runs) == 8 + 4 + 2
+
+
+def test_stable_with_key(tmp_path):
+    rng = random.Random(3)
+    records = [(rng.randrange(5), i) for i in range(200)]
+    result = list(external_sort(records, key=operator.itemgetter(0), memory_limit=1000,
+                                fan_in=3, tmp_dir=tmp_path))
+    assert result == sorted(records, key=operator.itemgetter(0))
+
+
+@pytest.mark.parametrize("key", [None, operator.itemgetter(0)])
+def test_reverse_is_stable(tmp_path, key):
+    rng = random.Random(4)
+    records = [(rng.randrange(5), i) for i in range(200)]
+    result = list(external_sort(records, key=key, memory_limit=1000, fan_in=2,
+                                tmp_dir=tmp_path, reverse=True))
+    assert result == sorted(records, key=key, reverse=True)
+    if key is not None:
+        ties = [index for value, index in result if value == 2]
+        assert ties == sorted(ties)
+
+
+def test_empty_input(tmp_path):
+    assert list(external_sort([], tmp_dir=tmp_path)) == []
+
+
+def test_rejects_small_fan_in():
+    with pytest.raises(ValueError):
+        list(external_sort([1], fan_in=1))
+
+
+def test_removes_temporary_files_when_done(tmp_path):
+    list(external_sort(_values(50), memory_limit=MEMORY_LIMIT, tmp_dir=tmp_path))
+    assert os.listdir(tmp_path) == []
+
+
+def test_removes_temporary_files_when_closed_early(tmp_path):
+    sorted_values = external_sort(_values(50), memory_limit=MEMORY_LIMIT, fan_in=2,
+                                  tmp_dir=tmp_path)
+    next(sorted_values)
+    (run_dir,) = os.listdir(tmp_path)
+    assert os.listdir(tmp_path / run_dir)
+    sorted_values.close()
+    assert os.listdir(tmp_path) == []
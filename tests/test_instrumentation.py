@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from algorithms import quicksort as quicksort_module
+from algorithms.instrumentation import instrument, unwrap, wrap
+from algorithms.priority_queue import MinPQ
+from algorithms.quicksort import quicksort
+from algorithms.union_find import ArrayWeightedQuickUnionUF
+
+
+def _exchange_partition(values, lo, hi, pivot_index):
+    """Textbook 3-way partitioning that counts its exchanges"""
+    exchanges = 0
+
+    def exchange(i, j):
+        nonlocal exchanges
+        exchanges += 1
+        values[i], values[j] = values[j], values[i]
+
+    exchange(lo, pivot_index)
+    pivot = values[lo]
+    lt, i, gt = lo, lo + 1, hi
+    while i <= gt:
+        if values[i] < pivot:
+            exchange(lt, i)
+            lt += 1
+            i += 1
+        elif pivot < values[i]:
+            exchange(i, gt)
+            gt -= 1
+        else:
+            i += 1
+    return exchanges
+
+
+def test_partition3_counts_its_inline_exchanges():
+    values = [random.Random(1).randrange(10) for _ in range(300)]
+    expected = values[:]
+    exchanges = _exchange_partition(expected, 0, len(expected) - 1, 17)
+    with instrument() as counters:
+        quicksort_module.partition3(values, 0, len(values) - 1, 17)
+    assert values == expected
+    assert counters.swaps == exchanges
+
+
+def test_heapsort_counts_swaps_and_sift_levels():
+    values = list(range(255))
+    with instrument() as counters:
+        quicksort_module._heapsort(values, 0, len(values) - 1)
+    assert values == list(range(255))
+    sifts = counters.calls["quicksort._sift_down"]
+    # 254 root swaps, then every sift level moved counts as one exchange
+    assert counters.swaps == 254 + sifts.total
+    assert sifts.total > 0 and sifts.max <= 7
+
+
+def test_quicksort_and_heap_swaps_are_counted():
+    rng = random.Random(2)
+    values = wrap(rng.random() for _ in range(2000))
+    with instrument() as counters:
+        quicksort(values)
+        pq = MinPQ(rng.random() for _ in range(100))
+        pq.pop_many(100)
+    assert unwrap(values) == sorted(unwrap(values))
+    assert counters.swaps > 2000
+    assert counters.comparisons > 2000
+
+
+def test_union_many_counts_path_hops():
+    rng = random.Random(3)
+    pairs = [(rng.randrange(500), rng.randrange(500)) for _ in range(800)]
+    plain, counted = ArrayWeightedQuickUnionUF(500), ArrayWeightedQuickUnionUF(500)
+    plain.union_many(pairs)
+    with instrument() as counters:
+        counted.union_many(pairs)
+    assert counters.path_hops > 0
+    assert counters.calls["ArrayWeightedQuickUnionUF.root"].calls == 2 * len(pairs)
+    assert counted.count == plain.count
+    assert dict(counted.component_sizes()) == dict(plain.component_sizes())
+
+
+def test_originals_are_restored():
+    originals = (quicksort_module.partition3, quicksort_module._sift_down,
+                 ArrayWeightedQuickUnionUF.union_many)
+    with instrument():
+        assert quicksort_module.partition3 is not originals[0]
+    assert (quicksort_module.partition3, quicksort_module._sift_down,
+            ArrayWeightedQuickUnionUF.union_many) == originals
+    with instrument():
+        with pytest.raises(RuntimeError):
+            with instrument():
+                pass
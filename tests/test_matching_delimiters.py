@@ -0,0 +1,45 @@
+import io
+
+from exercises.matching_delimiters import Mismatch, validate, validate_stream
+
+
+def test_non_latin1_pairs_check_str_and_bytes():
+    assert validate("a⟨b(c)⟩", pairs="⟨⟩()") is None
+    assert validate("a⟨b(c⟩)", pairs="⟨⟩()") == Mismatch(5, 1, 6, "⟩", ")", 3)
+    assert validate(b"a(b)", pairs="⟨⟩()") is None
+    assert validate(b"a(b", pairs="⟨⟩") is None
+    assert validate([b"x(", b"\n]"], pairs="⟨⟩()[]") == Mismatch(3, 2, 1, "]", ")", 1)
+
+
+def test_delimiters_inside_quotes_are_ignored():
+    assert validate('f("(", \'}\')', quotes="\"'") is None
+    assert validate('"(" )', quotes='"') == Mismatch(4, 1, 5, ")", None, None)
+    # the other quote character does not end the string
+    assert validate('"\'(" ]', quotes="\"'") == Mismatch(5, 1, 6, "]", None, None)
+    assert validate('("', quotes='"') == Mismatch(2, 1, 3, None, ")", 0)
+    # without quotes they are plain characters
+    assert validate('"(" )') is None
+
+
+def test_escape_hides_the_next_character_in_quotes():
+    assert validate(r'("a\"b)")', quotes='"') is None
+    assert validate(r'"\\" )', quotes='"') == Mismatch(5, 1, 6, ")", None, None)
+    assert validate(b'("\\"" ]', quotes='"') == Mismatch(6, 1, 7, "]", ")", 0)
+    assert validate(r'("%")', quotes='"', escape="%") == Mismatch(5, 1, 6, None, ")", 0)
+
+
+def test_escape_split_across_stream_chunks():
+    text = '[x "a\\"(" b]\n("\\\\" )\n)'
+    expected = validate(text, quotes='"')
+    assert expected == Mismatch(21, 3, 1, ")", None, None)
+    for chunk_size in range(1, len(text) + 1):
+        assert validate_stream(io.StringIO(text), chunk_size, quotes='"') == expected
+        assert validate_stream(io.BytesIO(text.encode()), chunk_size, quotes='"') == expected
+
+
+def test_errors_report_line_and_column():
+    assert validate("(\n[\n  )") == Mismatch(6, 3, 3, ")", "]", 2)
+    assert validate("a\n(b") == Mismatch(4, 2, 3, None, ")", 2)
+    assert validate(["{\n", "\n", "  x}\n", " }"]) == Mismatch(9, 4, 2, "}", None, None)
+    assert validate(b"ab\ncd\n)") == Mismatch(6, 3, 1, ")", None, None)
+    assert validate("(\n)") is None
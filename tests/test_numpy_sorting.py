@@ -0,0 +1,51 @@
+from array import array
+
+import pytest
+
+from algorithms import numpy_sorting
+from algorithms.sorting import argsort, mergesort, natural_mergesort, shellsort
+
+np = pytest.importorskip("numpy")
+
+
+@pytest.mark.parametrize("sort", [shellsort, mergesort, natural_mergesort])
+@pytest.mark.parametrize("size", [0, 1, 7, 1024, 3000])
+def test_sorts_numeric_arrays_in_place(sort, size):
+    values = np.random.default_rng(size).integers(-100, 100, size)
+    expected = np.sort(values)
+    sort(values)
+    assert np.array_equal(values, expected)
+
+
+@pytest.mark.parametrize("sort", [shellsort, natural_mergesort])
+def test_sorts_typed_arrays_through_a_view(sort):
+    values = array("d", [3.5, -1.0, 2.25, 0.0])
+    sort(values)
+    assert values.tolist() == [-1.0, 0.0, 2.25, 3.5]
+
+
+@pytest.mark.parametrize("sort", [shellsort, mergesort, natural_mergesort])
+def test_non_numeric_arrays_use_the_python_path(sort):
+    letters = np.array(list("zyxwvutsrq"))
+    sort(letters)
+    assert letters.tolist() == sorted("zyxwvutsrq")
+    flags = np.array([True, False, True, False])
+    sort(flags)
+    assert flags.tolist() == [False, False, True, True]
+    assert numpy_sorting.as_numpy(letters) is None
+
+
+@pytest.mark.parametrize("sort", [shellsort, mergesort, natural_mergesort])
+def test_nan_sorts_last(sort):
+    rng = np.random.default_rng(5)
+    values = rng.random(5000)
+    values[rng.choice(5000, 300)] = np.nan
+    expected = np.sort(values)
+    sort(values)
+    assert np.array_equal(values, expected, equal_nan=True)
+    assert not np.isinf(values).any()
+
+
+def test_argsort_is_stable():
+    values = np.array([2, 1, 2, 1, 0])
+    assert argsort(values).tolist() == [4, 1, 3, 0, 2]
@@ -0,0 +1,61 @@
+from array import array
+import math
+import operator
+import random
+
+import pytest
+
+from algorithms import parallel_sort as parallel_sort_module
+from algorithms.parallel_sort import parallel_sort
+
+
+@pytest.fixture(autouse=True)
+def small_partitions(monkeypatch):
+    monkeypatch.setattr(parallel_sort_module, "MIN_PARTITION_SIZE", 100)
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3, 5])
+@pytest.mark.parametrize("typecode", ["d", "i", "q", "B"])
+def test_sorts_arrays_through_shared_memory(workers, typecode):
+    rng = random.Random(workers)
+    if typecode == "d":
+        values = [rng.uniform(-1, 1) for _ in range(2000)]
+    else:
+        values = [rng.randrange(0, 100) for _ in range(2000)]
+    result = parallel_sort(array(typecode, values), workers)
+    assert result.typecode == typecode
+    assert result.tolist() == sorted(values)
+
+
+@pytest.mark.parametrize("size", [0, 1, 99, 250])
+def test_sorts_small_arrays(size):
+    values = list(range(size, 0, -1))
+    assert parallel_sort(array("l", values), 4).tolist() == sorted(values)
+
+
+def test_skewed_array_keeps_every_value():
+    values = [7] * 1500 + list(range(500))
+    random.Random(3).shuffle(values)
+    assert parallel_sort(array("i", values), 4).tolist() == sorted(values)
+
+
+def test_nan_does_not_lose_values():
+    values = [random.random() for _ in range(1000)] + [math.nan] * 20
+    result = parallel_sort(array("d", values), 4)
+    assert len(result) == len(values)
+    assert sum(math.isnan(value) for value in result) == 20
+
+
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_sorts_records_stably_with_key(workers):
+    rng = random.Random(workers)
+    records = [(rng.randrange(10), i) for i in range(3000)]
+    result = parallel_sort(records, workers, key=operator.itemgetter(0))
+    assert result == sorted(records, key=operator.itemgetter(0))
+
+
+def test_returns_list_copy():
+    data = [3, 1, 2] * 100
+    result = parallel_sort(data, 3)
+    assert result == sorted(data)
+    assert data[:3] == [3, 1, 2]
@@ -0,0 +1,93 @@
+import pytest
+
+from exercises.pattern_database import PatternDatabase
+from exercises.slider_puzzle import Board, Solver
+
+
+@pytest.fixture(scope="module")
+def distances_3x3():
+    """Moves to the goal of every solvable 3x3 board, by breadth-first search"""
+    goal = Board([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+    distances, frontier = {goal: 0}, [goal]
+    while frontier:
+        next_frontier = []
+        for board in frontier:
+            for neighbor in board.neighbors():
+                if neighbor not in distances:
+                    distances[neighbor] = distances[board] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    assert len(distances) == 181440
+    return distances
+
+
+@pytest.fixture(scope="module")
+def database():
+    return PatternDatabase.build(3, workers=1)
+
+
+def test_never_overestimates(database, distances_3x3):
+    tighter = 0
+    for board, moves in distances_3x3.items():
+        value = database(board)
+        assert board.manhattan() <= value <= moves
+        tighter += value > board.manhattan()
+    assert tighter  # the tables add something over manhattan
+
+
+def test_single_tile_patterns_are_manhattan(distances_3x3):
+    database = PatternDatabase.build(3, [(tile,) for tile in range(1, 9)], workers=1)
+    for board in list(distances_3x3)[::97]:
+        assert database(board) == board.manhattan()
+
+
+def test_save_and_load_give_the_same_values(database, distances_3x3, tmp_path):
+    path = str(tmp_path / "pdb.bin")
+    database.save(path)
+    loaded = PatternDatabase.load(path)
+    assert (loaded.dim, loaded.patterns) == (database.dim, database.patterns)
+    for board in distances_3x3:
+        assert loaded(board) == database(board)
+    assert [p.name for p in tmp_path.iterdir()] == ["pdb.bin"]
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"not a database")
+    with pytest.raises(ValueError):
+        PatternDatabase.load(str(path))
+
+
+def test_cached_builds_once(database, tmp_path, monkeypatch):
+    builds = []
+    build = PatternDatabase.build.__func__
+
+    def counting_build(cls, *args, **kwargs):
+        builds.append(args)
+        return build(cls, *args, **kwargs)
+
+    monkeypatch.setattr(PatternDatabase, "build", classmethod(counting_build))
+    board = Board([[8, 6, 7], [2, 5, 4], [3, 0, 1]])
+    first = PatternDatabase.cached(3, cache_dir=str(tmp_path / "cache"), workers=1)
+    second = PatternDatabase.cached(3, cache_dir=str(tmp_path / "cache"), workers=1)
+    assert len(builds) == 1
+    assert first(board) == second(board) == database(board)
+
+
+def test_build_in_worker_processes(database):
+    built = PatternDatabase.build(3, workers=2)
+    board = Board([[0, 1, 3], [4, 2, 5], [7, 8, 6]])
+    assert [bytes(table) for table in built._tables] == [bytes(table) for table in database._tables]
+    assert built(board) == database(board)
+
+
+def test_patterns_must_be_disjoint():
+    with pytest.raises(ValueError):
+        PatternDatabase.build(3, [(1, 2), (2, 3)], workers=1)
+    with pytest.raises(ValueError):
+        PatternDatabase.build(3, [(1, 9)], workers=1)
+
+
+def test_solver_with_the_database(database, distances_3x3):
+    for board in list(distances_3x3)[-5:]:  # the farthest boards, 30 and 31 moves
+        assert Solver(board, "idastar", database).moves_to_solve() == distances_3x3[board]
@@ -0,0 +1,69 @@
+from collections import deque
+import random
+
+import pytest
+
+from algorithms.deque import PooledDeque
+from algorithms.exceptions import Empty
+from algorithms.queue import PooledQueue
+
+
+def test_pooled_queue_is_fifo():
+    queue = PooledQueue()
+    for i in range(10):
+        queue.enqueue(i)
+    assert list(queue) == list(range(10))
+    assert [queue.dequeue() for _ in range(10)] == list(range(10))
+    assert queue.is_empty()
+
+
+def test_pooled_queue_raises_empty():
+    queue = PooledQueue()
+    with pytest.raises(Empty):
+        queue.dequeue()
+    queue.enqueue("a")
+    queue.dequeue()
+    with pytest.raises(Empty):
+        queue.dequeue()
+
+
+def test_pooled_queue_reuses_released_slots():
+    queue = PooledQueue()
+    for i in range(4):
+        queue.enqueue(i)
+    for i in range(4, 1000):
+        assert queue.dequeue() == i - 4
+        queue.enqueue(i)
+    assert len(queue._nodes.item) == 4
+    assert list(queue) == [996, 997, 998, 999]
+
+
+def test_pooled_deque_matches_collections_deque():
+    rng = random.Random(7)
+    pooled, expected = PooledDeque(), deque()
+    for i in range(2000):
+        operation = rng.randrange(4)
+        if operation == 0:
+            pooled.add_first(i)
+            expected.appendleft(i)
+        elif operation == 1:
+            pooled.add_last(i)
+            expected.append(i)
+        elif operation == 2 and expected:
+            assert pooled.remove_first() == expected.popleft()
+        elif operation == 3 and expected:
+            assert pooled.remove_last() == expected.pop()
+        assert pooled.size == len(expected)
+    assert list(pooled) == list(expected)
+
+
+def test_pooled_deque_raises_empty():
+    pooled = PooledDeque()
+    with pytest.raises(Empty):
+        pooled.remove_first()
+    with pytest.raises(Empty):
+        pooled.remove_last()
+    pooled.add_first(1)
+    assert pooled.remove_last() == 1
+    assert pooled.is_empty()
+    assert list(pooled) == []
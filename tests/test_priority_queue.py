@@ -0,0 +1,148 @@
+import heapq
+import random
+
+import pytest
+
+from algorithms.exceptions import Empty
+from algorithms.priority_queue import IndexMinPQ, MinPQ
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4, 8])
+def test_min_pq_pops_in_order(arity):
+    rng = random.Random(arity)
+    values = [rng.randrange(100) for _ in range(500)]
+    pq = MinPQ(arity=arity)
+    for value in values:
+        pq.insert(value)
+    assert len(pq) == len(values)
+    assert [pq.del_min() for _ in values] == sorted(values)
+    assert pq.is_empty()
+
+
+@pytest.mark.parametrize("arity", [2, 4])
+def test_min_pq_heapifies_items(arity):
+    values = list(range(300, 0, -1))
+    pq = MinPQ(values, arity=arity)
+    pq.insert_many([0, 1000])
+    assert pq.pop_many(5) == [0, 1, 2, 3, 4]
+    assert pq.pop_many(1000)[-1] == 1000
+    assert pq.pop_many(3) == []
+
+
+def test_min_pq_interleaved_matches_heapq():
+    rng = random.Random(1)
+    pq, reference = MinPQ(arity=3), []
+    for _ in range(2000):
+        if reference and rng.random() < 0.4:
+            assert pq.del_min() == heapq.heappop(reference)
+        else:
+            value = rng.random()
+            pq.insert(value)
+            heapq.heappush(reference, value)
+    assert pq.pop_many(len(reference)) == sorted(reference)
+
+
+def test_min_pq_key():
+    words = ["pear", "fig", "banana", "kiwi", "apple"]
+    pq = MinPQ(words, key=len)
+    assert [len(word) for word in pq.pop_many(5)] == [3, 4, 4, 5, 6]
+
+
+def test_min_pq_reverse():
+    pq = MinPQ([5, 1, 9, 3], arity=4, reverse=True)
+    pq.insert(7)
+    assert pq.pop_many(5) == [9, 7, 5, 3, 1]
+
+
+def test_min_pq_key_and_reverse():
+    pq = MinPQ([(1, "a"), (3, "b"), (2, "c")], key=lambda pair: pair[0], reverse=True)
+    assert [name for _, name in pq.pop_many(3)] == ["b", "c", "a"]
+
+
+def test_min_pq_merge_keeps_other():
+    first, second = MinPQ([4, 2]), MinPQ([3, 1])
+    first.merge(second)
+    assert first.pop_many(4) == [1, 2, 3, 4]
+    assert len(second) == 2
+
+
+def test_min_pq_rejects_arity_below_two():
+    with pytest.raises(ValueError):
+        MinPQ(arity=1)
+
+
+def test_min_pq_raises_empty():
+    with pytest.raises(Empty):
+        MinPQ().del_min()
+
+
+@pytest.mark.parametrize("arity", [2, 3, 4])
+def test_index_min_pq_changes_and_deletes(arity):
+    rng = random.Random(arity)
+    priorities = {key: rng.randrange(1000) for key in range(300)}
+    pq = IndexMinPQ(priorities.items(), arity=arity)
+    for key in rng.sample(range(300), 100):
+        priorities[key] = rng.randrange(1000)
+        pq.change_key(key, priorities[key])
+    for key in rng.sample(range(300), 50):
+        pq.delete(key)
+        del priorities[key]
+    assert len(pq) == len(priorities)
+    assert [priorities[pq.del_min()] for _ in range(len(priorities))] == sorted(
+        priorities.values())
+
+
+def test_index_min_pq_key_orders_by_key_and_keeps_priorities():
+    pq = IndexMinPQ([("a", "peach"), ("b", "fig"), ("c", "banana")], key=len)
+    pq.insert("d", "kiwi")
+    assert pq.priority("c") == "banana"
+    pq.change_key("c", "nut")
+    assert pq.min_priority() in ("fig", "nut")
+    assert [pq.del_min() for _ in range(4)][2:] == ["d", "a"]
+
+
+def test_index_min_pq_reverse():
+    pq = IndexMinPQ([("a", 1), ("b", 5), ("c", 3)], arity=4, reverse=True)
+    pq.change_key("a", 9)
+    assert pq.min_key() == "a"
+    pq.decrease_key("a", 10)  # moves it further towards the front
+    with pytest.raises(ValueError):
+        pq.increase_key("b", 6)
+    pq.increase_key("b", 2)
+    assert [pq.del_min() for _ in range(3)] == ["a", "c", "b"]
+
+
+def test_index_min_pq_decrease_and_increase_key():
+    pq = IndexMinPQ([("a", 1), ("b", 5), ("c", 3)])
+    pq.decrease_key("b", 0)
+    assert pq.min_key() == "b"
+    with pytest.raises(ValueError):
+        pq.decrease_key("a", 2)
+    pq.increase_key("b", 4)
+    assert [pq.del_min() for _ in range(3)] == ["a", "c", "b"]
+
+
+def test_index_min_pq_rejects_duplicates():
+    with pytest.raises(ValueError):
+        IndexMinPQ([("a", 1), ("a", 2)])
+    pq = IndexMinPQ([("a", 1)])
+    with pytest.raises(ValueError):
+        pq.insert("a", 3)
+    assert "a" in pq and not pq.contains("b")
+
+
+def test_index_min_pq_has_no_value_priority_list():
+    assert not hasattr(IndexMinPQ(), "_priorities")
+
+
+def test_index_min_pq_decrease_and_increase_key_follow_reverse_order():
+    pq = IndexMinPQ([("a", 1), ("b", 5), ("c", 3)], reverse=True)
+    pq.decrease_key("a", 7)  # a bigger value moves towards the front
+    assert pq.min_key() == "a"
+    with pytest.raises(ValueError, match="goes after"):
+        pq.decrease_key("b", 4)
+    pq.increase_key("a", 2)  # a smaller value moves towards the back
+    assert [pq.del_min() for _ in range(3)] == ["b", "c", "a"]
+    pq = IndexMinPQ([("a", 1)], reverse=True)
+    with pytest.raises(ValueError, match="goes before"):
+        pq.increase_key("a", 6)
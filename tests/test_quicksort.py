@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from algorithms import quicksort as quicksort_module
+from algorithms.quicksort import partition3, quicksort
+from benchmarks.harness import antiquicksort
+
+
+def _median_of_3_killer(n):
+    """Musser's input that makes plain median-of-three quicksort quadratic"""
+    k = n // 2
+    values = [0] * n
+    for i in range(1, k + 1):
+        if i % 2:
+            values[i - 1] = i
+            values[i] = k + i
+        values[k + i - 1] = 2 * i
+    return values
+
+
+INPUTS = {
+    "random": lambda n: [random.Random(n).randrange(n) for _ in range(n)],
+    "sorted": lambda n: list(range(n)),
+    "reversed": lambda n: list(range(n, 0, -1)),
+    "duplicates": lambda n: [random.Random(n).randrange(3) for _ in range(n)],
+    "all equal": lambda n: [7] * n,
+    "median-of-3 killer": _median_of_3_killer,
+    "antiquicksort": lambda n: antiquicksort(quicksort, n),
+}
+
+
+@pytest.mark.parametrize("name", INPUTS)
+@pytest.mark.parametrize("size", [0, 1, 2, 15, 16, 40, 1000])
+def test_sorts(name, size):
+    values = INPUTS[name](size)
+    expected = sorted(values)
+    quicksort(values)
+    assert values == expected
+
+
+def test_sorts_a_subrange_only():
+    values = list(range(50, 0, -1))
+    quicksort(values, 10, 39)
+    assert values[:10] == list(range(50, 40, -1))
+    assert values[10:40] == sorted(range(11, 41))
+    assert values[40:] == list(range(10, 0, -1))
+
+
+@pytest.mark.parametrize("lo, hi", [(0, 0), (5, 4), (0, 99), (3, 97)])
+def test_subrange_bounds(lo, hi):
+    values = [random.Random(lo).random() for _ in range(100)]
+    expected = values[:lo] + sorted(values[lo:hi + 1]) + values[hi + 1:]
+    quicksort(values, lo, hi)
+    assert values == expected
+
+
+def test_reverse():
+    values = [random.Random(1).randrange(50) for _ in range(300)]
+    expected = sorted(values, reverse=True)
+    quicksort(values, reverse=True)
+    assert values == expected
+    values = list(range(20))
+    quicksort(values, 5, 14, reverse=True)
+    assert values == list(range(5)) + list(range(14, 4, -1)) + list(range(15, 20))
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_key_is_stable(reverse):
+    rng = random.Random(3)
+    records = [(rng.randrange(5), i) for i in range(500)]
+    result = records[:]
+    quicksort(result, key=lambda record: record[0], reverse=reverse)
+    assert result == sorted(records, key=lambda record: record[0], reverse=reverse)
+
+
+def test_partition3():
+    values = [5, 1, 5, 9, 3, 5, 7, 0, 5]
+    lt, gt = partition3(values, 0, len(values) - 1, 2)
+    assert all(value < 5 for value in values[:lt])
+    assert values[lt:gt + 1] == [5, 5, 5, 5]
+    assert all(value > 5 for value in values[gt + 1:])
+
+
+def test_falls_back_to_heapsort_past_the_depth_limit(monkeypatch):
+    heapsorted = []
+    heapsort = quicksort_module._heapsort
+
+    def spy(input_array, lo, hi):
+        heapsorted.append(hi - lo + 1)
+        heapsort(input_array, lo, hi)
+
+    # the smallest key as pivot peels one element per partition
+    monkeypatch.setattr(quicksort_module, "_pivot_index", lambda input_array, lo, hi: lo)
+    monkeypatch.setattr(quicksort_module, "_heapsort", spy)
+    values = list(range(1000))
+    quicksort(values)
+    assert values == list(range(1000))
+    assert heapsorted and heapsorted[0] > quicksort_module.INSERTION_SORT_CUTOFF
+
+
+def test_heapsort_sorts_subrange():
+    values = [random.Random(5).randrange(100) for _ in range(200)]
+    expected = values[:20] + sorted(values[20:180]) + values[180:]
+    quicksort_module._heapsort(values, 20, 179)
+    assert values == expected
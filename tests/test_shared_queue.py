@@ -0,0 +1,116 @@
+from multiprocessing import get_context
+
+import pytest
+
+from algorithms.exceptions import Empty, Full
+from algorithms.shared_queue import SharedRingQueue
+
+
+@pytest.fixture
+def shared_queue():
+    queue = SharedRingQueue.create(64)
+    yield queue
+    queue.close()
+    queue.unlink()
+
+
+def test_variable_records_wrap_around(shared_queue):
+    records = [bytes([k]) * (k % 13) for k in range(200)]
+    received = []
+    for record in records:
+        while True:
+            try:
+                shared_queue.enqueue(record)
+                break
+            except Full:
+                received.append(shared_queue.dequeue())
+    while not shared_queue.is_empty():
+        received.append(shared_queue.dequeue())
+    assert received == records
+    assert len(shared_queue) == 0
+
+
+def test_peek_first_and_discard(shared_queue):
+    shared_queue.enqueue(b"abc")
+    shared_queue.enqueue(bytearray(b"de"))
+    view = shared_queue.peek()
+    assert view == b"abc"
+    view.release()
+    assert shared_queue.first() == b"abc" and len(shared_queue) == 2
+    shared_queue.discard()
+    assert shared_queue.dequeue() == b"de"
+    with pytest.raises(Empty):
+        shared_queue.dequeue()
+    with pytest.raises(Empty):
+        shared_queue.discard()
+
+
+def test_full_and_oversized_records(shared_queue):
+    with pytest.raises(ValueError):
+        shared_queue.enqueue(bytes(64))
+    shared_queue.enqueue(bytes(40))
+    with pytest.raises(Full):
+        shared_queue.enqueue(bytes(20))
+
+
+def test_fixed_size_records():
+    queue = SharedRingQueue.create(32, record_size=8)
+    try:
+        for k in range(4):
+            queue.enqueue(k.to_bytes(8, "little"))
+        with pytest.raises(Full):
+            queue.enqueue(bytes(8))
+        with pytest.raises(ValueError):
+            queue.enqueue(bytes(4))
+        assert [int.from_bytes(queue.dequeue(), "little") for _ in range(4)] == [0, 1, 2, 3]
+    finally:
+        queue.close()
+        queue.unlink()
+    with pytest.raises(ValueError):
+        SharedRingQueue.create(30, record_size=8)
+
+
+def _produce(name, count):
+    queue = SharedRingQueue.attach(name)
+    try:
+        for k in range(count):
+            while True:
+                try:
+                    queue.enqueue(str(k).encode())
+                    break
+                except Full:
+                    pass
+    finally:
+        queue.close()
+
+
+def test_attach_from_another_process(shared_queue):
+    producer = get_context("spawn").Process(target=_produce, args=(shared_queue.name, 300))
+    producer.start()
+    received = []
+    while len(received) < 300:
+        try:
+            received.append(int(shared_queue.dequeue()))
+        except Empty:
+            pass
+    producer.join()
+    assert received == list(range(300))
+
+
+def test_file_queue_survives_reopening(tmp_path):
+    path = str(tmp_path / "queue.bin")
+    with pytest.raises(ValueError):
+        SharedRingQueue.open_file(path)
+    queue = SharedRingQueue.open_file(path, capacity=128)
+    assert queue.name is None
+    for record in (b"one", b"two", b"three"):
+        queue.enqueue(record)
+    assert queue.dequeue() == b"one"
+    queue.flush()
+    queue.close()
+    queue = SharedRingQueue.open_file(path, capacity=16)
+    try:
+        assert len(queue) == 2
+        assert [queue.dequeue(), queue.dequeue()] == [b"two", b"three"]
+    finally:
+        queue.close()
@@ -0,0 +1,32 @@
+import pytest
+
+from exercises.slider_batch import main, read_boards, solve_batch
+
+BOARDS = [[[1, 2, 3], [4, 5, 6], [7, 0, 8]], [[1, 2, 3], [4, 5, 6], [8, 7, 0]],
+          [[1, 2, 3], [4, 5, 6], [7, 0, 8]]]
+
+
+def test_results_come_in_input_order_with_cache_hits():
+    results = list(solve_batch(BOARDS, workers=2, heuristic="manhattan"))
+    assert [result["status"] for result in results] == ["solved", "unsolvable", "solved"]
+    assert results[0]["moves"] == 1
+    assert [result["cached"] for result in results] == [False, False, True]
+
+
+def test_worker_errors_become_error_records():
+    results = list(solve_batch(BOARDS[:2], workers=2, heuristic="no_such_heuristic"))
+    assert [result["status"] for result in results] == ["error", "error"]
+    assert [result["board"] for result in results] == BOARDS[:2]
+    assert "no_such_heuristic" in results[0]["error"]
+
+
+def test_read_boards_rejects_truncated_input():
+    assert list(read_boards(["2", "1 2", "3 0"])) == [[[1, 2], [3, 0]]]
+    with pytest.raises(ValueError):
+        list(read_boards(["2 1 2 3"]))
+
+
+def test_heuristic_choices(capsys):
+    with pytest.raises(SystemExit):
+        main(["--heuristic", "euclid"])
+    assert "invalid choice" in capsys.readouterr().err
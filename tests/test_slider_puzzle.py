@@ -0,0 +1,156 @@
+import random
+
+import pytest
+
+from exercises.slider_puzzle import HEURISTICS, Board, SearchBudgetExceeded, Solver
+
+
+def _random_walk(board, steps, rng):
+    for _ in range(steps):
+        board = rng.choice(list(board.neighbors()))
+        yield board
+
+
+def test_neighbors_distances_match_a_fresh_board():
+    rng = random.Random(18)
+    for tiles in ([[1, 2, 3], [4, 5, 6], [7, 8, 0]],
+                  [[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]],
+                  [[3, 0], [2, 1]]):
+        for board in _random_walk(Board(tiles), 200, rng):
+            for neighbor in board.neighbors():
+                fresh = Board(neighbor.tiles)
+                assert neighbor == fresh
+                assert neighbor.manhattan() == fresh.manhattan()
+                assert neighbor.hamming() == fresh.hamming()
+                assert neighbor._get_zero_pos() == fresh._get_zero_pos()
+
+
+def test_neighbors_slide_one_tile_into_the_blank():
+    board = Board([[1, 2, 3], [4, 0, 5], [7, 8, 6]])
+    assert sorted(neighbor.tiles for neighbor in board.neighbors()) == [
+        [[1, 0, 3], [4, 2, 5], [7, 8, 6]],
+        [[1, 2, 3], [0, 4, 5], [7, 8, 6]],
+        [[1, 2, 3], [4, 5, 0], [7, 8, 6]],
+        [[1, 2, 3], [4, 8, 5], [7, 0, 6]],
+    ]
+    corner = Board([[0, 1], [2, 3]])
+    assert len(list(corner.neighbors())) == 2
+
+
+def test_distances():
+    assert Board([[1, 2, 3], [4, 5, 6], [7, 8, 0]]).is_goal()
+    board = Board([[8, 1, 3], [4, 0, 2], [7, 6, 5]])
+    assert board.hamming() == 5
+    assert board.manhattan() == 10
+    assert not board.is_goal()
+
+
+def test_equality_and_hash():
+    tiles = [[1, 2, 3], [4, 5, 6], [7, 0, 8]]
+    board, same = Board(tiles), Board([row[:] for row in tiles])
+    assert board == same and hash(board) == hash(same)
+    assert len({board, same}) == 1
+    moved = next(board.neighbors())
+    assert moved != board
+    assert moved in {neighbor for neighbor in moved.neighbors() for neighbor in neighbor.neighbors()}
+    assert board != tiles
+
+
+def test_twin_swaps_two_tiles_of_a_row():
+    for tiles, swapped in (([[1, 2, 3], [4, 5, 6], [7, 8, 0]], [[2, 1, 3], [4, 5, 6], [7, 8, 0]]),
+                           ([[0, 1, 3], [4, 2, 5], [7, 8, 6]], [[0, 1, 3], [2, 4, 5], [7, 8, 6]]),
+                           ([[1, 0], [2, 3]], [[1, 0], [3, 2]])):
+        board = Board(tiles)
+        twin = board.twin()
+        assert twin.tiles == swapped
+        assert twin.manhattan() == Board(swapped).manhattan()
+        assert twin.twin() == board
+        assert board.tiles == tiles
+
+
+def _bfs_distances(goal, max_moves):
+    """Moves from goal of every board up to max_moves away, breadth first"""
+    distances, frontier = {goal: 0}, [goal]
+    while frontier and distances[frontier[0]] < max_moves:
+        next_frontier = []
+        for board in frontier:
+            for neighbor in board.neighbors():
+                if neighbor not in distances:
+                    distances[neighbor] = distances[board] + 1
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    return distances
+
+
+GOAL_3x3 = Board([[1, 2, 3], [4, 5, 6], [7, 8, 0]])
+HARDEST_3x3 = [[8, 6, 7], [2, 5, 4], [3, 0, 1]]  # one of the two 31 move boards
+
+
+@pytest.fixture(scope="module")
+def distances_3x3():
+    return _bfs_distances(GOAL_3x3, 20)
+
+
+def _check_solution(solver, moves):
+    solution = solver.solution()
+    assert solver.moves_to_solve() == moves == len(solution) - 1
+    assert solution[0] == solver.initial and solution[-1].is_goal()
+    for board, next_board in zip(solution, solution[1:]):
+        assert next_board in set(board.neighbors())
+
+
+@pytest.mark.parametrize("algorithm", ["astar", "idastar"])
+@pytest.mark.parametrize("heuristic", sorted(HEURISTICS))
+def test_solutions_are_optimal(distances_3x3, algorithm, heuristic):
+    rng = random.Random(19)
+    boards = [Board([[0, 1, 3], [4, 2, 5], [7, 8, 6]]), Board([[8, 1, 3], [4, 0, 2], [7, 6, 5]]),
+              GOAL_3x3] + rng.sample(list(distances_3x3), 10)
+    for board in boards:
+        _check_solution(Solver(board, algorithm, heuristic), distances_3x3[board])
+
+
+def test_hardest_3x3_board():
+    board = Board(HARDEST_3x3)
+    _check_solution(Solver(board, "astar", "manhattan"), 31)
+    _check_solution(Solver(board, "idastar", "linear_conflict"), 31)
+
+
+@pytest.mark.parametrize("algorithm", ["astar", "idastar"])
+def test_4x4_boards(algorithm):
+    goal = Board([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15, 0]])
+    # 3 inversions and the blank in row 2: solvable, though an odd width
+    # board with odd inversions would not be
+    one_move = Board([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 0], [13, 14, 15, 12]])
+    _check_solution(Solver(one_move, algorithm), 1)
+    assert Solver(one_move.twin(), algorithm).moves_to_solve() == -1
+    assert Solver(goal.twin(), algorithm).solution() is None
+
+    rng = random.Random(4)
+    for board in list(_random_walk(goal, 30, rng))[9::10]:
+        expected = Solver(board, "idastar", "linear_conflict").moves_to_solve()
+        assert 0 <= expected <= 30 and expected % 2 == board.manhattan() % 2
+        _check_solution(Solver(board, algorithm, "manhattan"), expected)
+
+
+def test_is_solvable_parity(distances_3x3):
+    rng = random.Random(7)
+    for board in rng.sample(list(distances_3x3), 200):
+        assert Solver(board).is_solvable()
+        assert not Solver(board.twin()).is_solvable()
+
+
+@pytest.mark.parametrize("algorithm", ["astar", "idastar"])
+def test_search_budgets(algorithm):
+    board = Board(HARDEST_3x3)
+    solver = Solver(board, algorithm, "hamming", max_expanded=100)
+    with pytest.raises(SearchBudgetExceeded, match="100 boards"):
+        solver.solution()
+    assert solver.expanded == 101
+    with pytest.raises(SearchBudgetExceeded, match="longer than 0s"):
+        Solver(board, algorithm, "hamming", time_limit=0).solution()
+    assert Solver(board, algorithm, max_expanded=10 ** 6, time_limit=60).moves_to_solve() == 31
+
+
+def test_unknown_algorithm():
+    with pytest.raises(ValueError):
+        Solver(GOAL_3x3, "bfs")
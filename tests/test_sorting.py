@@ -0,0 +1,97 @@
+from functools import total_ordering
+import random
+
+import pytest
+
+from algorithms import sorting
+from algorithms.sorting import MIN_RUN, _find_runs, _merge_runs, natural_mergesort
+
+
+@total_ordering
+class Keyed:
+    """Item ordered by key only, so equal items stay distinguishable"""
+    def __init__(self, key, tag):
+        self.key, self.tag = key, tag
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+
+def test_find_runs_keeps_long_runs():
+    values = list(range(40)) + list(range(30))
+    assert _find_runs(values) == [0, 40]
+    assert values == list(range(40)) + list(range(30))
+
+
+def test_find_runs_extends_short_runs_to_min_run():
+    values = [3, 2, 1] * 20
+    starts = _find_runs(values)
+    assert starts == list(range(0, len(values), MIN_RUN))
+    for lo, hi in zip(starts, starts[1:] + [len(values)]):
+        assert values[lo:hi] == sorted(values[lo:hi])
+
+
+def test_merge_runs_trims_with_bisect():
+    src = [1, 2, 3, 10, 11, 4, 5, 12, 13, 14]
+    dst = [None] * len(src)
+    _merge_runs(src, dst, 0, 5, len(src))
+    assert dst == sorted(src)
+
+
+def test_merge_runs_is_stable():
+    src = [Keyed(1, "a"), Keyed(2, "b"), Keyed(2, "c"), Keyed(1, "d"), Keyed(2, "e")]
+    dst = [None] * len(src)
+    _merge_runs(src, dst, 0, 3, 5)
+    assert [item.tag for item in dst] == ["a", "d", "b", "c", "e"]
+
+
+@pytest.mark.parametrize("size", [0, 1, MIN_RUN - 1, MIN_RUN, 100, 1000])
+@pytest.mark.parametrize("shape", ["random", "sorted", "reversed", "runs", "sawtooth"])
+def test_sorts_lists(size, shape):
+    rng = random.Random(size)
+    values = {
+        "random": lambda: [rng.randrange(size + 1) for _ in range(size)],
+        "sorted": lambda: list(range(size)),
+        "reversed": lambda: list(range(size, 0, -1)),
+        "runs": lambda: [k % 37 for k in range(size)],
+        "sawtooth": lambda: [k % 5 for k in range(size)],
+    }[shape]()
+    expected = sorted(values)
+    natural_mergesort(values)
+    assert values == expected
+
+
+def test_stable_without_key():
+    rng = random.Random(1)
+    items = [Keyed(rng.randrange(10), i) for i in range(500)]
+    result = items[:]
+    natural_mergesort(result)
+    assert [item.tag for item in result] == [item.tag for item in sorted(items)]
+
+
+def test_stable_with_key():
+    rng = random.Random(2)
+    records = [(rng.randrange(10), i) for i in range(500)]
+    result = records[:]
+    natural_mergesort(result, key=lambda record: record[0])
+    assert result == sorted(records, key=lambda record: record[0])
+
+
+def test_skips_merges_of_ordered_runs(monkeypatch):
+    merges = []
+    merge_runs = sorting._merge_runs
+
+    def spy(src, dst, lo, mid, hi):
+        merges.append((lo, mid, hi))
+        merge_runs(src, dst, lo, mid, hi)
+
+    monkeypatch.setattr(sorting, "_merge_runs", spy)
+    values = list(range(100))
+    natural_mergesort(values)
+    assert merges == [] and values == list(range(100))
+    values = list(range(50, 100)) + list(range(50))
+    natural_mergesort(values)
+    assert merges == [(0, 50, 100)] and values == list(range(100))
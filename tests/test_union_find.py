@@ -0,0 +1,166 @@
+from collections import Counter
+import random
+
+import pytest
+
+from algorithms.union_find import ArrayWeightedQuickUnionUF, KeyedUF, RollbackUF
+
+
+def _random_pairs(n, count, seed):
+    rng = random.Random(seed)
+    return [(rng.randrange(n), rng.randrange(n)) for _ in range(count)]
+
+
+def _components(n, pairs):
+    """Reference partition as a list of component labels"""
+    labels = list(range(n))
+    for p, q in pairs:
+        old, new = labels[p], labels[q]
+        if old != new:
+            labels = [new if label == old else label for label in labels]
+    return labels
+
+
+def test_array_uf_union_and_sizes():
+    n, pairs = 200, _random_pairs(200, 150, 1)
+    uf = ArrayWeightedQuickUnionUF(n)
+    for p, q in pairs:
+        uf.union(p, q)
+    labels = _components(n, pairs)
+    assert uf.count == len(set(labels))
+    assert dict(uf.component_sizes()) == dict(Counter(Counter(labels).values()))
+    for p, q in _random_pairs(n, 300, 2):
+        assert uf.connected(p, q) == (labels[p] == labels[q])
+        assert uf.component_size(p) == labels.count(labels[p])
+
+
+def test_array_uf_union_many_matches_union():
+    n, pairs = 500, _random_pairs(500, 400, 3)
+    one_by_one, batched = ArrayWeightedQuickUnionUF(n), ArrayWeightedQuickUnionUF(n)
+    for p, q in pairs:
+        one_by_one.union(p, q)
+    batched.union_many(pairs)
+    assert batched.count == one_by_one.count
+    assert dict(batched.component_sizes()) == dict(one_by_one.component_sizes())
+    queries = _random_pairs(n, 300, 4)
+    assert batched.connected_many(queries) == [one_by_one.connected(p, q) for p, q in queries]
+
+
+def test_array_uf_component_sizes_is_a_live_read_only_view():
+    uf = ArrayWeightedQuickUnionUF(4)
+    sizes = uf.component_sizes()
+    assert dict(sizes) == {1: 4}
+    uf.union(0, 1)
+    uf.union(0, 1)
+    assert dict(sizes) == {1: 2, 2: 1}
+    with pytest.raises(TypeError):
+        sizes[1] = 0
+    assert dict(ArrayWeightedQuickUnionUF(0).component_sizes()) == {}
+
+
+def test_array_uf_find_all_flattens():
+    uf = ArrayWeightedQuickUnionUF(6)
+    uf.union_many([(0, 1), (1, 2), (3, 4)])
+    roots = list(uf.find_all())
+    assert roots[0] == roots[1] == roots[2] != roots[3]
+    assert roots[3] == roots[4] != roots[5]
+    assert list(uf.id) == roots
+
+
+def test_array_uf_numpy_batches():
+    np = pytest.importorskip("numpy")
+    n, pairs = 300, _random_pairs(300, 250, 5)
+    uf = ArrayWeightedQuickUnionUF(n)
+    uf.union_many(np.array(pairs))
+    labels = _components(n, pairs)
+    queries = np.array(_random_pairs(n, 200, 6))
+    expected = [labels[p] == labels[q] for p, q in queries.tolist()]
+    assert uf.connected_many(queries).tolist() == expected
+
+
+def test_keyed_uf_grows_and_tracks_members():
+    n, pairs = 100, _random_pairs(100, 80, 7)
+    uf = KeyedUF()
+    for p, q in pairs:
+        uf.union(f"k{p}", f"k{q}")
+    labels = _components(n, pairs)
+    seen = {p for pair in pairs for p in pair}
+    assert len(uf) == len(seen) > KeyedUF.INITIAL_CAPACITY
+    assert uf.count == len({labels[p] for p in seen})
+    for p in seen:
+        expected = {f"k{q}" for q in seen if labels[q] == labels[p]}
+        assert set(uf.members(f"k{p}")) == expected
+        assert uf.find(f"k{p}") in expected
+    for p, q in _random_pairs(n, 200, 8):
+        if p in seen and q in seen:
+            assert uf.connected(f"k{p}", f"k{q}") == (labels[p] == labels[q])
+
+
+def test_keyed_uf_unknown_keys():
+    uf = KeyedUF(["a", "b"])
+    assert uf.count == 2 and "a" in uf and "c" not in uf
+    assert uf.connected("c", "c")
+    assert not uf.connected("a", "c")
+    assert uf.add("a") == 0
+    uf.union("a", "a")
+    assert uf.count == 2
+    assert list(uf.members("b")) == ["b"]
+    with pytest.raises(KeyError):
+        uf.find("c")
+
+
+def test_rollback_uf_restores_snapshots():
+    n = 60
+    uf = RollbackUF(n)
+    states, snapshots = [], []
+    for step, (p, q) in enumerate(_random_pairs(n, 90, 9)):
+        if step % 10 == 0:
+            snapshots.append(uf.snapshot())
+            states.append((list(uf.id), list(uf.sz), uf.count))
+        uf.union(p, q)
+    for snapshot, (ids, sizes, count) in reversed(list(zip(snapshots, states))):
+        uf.rollback(snapshot)
+        assert (uf.id, uf.sz, uf.count) == (ids, sizes, count)
+    assert uf.count == n
+
+
+def test_rollback_uf_undoes_last_union_by_default():
+    uf = RollbackUF(3)
+    uf.union(0, 1)
+    uf.union(1, 0)  # no-op, still logged
+    uf.rollback()
+    assert uf.connected(0, 1)
+    uf.rollback()
+    assert not uf.connected(0, 1) and uf.count == 3
+
+
+def test_rollback_uf_rejects_bad_snapshot():
+    uf = RollbackUF(2)
+    uf.union(0, 1)
+    with pytest.raises(ValueError):
+        uf.rollback(5)
+    with pytest.raises(ValueError):
+        RollbackUF(2).rollback()
+
+
+def test_array_uf_reset():
+    uf = ArrayWeightedQuickUnionUF(10)
+    uf.union_many([(0, 1), (2, 3), (1, 3), (5, 6)])
+    assert uf.component_count() == uf.count == 6
+    uf.reset()
+    assert uf.component_count() == 10
+    assert list(uf.id) == list(range(10)) and list(uf.sz) == [1] * 10
+    assert dict(uf.component_sizes()) == {1: 10}
+    uf.union_many([(0, 9), (9, 8)])
+    assert not uf.connected(0, 1)
+    assert dict(uf.component_sizes()) == {1: 7, 3: 1}
+
+
+def test_array_uf_reset_of_touched_nodes():
+    uf = ArrayWeightedQuickUnionUF(10)
+    uf.union_many([(2, 3), (3, 4), (7, 8)])
+    uf.reset({2, 3, 4, 7, 8})
+    assert uf.count == 10
+    assert list(uf.id) == list(range(10)) and list(uf.sz) == [1] * 10
+    uf.union(2, 5)
+    assert dict(uf.component_sizes()) == {1: 8, 2: 1}